@@ -0,0 +1,75 @@
+"""
+Compares benchmark results (see ``benchmarks.suite``) with a baseline.
+
+Exits with code 1, if throughput of any case, present in both files, dropped by more
+than ``--threshold`` (10% by default).
+
+Usage::
+
+    python -m benchmarks.compare benchmarks/baseline.json results.json [--threshold 0.1]
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import argparse
+from typing import Any
+from pathlib import Path
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    threshold: float = 0.1,
+) -> dict[str, float]:
+    """
+    Returns relative throughput changes of the cases, present in both results,
+    that regressed by more than ``threshold``.
+
+    >>> compare({'a': {'throughput': 100}, 'b': {'throughput': 100}},
+    ...         {'a': {'throughput': 85}, 'b': {'throughput': 95}})
+    {'a': -0.15}
+    """
+    regressions = {}
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        change = result['throughput'] / baseline[name]['throughput'] - 1
+        if change < -threshold:
+            regressions[name] = round(change, 6)
+    return regressions
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('baseline', type=Path)
+    arg_parser.add_argument('current', type=Path)
+    arg_parser.add_argument('--threshold', type=float, default=0.1)
+    args = arg_parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))['results']
+    current = json.loads(args.current.read_text(encoding='utf-8'))['results']
+    regressions = compare(baseline, current, args.threshold)
+
+    print(f'{"case":<22} {"baseline/s":>11} {"current/s":>11} {"change":>8}')
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in baseline or name not in current:
+            print(
+                f'{name:<22} {"(only in " + ("baseline" if name in baseline else "current") + ")":>32}'
+            )
+            continue
+        before, after = baseline[name]['throughput'], current[name]['throughput']
+        mark = '  REGRESSION' if name in regressions else ''
+        print(f'{name:<22} {before:>11.1f} {after:>11.1f} {after / before - 1:>+8.1%}{mark}')
+
+    if regressions:
+        print(
+            f'{len(regressions)} case(s) regressed by more than {args.threshold:.0%}: '
+            f'{", ".join(regressions)}'
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
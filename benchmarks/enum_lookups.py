@@ -0,0 +1,140 @@
+"""
+Enum resolvers microbenchmark.
+
+Compares enum resolvers (``OrderStatus.get_by_css_class()``, ``SubcategoryType.get_by_url()``,
+``MessageType.get_by_message_text()``, etc.) with linear scans of enum members.
+Inputs are values, that parsers actually pass to the resolvers::
+
+    python -m benchmarks.enum_lookups [--number 100000]
+"""
+
+from __future__ import annotations
+
+import timeit
+import argparse
+from typing import Any, Callable
+from enum import Enum
+
+from funpayparsers.types.enums import (
+    Currency,
+    Language,
+    BadgeType,
+    MessageType,
+    OrderStatus,
+    RunnerDataType,
+    SubcategoryType,
+    TransactionStatus,
+)
+
+
+def _scan_equal(enum: type[Enum], value: Any, default: Any, attr: str | None = None) -> Any:
+    for i in enum:
+        if (getattr(i.value, attr) if attr else i.value) == value:
+            return i
+    return default
+
+
+def _scan_substring(enum: type[Enum], value: str, default: Any, attr: str | None = None) -> Any:
+    for i in enum:
+        if i is default:
+            continue
+        if (getattr(i.value, attr) if attr else i.value) in value:
+            return i
+    return default
+
+
+def _scan_fullmatch(value: str) -> MessageType:
+    for i in MessageType:
+        if i.value is not None and i.value.fullmatch(value):
+            return i
+    return MessageType.NON_SYSTEM
+
+
+# name -> (input, linear scan, resolver)
+CASES: dict[str, tuple[Any, Callable[[Any], Any], Callable[[Any], Any]]] = {
+    'runner_data_type': (
+        'chat_node',
+        lambda v: _scan_equal(RunnerDataType, v, None),
+        RunnerDataType.get_by_type_str,
+    ),
+    'currency': (
+        '€',
+        lambda v: _scan_equal(Currency, v, Currency.UNKNOWN),
+        Currency.get_by_character,
+    ),
+    'language_code': (
+        'uk',
+        lambda v: _scan_equal(Language, v, Language.UNKNOWN, 'appdata_alias'),
+        Language.get_by_lang_code,
+    ),
+    'order_status': (
+        'tc-status text-warning',
+        lambda v: _scan_substring(OrderStatus, v, OrderStatus.UNKNOWN),
+        OrderStatus.get_by_css_class,
+    ),
+    'transaction_status': (
+        'tc-item transaction-status-cancel',
+        lambda v: _scan_substring(TransactionStatus, v, TransactionStatus.UNKNOWN),
+        TransactionStatus.get_by_css_class,
+    ),
+    'badge_type': (
+        'chat-msg-author-label label label-warning',
+        lambda v: _scan_substring(BadgeType, v, BadgeType.UNKNOWN),
+        BadgeType.get_by_css_class,
+    ),
+    'badge_type_miss': (
+        'chat-msg-author-label label',
+        lambda v: _scan_substring(BadgeType, v, BadgeType.UNKNOWN),
+        BadgeType.get_by_css_class,
+    ),
+    'language_header': (
+        'menu-item-langs menu-icon-lang-uk',
+        lambda v: _scan_substring(Language, v, Language.UNKNOWN, 'header_menu_css_class'),
+        Language.get_by_header_menu_css_class,
+    ),
+    'subcategory_url': (
+        'https://funpay.com/en/chips/125/',
+        lambda v: _scan_substring(SubcategoryType, v, SubcategoryType.UNKNOWN, 'url_alias'),
+        SubcategoryType.get_by_url,
+    ),
+    'message_type': (
+        'The seller Seller has deleted a reply to their feedback to the order #ABCDEFGH.',
+        _scan_fullmatch,
+        MessageType.get_by_message_text,
+    ),
+    'message_type_miss': (
+        'Привет! Заказ оплатил, жду.',
+        _scan_fullmatch,
+        MessageType.get_by_message_text,
+    ),
+}
+
+
+def run(number: int = 100_000) -> dict[str, tuple[float, float]]:
+    """
+    Times every case.
+
+    :return: case name -> (linear scan ns / call, resolver ns / call).
+    """
+    results = {}
+    for name, (value, scan, resolver) in CASES.items():
+        assert scan(value) is resolver(value), name
+        results[name] = (
+            min(timeit.repeat(lambda: scan(value), number=number, repeat=3)) / number * 1e9,
+            min(timeit.repeat(lambda: resolver(value), number=number, repeat=3)) / number * 1e9,
+        )
+    return results
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--number', type=int, default=100_000, help='calls per round')
+    args = arg_parser.parse_args()
+
+    print(f'{"case":<20} {"scan ns":>9} {"lookup ns":>10} {"speedup":>8}')
+    for name, (scan_ns, lookup_ns) in run(args.number).items():
+        print(f'{name:<20} {scan_ns:>9.0f} {lookup_ns:>10.0f} {scan_ns / lookup_ns:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Memory footprint of parsed objects.
+
+Parses lists of messages, offer previews, order previews, transaction previews and reviews
+with raw sources disabled and reports the memory they retain, per top-level object
+(including nested objects, containers and strings of the object)::
+
+    python -m benchmarks.memory [--seed 0] [--count 5000]
+
+Allocations of selectolax trees are not traced, so only Python objects are accounted.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import argparse
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.suite import FIXTURES_DIR
+from benchmarks.synthetic import SyntheticPages
+from funpayparsers.parsers import (
+    ReviewsParser,
+    MessagesParser,
+    OfferPreviewsParser,
+    OrderPreviewsParser,
+    TransactionPreviewsParser,
+)
+from funpayparsers.parsers.base import RawSourceMode
+
+
+def _fixture(name: str, count: int) -> str:
+    """Repeats fixture items until there are at least ``count`` of them."""
+    source = (FIXTURES_DIR / name).read_text(encoding='utf-8')
+    return source * -(-count // source.count('class="tc-item'))
+
+
+# name -> (source generator, parser, list attribute of the result (if it is a batch))
+CASES: dict[str, tuple[Callable[[SyntheticPages, int], str], type[Any], str | None]] = {
+    'messages': (SyntheticPages.chat, MessagesParser, None),
+    'offer_previews': (SyntheticPages.showcase_page, OfferPreviewsParser, None),
+    'reviews': (SyntheticPages.reviews, ReviewsParser, 'reviews'),
+    'order_previews': (
+        lambda _, count: _fixture('order_previews.html', count),
+        OrderPreviewsParser,
+        'orders',
+    ),
+    'transaction_previews': (
+        lambda _, count: _fixture('transaction_previews.html', count),
+        TransactionPreviewsParser,
+        'transactions',
+    ),
+}
+
+
+def measure(
+    parser_cls: type[Any], source: str, items_attr: str | None = None
+) -> tuple[int, float, int]:
+    """
+    Parses a source and measures the memory, retained by the result.
+
+    :return: amount of objects, retained bytes per object,
+        shallow size of the first object (``sys.getsizeof()`` of the instance and its ``__dict__``).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = parser_cls(source, raw_source_mode=RawSourceMode.OFF).parse()
+        if items_attr is not None:
+            result = getattr(result, items_attr)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    first = result[0]
+    shallow = sys.getsizeof(first) + sys.getsizeof(getattr(first, '__dict__', None) or ())
+    if not hasattr(first, '__dict__'):
+        shallow -= sys.getsizeof(())
+    return len(result), retained / len(result), shallow
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--count', type=int, default=5_000, help='objects per case')
+    arg_parser.add_argument('--case', nargs='+', choices=list(CASES), default=list(CASES))
+    args = arg_parser.parse_args()
+
+    pages = SyntheticPages(args.seed)
+    print(f'{"case":<22} {"objects":>8} {"bytes/obj":>10} {"shallow":>8}')
+    for name in args.case:
+        generate, parser_cls, items_attr = CASES[name]
+        count, per_object, shallow = measure(parser_cls, generate(pages, args.count), items_attr)
+        print(f'{name:<22} {count:>8} {per_object:>10.0f} {shallow:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Serialization benchmark.
+
+Compares ``dataclasses.asdict()`` with ``FunPayObject.as_dict()`` and times
+``FunPayObject.from_dict()`` on objects, parsed from benchmark fixtures::
+
+    python -m benchmarks.serialization [--number 20] [--case runner_50_nodes chat_page]
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import timeit
+import argparse
+from typing import Any
+
+from benchmarks.suite import CASES as SUITE_CASES
+
+
+CASES = ('runner_50_nodes', 'chat_page', 'subcategory_page', 'messages', 'offer_previews')
+
+
+def parse(name: str) -> list[Any]:
+    """Parses a benchmark fixture and returns the parsed objects as a list."""
+    case = SUITE_CASES[name]
+    result = case.parser_cls(case.load(), options=case.options).parse()
+    return result if isinstance(result, list) else [result]
+
+
+def run(name: str, number: int = 20) -> dict[str, float]:
+    """
+    Times serialization of a case.
+
+    :return: ``asdict`` / ``as_dict`` / ``from_dict`` -> ms per round.
+    """
+    objects = parse(name)
+    dicts = [i.as_dict() for i in objects]
+    assert dicts == [dataclasses.asdict(i) for i in objects], name
+
+    def best(func: Any) -> float:
+        return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e3
+
+    return {
+        'asdict': best(lambda: [dataclasses.asdict(i) for i in objects]),
+        'as_dict': best(lambda: [i.as_dict() for i in objects]),
+        'from_dict': best(lambda: [i.from_dict(d) for i, d in zip(objects, dicts)]),
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--number', type=int, default=20, help='rounds per measurement')
+    arg_parser.add_argument('--case', nargs='+', choices=list(SUITE_CASES), default=list(CASES))
+    args = arg_parser.parse_args()
+
+    print(f'{"case":<18} {"asdict ms":>10} {"as_dict ms":>11} {"speedup":>8} {"from_dict ms":>13}')
+    for name in args.case:
+        result = run(name, args.number)
+        print(
+            f'{name:<18} {result["asdict"]:>10.3f} {result["as_dict"]:>11.3f} '
+            f'{result["asdict"] / result["as_dict"]:>7.1f}x {result["from_dict"]:>13.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
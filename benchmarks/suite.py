@@ -0,0 +1,191 @@
+"""
+Parsing benchmark suite.
+
+Runs page, list and runner response parsers on committed anonymized fixtures
+(``benchmarks/fixtures``) and reports throughput (parses per second), p50 / p99 latency
+and peak RSS for every case. Each case runs in a separate process, so memory
+of one case does not affect peak RSS of another.
+
+Usage::
+
+    python -m benchmarks.suite [--case offer_previews messages ...] [--min-time 1.0]
+                               [--save results.json] [--no-isolate]
+
+Results, saved with ``--save``, can be compared with a baseline (see ``benchmarks.compare``)::
+
+    python -m benchmarks.compare benchmarks/baseline.json results.json
+
+``benchmarks/baseline.json`` must be re-recorded (``--save benchmarks/baseline.json``)
+on the machine, where comparisons are made, numbers from different machines are not comparable.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+from typing import Any
+from dataclasses import field, dataclass
+from pathlib import Path
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+
+from funpayparsers.parsers import (
+    ReviewsParser,
+    UpdatesParser,
+    MessagesParser,
+    OfferPreviewsParser,
+    OrderPreviewsParser,
+    PrivateChatPreviewsParser,
+    TransactionPreviewsParser,
+)
+from funpayparsers.parsers.base import ParsingOptions, FunPayObjectParser
+from funpayparsers.parsers.page_parsers import (
+    ChatPageParser,
+    MainPageParser,
+    OrderPageParser,
+    ProfilePageParser,
+    SubcategoryPageParser,
+    TransactionsPageParser,
+)
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@dataclass(frozen=True)
+class Case:
+    """Benchmark case: a parser and a fixture it parses."""
+
+    parser_cls: type[FunPayObjectParser[Any, Any]]
+    fixture: str
+    options: ParsingOptions | None = field(default=None)
+
+    def load(self) -> str:
+        return (FIXTURES_DIR / self.fixture).read_text(encoding='utf-8')
+
+
+CASES: dict[str, Case] = {
+    'main_page': Case(MainPageParser, 'main_page.html'),
+    'profile_page': Case(ProfilePageParser, 'profile_page.html'),
+    'chat_page': Case(ChatPageParser, 'chat_page.html'),
+    'order_page': Case(OrderPageParser, 'order_page.html'),
+    'subcategory_page': Case(SubcategoryPageParser, 'subcategory_page.html'),
+    'transactions_page': Case(TransactionsPageParser, 'transactions_page.html'),
+    'offer_previews': Case(OfferPreviewsParser, 'offer_previews.html'),
+    'order_previews': Case(OrderPreviewsParser, 'order_previews.html'),
+    'transaction_previews': Case(TransactionPreviewsParser, 'transaction_previews.html'),
+    'reviews': Case(ReviewsParser, 'reviews.html'),
+    'chat_previews': Case(PrivateChatPreviewsParser, 'chat_previews.html'),
+    'messages': Case(MessagesParser, 'messages.html'),
+    'runner_1_nodes': Case(UpdatesParser, 'runner_1_nodes.json'),
+    'runner_10_nodes': Case(UpdatesParser, 'runner_10_nodes.json'),
+    'runner_50_nodes': Case(UpdatesParser, 'runner_50_nodes.json'),
+}
+
+
+def percentile(sorted_values: list[int], q: float) -> int:
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def peak_rss_mib() -> float | None:
+    """Peak resident set size of the current process, ``None`` if unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return max_rss / 2**20 if sys.platform == 'darwin' else max_rss / 2**10
+
+
+def run_case(name: str, min_time: float = 1.0, min_rounds: int = 20) -> dict[str, Any]:
+    """
+    Parses the fixture of the case repeatedly, for at least ``min_time`` seconds
+    and ``min_rounds`` rounds. Every round creates a new parser, so HTML tokenization
+    is included into the measurements.
+    """
+    case = CASES[name]
+    source = case.load()
+    case.parser_cls(source, options=case.options).parse()  # warm up
+
+    latencies: list[int] = []
+    deadline = time.perf_counter() + min_time
+    while len(latencies) < min_rounds or time.perf_counter() < deadline:
+        start = time.perf_counter_ns()
+        case.parser_cls(source, options=case.options).parse()
+        latencies.append(time.perf_counter_ns() - start)
+
+    latencies.sort()
+    return {
+        'rounds': len(latencies),
+        'throughput': len(latencies) / (sum(latencies) / 1e9),
+        'p50_ms': percentile(latencies, 0.50) / 1e6,
+        'p99_ms': percentile(latencies, 0.99) / 1e6,
+        'peak_rss_mib': peak_rss_mib(),
+        'fixture_kib': len(source.encode()) / 2**10,
+    }
+
+
+def run_isolated(name: str, min_time: float, min_rounds: int) -> dict[str, Any]:
+    """Runs a case in a fresh process."""
+    with ProcessPoolExecutor(1, mp_context=get_context('spawn')) as executor:
+        return executor.submit(run_case, name, min_time, min_rounds).result()
+
+
+def environment() -> dict[str, Any]:
+    return {
+        'python': f'{platform.python_implementation()} {platform.python_version()}',
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'selectolax': version('selectolax'),
+        'date': time.strftime('%Y-%m-%d'),
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--case', nargs='+', choices=list(CASES), default=list(CASES))
+    arg_parser.add_argument('--min-time', type=float, default=1.0)
+    arg_parser.add_argument('--min-rounds', type=int, default=20)
+    arg_parser.add_argument('--save', type=Path, help='save results as JSON')
+    arg_parser.add_argument(
+        '--no-isolate', action='store_true', help='run all cases in the current process'
+    )
+    args = arg_parser.parse_args()
+
+    env = environment()
+    print(f'{env["python"]}, selectolax {env["selectolax"]}, {env["cpu_count"]} CPUs')
+    print(
+        f'{"case":<22} {"KiB":>7} {"rounds":>7} {"parses/s":>10} '
+        f'{"p50 ms":>9} {"p99 ms":>9} {"RSS MiB":>8}'
+    )
+
+    results = {}
+    for name in args.case:
+        run = run_case if args.no_isolate else run_isolated
+        result = results[name] = run(name, args.min_time, args.min_rounds)
+        rss = '-' if result['peak_rss_mib'] is None else f'{result["peak_rss_mib"]:.1f}'
+        print(
+            f'{name:<22} {result["fixture_kib"]:>7.1f} {result["rounds"]:>7} '
+            f'{result["throughput"]:>10.1f} {result["p50_ms"]:>9.3f} {result["p99_ms"]:>9.3f} '
+            f'{rss:>8}'
+        )
+
+    if args.save:
+        args.save.write_text(
+            json.dumps({'environment': env, 'results': results}, indent=2) + '\n',
+            encoding='utf-8',
+        )
+        print(f'Results saved to {args.save}')
+
+
+if __name__ == '__main__':
+    main()
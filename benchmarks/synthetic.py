@@ -0,0 +1,406 @@
+"""
+Deterministic synthetic FunPay pages for scale benchmarks.
+
+Generates sources of any size, structurally compatible with real pages:
+showcases for ``SubcategoryPageParser``, chats for ``ChatParser``,
+review lists for ``ReviewsParser`` and runner responses for ``UpdatesParser``.
+The same call of a generator with the same seed always returns the same source.
+
+Running the module measures parsing time and peak traced memory at growing sizes::
+
+    python -m benchmarks.synthetic [--seed 0] [--scale 1.0] [--kind offers messages ...]
+                                   [--dump DIR]
+
+``--dump`` writes generated sources of the largest size to ``DIR`` instead of
+benchmarking them.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from typing import Any, Callable
+from html import escape
+from pathlib import Path
+
+from funpayparsers.parsers import ChatParser, ReviewsParser, UpdatesParser
+from funpayparsers.parsers.page_parsers import SubcategoryPageParser
+
+
+_WORDS = (
+    'аккаунт прокачка золото быстро недорого гарантия ключ предмет скин '
+    'рейд буст ранг сервер доставка онлайн редкий полный доступ'
+).split()
+
+_ME, _INTERLOCUTOR = 1234567, 7654321
+
+
+class SyntheticPages:
+    """
+    Seedable generator of synthetic FunPay sources.
+
+    Examples:
+        >>> pages = SyntheticPages(seed=1)
+        >>> pages.reviews(3) == SyntheticPages(seed=1).reviews(3)
+        True
+        >>> len(ReviewsParser(pages.reviews(3)).parse().reviews)
+        3
+    """
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        self._rnd = random.Random(seed)
+
+    def _reset(self, *params: Any) -> None:
+        # Every public method starts from its own state, so its output does not depend
+        # on previous calls.
+        self._rnd = random.Random(f'{self.seed}:{":".join(map(str, params))}')
+
+    def showcase_page(self, offers: int = 10_000) -> str:
+        """Subcategory page with a showcase of ``offers`` offers."""
+        self._reset('showcase_page', offers)
+        related = '\n'.join(
+            f'<a href="https://funpay.com/lots/{1400 + i}/" class="counter-item'
+            f'{" active" if i == 7 else ""}"><div class="counter-param">{self._words(1)}</div>'
+            f'<div class="counter-value">{self._rnd.randint(1, 9999)}</div></a>'
+            for i in range(12)
+        )
+        body = f"""<div class="container">
+  <div class="counter-list">
+{related}
+  </div>
+  <div class="showcase" data-section="lot-1407" data-game="140">
+    <div class="tc table-hover table-clickable showcase-table">
+{chr(10).join(self._offer(i) for i in range(offers))}
+    </div>
+  </div>
+</div>"""
+        return self._page(body, 'Аккаунты')
+
+    def chat(self, messages: int = 5_000) -> str:
+        """Chat block with ``messages`` messages."""
+        self._reset('chat', messages)
+        return f"""<div class="chat chat-float" data-id="98765432" data-name="users-{_ME}-{_INTERLOCUTOR}" data-user="{_ME}" data-tag="abcdefgh">
+  <div class="chat-header">
+    <div class="media media-user online">
+      <div class="media-left"><a href="https://funpay.com/users/{_INTERLOCUTOR}/"><img src="/img/layout/avatar.png" class="img-circle" alt=""></a></div>
+      <div class="media-body">
+        <div class="media-user-name"><a href="https://funpay.com/users/{_INTERLOCUTOR}/">User{_INTERLOCUTOR}</a></div>
+        <div class="media-user-status">онлайн</div>
+      </div>
+    </div>
+    <button class="btn btn-success btn-xs">Уведомления</button>
+  </div>
+  <div class="chat-message-list">
+{chr(10).join(self._messages(messages, 100_000_000))}
+  </div>
+  <div class="chat-form"><textarea class="form-control" name="content"></textarea></div>
+</div>"""
+
+    def reviews(self, count: int = 1_000) -> str:
+        """Reviews list with ``count`` reviews."""
+        self._reset('reviews', count)
+        return f"""<div class="dyn-table-body">
+{chr(10).join(self._review() for _ in range(count))}
+<form class="dyn-table-form">
+  <input type="hidden" name="user_id" value="{_ME}">
+  <input type="hidden" name="continue" value="=next{count}">
+  <input type="hidden" name="filter" value="">
+</form>
+</div>"""
+
+    def runner_response(self, nodes: int = 500, messages_per_node: int = 5) -> str:
+        """Runner response with ``nodes`` chat nodes of ``messages_per_node`` messages."""
+        self._reset('runner_response', nodes, messages_per_node)
+        objects: list[dict[str, Any]] = [
+            {
+                'type': 'orders_counters',
+                'id': str(_ME),
+                'tag': 'abcdefgh',
+                'data': {'buyer': 2, 'seller': 5},
+            },
+            {
+                'type': 'chat_counter',
+                'id': str(_ME),
+                'tag': 'bcdefghi',
+                'data': {'counter': 3, 'message': 200_000_000},
+            },
+        ]
+        for node in range(nodes):
+            first_id = 200_000_000 + node * 1000
+            objects.append(
+                {
+                    'type': 'chat_node',
+                    'id': f'users-{_ME}-{7_000_000 + node}',
+                    'tag': f'{node:08x}',
+                    'data': {
+                        'node': {
+                            'id': 90_000_000 + node,
+                            'name': f'users-{_ME}-{7_000_000 + node}',
+                            'silent': False,
+                        },
+                        'messages': [
+                            {'id': first_id + i, 'author': _INTERLOCUTOR, 'html': html}
+                            for i, html in enumerate(self._messages(messages_per_node, first_id))
+                        ],
+                        'hasHistory': True,
+                    },
+                }
+            )
+        return json.dumps({'objects': objects, 'response': False}, ensure_ascii=False)
+
+    def _words(self, amount: int) -> str:
+        return ' '.join(self._rnd.choice(_WORDS) for _ in range(amount)).capitalize()
+
+    def _offer(self, index: int) -> str:
+        rnd = self._rnd
+        user_id = rnd.randint(100_000, 9_999_999)
+        reviews = rnd.randint(0, 3000)
+        price = rnd.randint(10, 100_000) / 100
+        server = rnd.randint(1, 5)
+        online = ' data-online="1"' if rnd.random() < 0.5 else ''
+        auto = ' data-auto="1"' if rnd.random() < 0.3 else ''
+        if rnd.random() < 0.5:
+            rating = (
+                '<div class="rating-stars rating-5">' + '<i class="fas"></i>' * 5 + '</div>'
+                f'<span class="rating-mini-count">{reviews}</span>'
+            )
+        else:
+            rating = f'{reviews % 10} отзыва'
+        return f"""<a href="https://funpay.com/lots/offer?id={30_000_000 + index}" class="tc-item"{online}{auto} data-user="{user_id}" data-server="{server}" data-side="{server % 2}">
+  <div class="tc-server hidden-xxs">Сервер {server}</div>
+  <div class="tc-side hidden-xxs">{'Альянс' if server % 2 else 'Орда'}</div>
+  <div class="tc-desc">
+    <div class="tc-desc-text">{self._words(rnd.randint(4, 14))}</div>
+  </div>
+  <div class="tc-user">
+    <div class="media media-user {rnd.choice(('online', 'offline'))} style-circle">
+      <div class="media-left">
+        <div class="avatar-photo pseudo-a" tabindex="0" data-href="https://funpay.com/users/{user_id}/" style="background-image: url(/img/layout/avatar.png);"></div>
+      </div>
+      <div class="media-body">
+        <div class="media-user-name">
+          <span class="pseudo-a" tabindex="0" data-href="https://funpay.com/users/{user_id}/">User{user_id}</span>
+        </div>
+        <div class="media-user-reviews">{rating}</div>
+        <div class="media-user-info">на сайте {rnd.randint(1, 9)} лет</div>
+      </div>
+    </div>
+  </div>
+  <div class="tc-amount hidden-xxs">{rnd.randint(1, 999)}</div>
+  <div class="tc-price" data-s="{price:.6f}">
+    <div>{price:.2f} <span class="unit">₽</span></div>
+  </div>
+</a>"""
+
+    def _messages(self, amount: int, first_id: int) -> list[str]:
+        rnd = self._rnd
+        # a messages list always starts with a heading message
+        result = [self._heading_message(first_id, _INTERLOCUTOR, 'Здравствуйте')]
+        message_id = first_id
+        for _ in range(amount - 1):
+            message_id += rnd.randint(1, 30)
+            kind = rnd.random()
+            if kind < 0.08:
+                result.append(self._system_message(message_id))
+            elif kind < 0.35:
+                author = rnd.choice((_ME, _INTERLOCUTOR))
+                text = self._words(rnd.randint(1, 25))
+                result.append(self._heading_message(message_id, author, text))
+            elif kind < 0.4:
+                result.append(f"""<div class="chat-msg-item" id="message-{message_id}">
+  <div class="chat-message">
+    <div class="chat-msg-body">
+      <a href="https://sfunpay.com/s/chat/ab/cd/{message_id}.jpg" target="_blank" class="chat-img-link"><img src="https://sfunpay.com/s/chat/ab/cd/{message_id}_thumb.jpg" class="chat-img" alt=""></a>
+    </div>
+  </div>
+</div>""")
+            else:
+                result.append(f"""<div class="chat-msg-item" id="message-{message_id}">
+  <div class="chat-message">
+    <div class="chat-msg-body">
+      <div class="chat-msg-text">{self._words(rnd.randint(1, 25))}</div>
+    </div>
+  </div>
+</div>""")
+        return result[:amount]
+
+    @staticmethod
+    def _heading_message(message_id: int, author: int, text: str) -> str:
+        return f"""<div class="chat-msg-item chat-msg-with-head" id="message-{message_id}">
+  <div class="chat-message">
+    <div class="media-user-name">
+      <a href="https://funpay.com/users/{author}/" class="chat-msg-author-link">User{author}</a>
+      <div class="chat-msg-date" title="26 мая, 11:21:41">11:21:41</div>
+    </div>
+    <div class="chat-msg-body">
+      <div class="chat-msg-text">{text}</div>
+    </div>
+  </div>
+</div>"""
+
+    def _system_message(self, message_id: int) -> str:
+        order_id = ''.join(
+            self._rnd.choice('ABCDEFGHJKLMNPQRSTUVWXYZ0123456789') for _ in range(8)
+        )
+        return f"""<div class="chat-msg-item chat-msg-with-head" id="message-{message_id}">
+  <div class="chat-message">
+    <div class="media-user-name">
+      FunPay <span class="chat-msg-author-label label label-primary">оповещение</span>
+      <div class="chat-msg-date" title="4 мая, 10:41:16">04.05.2025</div>
+    </div>
+    <div class="chat-msg-body">
+      <div class="alert alert-with-icon alert-info" role="alert">
+        <i class="fas fa-info-circle alert-icon"></i>
+        <div class="chat-msg-text">Продавец <a href="https://funpay.com/users/{_ME}/">User{_ME}</a> вернул деньги покупателю <a href="https://funpay.com/users/{_INTERLOCUTOR}/">User{_INTERLOCUTOR}</a> по <a href="https://funpay.com/orders/{order_id}/">заказу #{order_id}</a>.</div>
+      </div>
+    </div>
+  </div>
+</div>"""
+
+    def _review(self) -> str:
+        rnd = self._rnd
+        rating = rnd.randint(1, 5)
+        reply = ''
+        if rnd.random() < 0.5:
+            reply = f"""
+    <div class="review-item-row">
+      <div class="h5 mb5">Ответ продавца</div>
+      <div class="review-item-answer review-compiled-reply">
+        <div>{self._words(rnd.randint(2, 10))}</div>
+      </div>
+    </div>"""
+        return f"""<div class="review-container">
+  <div class="review-item">
+    <div class="review-item-row">
+      <div class="review-compiled-review">
+        <div class="review-item-user">
+          <div class="review-item-photo"><img src="/img/layout/avatar.png" alt=""></div>
+          <div class="review-item-rating pull-right hidden-xs"><div class="rating"><div class="rating{rating}"></div></div></div>
+          <div class="review-item-date">{rnd.randint(1, 11)} месяца назад</div>
+          <div class="review-item-detail">{self._words(2)}, {rnd.randint(10, 9999)} ₽</div>
+        </div>
+        <div class="review-item-text"> {self._words(rnd.randint(1, 20))} </div>
+      </div>
+    </div>{reply}
+  </div>
+</div>"""
+
+    @staticmethod
+    def _page(body: str, title: str) -> str:
+        app_data = escape(
+            json.dumps(
+                {
+                    'locale': 'ru',
+                    'csrf-token': 'a1b2c3d4e5f6g7h8',
+                    'userId': _ME,
+                    'webpush': {'app': '7b2c', 'enabled': True, 'hwid-required': True},
+                }
+            ),
+            quote=True,
+        )
+        return f"""<!DOCTYPE html>
+<html lang="ru">
+<head>
+  <meta charset="utf-8">
+  <title>{title}</title>
+</head>
+<body data-app-data="{app_data}">
+<header>
+  <nav class="navbar navbar-default navbar-fixed-top" role="navigation">
+    <div class="container">
+      <div class="navbar-header"><a class="navbar-brand" href="https://funpay.com/"><span class="logo-color"></span></a></div>
+      <div class="collapse navbar-collapse" id="navbar">
+        <ul class="nav navbar-nav navbar-right logged">
+          <li class="dropdown"><a href="#" class="dropdown-toggle menu-item-langs" data-toggle="dropdown"><i class="menu-icon menu-icon-lang-ru"></i> Русский</a></li>
+          <li class="dropdown"><a href="#" class="dropdown-toggle menu-item-currencies" data-toggle="dropdown">Рубли <span class="caret"></span></a></li>
+          <li><a href="https://funpay.com/orders/" class="menu-item-orders">Покупки <span class="badge badge-orders">2</span></a></li>
+          <li><a href="https://funpay.com/orders/trade" class="menu-item-trade">Продажи <span class="badge badge-trade">5</span></a></li>
+          <li><a href="https://funpay.com/chat/" class="menu-item-chat">Сообщения <span class="badge badge-chat">3</span></a></li>
+          <li><a href="https://funpay.com/account/balance" class="menu-item-balance">Баланс <span class="badge badge-balance">12 345.67 ₽</span></a></li>
+          <li class="dropdown">
+            <a href="#" class="dropdown-toggle user-link" data-toggle="dropdown">
+              <div class="user-link-photo"><img src="https://sfunpay.com/s/avatar/00/00/{_ME}.jpg" alt=""></div>
+              <div class="user-link-name">User{_ME}</div>
+            </a>
+            <ul class="dropdown-menu"><li><a href="https://funpay.com/users/{_ME}/" class="user-link-dropdown">Профиль</a></li></ul>
+          </li>
+        </ul>
+      </div>
+    </div>
+  </nav>
+</header>
+<div class="wrapper">
+  <div class="content">
+{body}
+  </div>
+</div>
+</body>
+</html>
+"""
+
+
+KINDS: dict[str, tuple[Callable[[SyntheticPages, int], str], type[Any], tuple[int, ...]]] = {
+    'offers': (SyntheticPages.showcase_page, SubcategoryPageParser, (1_000, 2_500, 5_000, 10_000)),
+    'messages': (SyntheticPages.chat, ChatParser, (500, 1_250, 2_500, 5_000)),
+    'reviews': (SyntheticPages.reviews, ReviewsParser, (100, 250, 500, 1_000)),
+    'nodes': (SyntheticPages.runner_response, UpdatesParser, (50, 125, 250, 500)),
+}
+"""Benchmarked kinds: generator, parser and sizes."""
+
+
+def measure(parser_cls: type[Any], source: str) -> tuple[float, float]:
+    """
+    Parses a source, returns parsing time (s) and peak traced memory (MiB).
+    Memory is measured in a separate run, since tracing slows parsing down.
+    """
+    start = time.perf_counter()
+    parser_cls(source).parse()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        parser_cls(source).parse()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--scale', type=float, default=1.0, help='multiplier of sizes')
+    arg_parser.add_argument('--kind', nargs='+', choices=list(KINDS), default=list(KINDS))
+    arg_parser.add_argument('--dump', type=Path, help='write sources instead of benchmarking')
+    args = arg_parser.parse_args()
+
+    pages = SyntheticPages(args.seed)
+    if args.dump:
+        args.dump.mkdir(parents=True, exist_ok=True)
+        for kind in args.kind:
+            generate, _, sizes = KINDS[kind]
+            size = max(1, int(sizes[-1] * args.scale))
+            path = args.dump / f'{kind}_{size}.{"json" if kind == "nodes" else "html"}'
+            path.write_text(generate(pages, size), encoding='utf-8')
+            print(f'{path}')
+        return
+
+    print(f'{"kind":<10} {"size":>7} {"KiB":>9} {"time ms":>10} {"us/item":>9} {"peak MiB":>9}')
+    for kind in args.kind:
+        generate, parser_cls, sizes = KINDS[kind]
+        for size in sizes:
+            size = max(1, int(size * args.scale))
+            source = generate(pages, size)
+            elapsed, peak = measure(parser_cls, source)
+            print(
+                f'{kind:<10} {size:>7} {len(source.encode()) / 2**10:>9.1f} '
+                f'{elapsed * 1e3:>10.1f} {elapsed * 1e6 / size:>9.1f} {peak:>9.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Thread pool parsing benchmark.
+
+Compares sequential parsing with ``funpayparsers.parallel.parse_concurrently``
+on synthetic offer list pages.
+
+Usage::
+
+    python -m benchmarks.threads [--pages 64] [--offers 300] [--threads 1 2 4 8]
+
+Run it with a regular CPython build and with a free-threaded one (e.g. ``python3.13t``)
+to compare. On regular builds only HTML tokenization runs in parallel (lexbor releases
+the GIL while parsing a document), so the ``tokenize`` row shows the upper bound.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import argparse
+import platform
+from concurrent.futures import ThreadPoolExecutor
+
+from selectolax.lexbor import LexborHTMLParser
+
+from funpayparsers.parallel import parse_concurrently
+from funpayparsers.parsers.offer_previews_parser import (
+    OfferPreviewsParser,
+    OfferPreviewsParsingOptions,
+)
+
+
+OFFER_HTML = """<a href="https://funpay.com/lots/offer?id={id}" class="tc-item" data-online="1" data-auto="1" data-server="{server}">
+  <div class="tc-server hidden-xxs">Server {server}</div>
+  <div class="tc-desc">
+    <div class="tc-desc-text">Offer #{id} description, some long text to make offers look real</div>
+  </div>
+  <div class="tc-user">
+    <div class="media media-user online style-circle">
+      <div class="media-left">
+        <div class="avatar-photo pseudo-a" tabindex="0" data-href="https://funpay.com/users/{user}/" style="background-image: url(/img/layout/avatar.png);"></div>
+      </div>
+      <div class="media-body">
+        <div class="media-user-name">
+          <span class="pseudo-a" tabindex="0" data-href="https://funpay.com/users/{user}/">User{user}</span>
+        </div>
+        <div class="media-user-reviews">
+          <div class="rating-stars rating-5"><i class="fas"></i><i class="fas"></i><i class="fas"></i><i class="fas"></i><i class="fas"></i></div>
+          <span class="rating-mini-count">{reviews}</span>
+        </div>
+        <div class="media-user-info">на сайте 2 года</div>
+      </div>
+    </div>
+  </div>
+  <div class="tc-amount hidden-xxs">{amount}</div>
+  <div class="tc-price" data-s="{price}">
+    <div>{price} <span class="unit">₽</span></div>
+  </div>
+</a>
+"""
+
+
+def make_page(offers: int, seed: int) -> str:
+    items = (
+        OFFER_HTML.format(
+            id=seed * 100_000 + i,
+            server=i % 7,
+            user=1000 + (seed + i) % 97,
+            reviews=i % 500,
+            amount=i % 50 + 1,
+            price=f'{(seed + i) % 1000 + 0.5:.2f}',
+        )
+        for i in range(offers)
+    )
+    return '<html><body><div class="tc">' + ''.join(items) + '</div></body></html>'
+
+
+def measure(fn, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--pages', type=int, default=64)
+    arg_parser.add_argument('--offers', type=int, default=300)
+    arg_parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = arg_parser.parse_args()
+
+    pages = [make_page(args.offers, i) for i in range(args.pages)]
+    options = OfferPreviewsParsingOptions(empty_raw_source=True)
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+    print(
+        f'{platform.python_implementation()} {platform.python_version()} '
+        f'(GIL {"enabled" if gil else "disabled"}), {os.cpu_count()} CPUs, '
+        f'{args.pages} pages x {args.offers} offers '
+        f'({sum(map(len, pages)) / 2**20:.1f} MiB)'
+    )
+
+    def sequential_parse() -> None:
+        for page in pages:
+            OfferPreviewsParser(page, options=options).parse()
+
+    def sequential_tokenize() -> None:
+        for page in pages:
+            LexborHTMLParser(page)
+
+    base_parse = measure(sequential_parse)
+    base_tokenize = measure(sequential_tokenize)
+
+    print(f'{"":>10} {"threads":>8} {"seconds":>9} {"speedup":>8}')
+    print(f'{"parse":>10} {"-":>8} {base_parse:>9.3f} {1:>8.2f}')
+    for threads in args.threads:
+        elapsed = measure(
+            lambda: list(
+                parse_concurrently(OfferPreviewsParser, pages, options, max_workers=threads)
+            )
+        )
+        print(f'{"parse":>10} {threads:>8} {elapsed:>9.3f} {base_parse / elapsed:>8.2f}')
+
+    print(f'{"tokenize":>10} {"-":>8} {base_tokenize:>9.3f} {1:>8.2f}')
+    for threads in args.threads:
+        with ThreadPoolExecutor(threads) as executor:
+            elapsed = measure(lambda: list(executor.map(LexborHTMLParser, pages)))
+        print(f'{"tokenize":>10} {threads:>8} {elapsed:>9.3f} {base_tokenize / elapsed:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
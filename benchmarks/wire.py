@@ -0,0 +1,84 @@
+"""
+Wire format benchmark.
+
+Compares sizes and encoding / decoding times of ``funpayparsers.types.wire`` with JSON
+of ``FunPayObject.as_dict()`` (decoded back with ``FunPayObject.from_dict()``)::
+
+    python -m benchmarks.wire [--number 10] [--case runner_50_nodes chat_page]
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import argparse
+from typing import Any, Callable
+from enum import Enum
+
+from benchmarks.suite import CASES as SUITE_CASES
+from funpayparsers.types import wire
+from funpayparsers.types.base import FunPayObject
+
+
+CASES = ('runner_50_nodes', 'chat_page', 'subcategory_page')
+
+
+def _json_default(value: Any) -> Any:
+    return value.name if isinstance(value, Enum) else str(value)
+
+
+# format -> (encoder, decoder (encoded data, class of the object) -> object)
+FORMATS: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes, type[Any]], Any]]] = {
+    'json': (
+        lambda obj: json.dumps(obj.as_dict(), default=_json_default, ensure_ascii=False).encode(),
+        lambda data, cls: cls.from_dict(json.loads(data)),
+    ),
+    'wire': (wire.dumps, lambda data, _: wire.loads(data)),
+    'wire+raw_source': (
+        lambda obj: wire.dumps(obj, raw_source=True),
+        lambda data, _: wire.loads(data),
+    ),
+}
+
+
+def parse(name: str) -> FunPayObject:
+    """Parses a benchmark fixture."""
+    case = SUITE_CASES[name]
+    return case.parser_cls(case.load(), options=case.options).parse()  # type: ignore[no-any-return]
+
+
+def run(name: str, number: int = 10) -> dict[str, tuple[int, float, float]]:
+    """
+    Encodes and decodes an object, parsed from a benchmark fixture, with every format.
+
+    :return: format -> (size in bytes, encoding ms, decoding ms).
+    """
+    obj = parse(name)
+    results = {}
+    for fmt, (encode, decode) in FORMATS.items():
+        data = encode(obj)
+        assert decode(data, type(obj)) == obj, (name, fmt)
+        results[fmt] = (
+            len(data),
+            min(timeit.repeat(lambda: encode(obj), number=number, repeat=3)) / number * 1e3,
+            min(timeit.repeat(lambda: decode(data, type(obj)), number=number, repeat=3))
+            / number
+            * 1e3,
+        )
+    return results
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--number', type=int, default=10, help='rounds per measurement')
+    arg_parser.add_argument('--case', nargs='+', choices=list(SUITE_CASES), default=list(CASES))
+    args = arg_parser.parse_args()
+
+    print(f'{"case":<18} {"format":<16} {"bytes":>9} {"dumps ms":>9} {"loads ms":>9}')
+    for name in args.case:
+        for fmt, (size, dumps_ms, loads_ms) in run(name, args.number).items():
+            print(f'{name:<18} {fmt:<16} {size:>9} {dumps_ms:>9.3f} {loads_ms:>9.3f}')
+
+
+if __name__ == '__main__':
+    main()
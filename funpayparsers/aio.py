@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+
+__all__ = ('Offloader', 'get_default_offloader', 'set_default_offloader')
+
+import asyncio
+import functools
+import contextvars
+from typing import Any, TypeVar, Callable
+from weakref import WeakKeyDictionary
+from concurrent.futures import Executor
+
+
+T = TypeVar('T')
+
+
+class Offloader:
+    """
+    Runs blocking parsing calls in an executor, so they don't block the event loop.
+
+    The amount of calls, running at the same time, can be limited with ``max_concurrency``.
+    A call holds its slot until it actually finishes, even if the awaiting task is cancelled,
+    since a running executor job cannot be interrupted.
+
+    Calls run in a copy of the caller's context, so context variables
+    (e.g., an installed parsing hook) are visible in the executor.
+
+    Examples:
+        >>> import asyncio
+        >>> offloader = Offloader(max_concurrency=2)
+        >>> asyncio.run(offloader.run(sum, [1, 2, 3]))
+        6
+    """
+
+    def __init__(self, executor: Executor | None = None, max_concurrency: int | None = None):
+        """
+        :param executor: executor to run calls in.
+            Defaults to ``None`` (event loop default executor).
+        :param max_concurrency: max amount of calls, running at the same time.
+            Defaults to ``None`` (no limit, except the executor's one).
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError('max_concurrency must be greater than 0.')
+
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            WeakKeyDictionary()
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Runs ``fn(*args)`` in the executor and returns its result."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, fn, *args)
+        if self.max_concurrency is None:
+            return await loop.run_in_executor(self.executor, call)
+
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+
+        await semaphore.acquire()
+        try:
+            future = loop.run_in_executor(self.executor, call)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        future.add_done_callback(lambda _: semaphore.release())
+        # Cancelling the awaiting task must not release the slot before the job is done.
+        return await asyncio.shield(future)
+
+
+_default_offloader = Offloader()
+
+
+def get_default_offloader() -> Offloader:
+    """
+    Returns the offloader, used by ``aparse()`` / ``aiter_parse()``
+    if no offloader is passed explicitly.
+    """
+    return _default_offloader
+
+
+def set_default_offloader(offloader: Offloader) -> None:
+    """Sets the offloader, used by ``aparse()`` / ``aiter_parse()`` by default."""
+    global _default_offloader
+    _default_offloader = offloader
@@ -3,16 +3,31 @@ from __future__ import annotations
 
 __all__ = ('ParsingError',)
 
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from funpayparsers.raw_source import RawSourceHandle
+
 
 class ParsingError(Exception):
-    def __init__(self, raw_source: str):
+    def __init__(self, raw_source: str | RawSourceHandle):
+        """
+        :param raw_source: raw source of an object, that failed to parse.
+            May be a raw source handle (e.g., ``RawSourceSpan``), which is not materialized
+            entirely for ``formatted_source()``.
+        """
         self.raw_source = raw_source
 
     def formatted_source(self) -> str:
         if len(self.raw_source) <= 500:
-            return self.raw_source
+            return str(self.raw_source)
 
         return self.raw_source[:250] + '\n...\n' + self.raw_source[-250:]
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Raw source handles are pickled as regular strings.
+        return self.__class__, (self.raw_source,)
+
     def __str__(self) -> str:
         return f'An error occurred while parsing\n{self.formatted_source()}'
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+
+__all__ = (
+    'ParsingHook',
+    'TimingCollector',
+    'TimingNode',
+    'SelectorStats',
+    'get_hook',
+    'use_hook',
+)
+
+import time
+from typing import TYPE_CHECKING, Any
+from dataclasses import field, dataclass
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Iterator
+
+from selectolax.lexbor import LexborNode
+
+
+if TYPE_CHECKING:
+    from funpayparsers.parsers.base import FunPayObjectParser
+
+
+class ParsingHook:
+    """
+    Base class for parsing instrumentation hooks.
+
+    A hook is installed with ``use_hook()`` and is called by every parser, running
+    in the same context (thread / asyncio task), including nested parsers.
+    All methods do nothing by default, subclasses override the ones they need.
+
+    Hooks are called synchronously while parsing, so they should be cheap.
+    """
+
+    trace_selectors: bool = False
+    """
+    Whether to call ``selector_called()``.
+
+    Selector tracing wraps HTML trees of parsers into proxies, so it slows parsing down
+    noticeably and should not be enabled, unless selectors stats are needed.
+    """
+
+    def parse_started(self, parser: FunPayObjectParser[Any, Any]) -> None:
+        """Called before ``parser.parse()`` starts parsing."""
+
+    def parse_finished(
+        self,
+        parser: FunPayObjectParser[Any, Any],
+        elapsed_ns: int,
+        error: BaseException | None,
+    ) -> None:
+        """
+        Called after ``parser.parse()`` finished parsing.
+
+        :param parser: parser instance.
+        :param elapsed_ns: parsing time (including nested parsers), in nanoseconds.
+        :param error: raised exception, if parsing failed.
+        """
+
+    def selector_called(
+        self,
+        parser: FunPayObjectParser[Any, Any],
+        selector: str,
+        matched: int,
+        elapsed_ns: int,
+    ) -> None:
+        """
+        Called after ``css()`` / ``css_first()`` call on a node of ``parser``'s tree
+        (only if ``trace_selectors`` is ``True``).
+
+        :param parser: parser instance.
+        :param selector: CSS selector.
+        :param matched: amount of matched nodes (``0`` or ``1`` for ``css_first()``).
+        :param elapsed_ns: selector call time, in nanoseconds.
+        """
+
+    def raw_source_captured(self, parser: FunPayObjectParser[Any, Any], size: int) -> None:
+        """
+        Called after a raw source of an object was serialized while parsing
+        (see ``FunPayObjectParser.capture_raw_source()``).
+
+        Raw sources, that are serialized lazily (``RawSourceMode.LAZY``), are not reported.
+
+        :param parser: parser instance.
+        :param size: length of the serialized raw source (characters).
+        """
+
+
+_hook: ContextVar[ParsingHook | None] = ContextVar('funpayparsers_hook', default=None)
+
+
+def get_hook() -> ParsingHook | None:
+    """Returns the hook, installed in the current context, if any."""
+    return _hook.get()
+
+
+@contextmanager
+def use_hook(hook: ParsingHook | None) -> Iterator[ParsingHook | None]:
+    """
+    Installs a parsing hook in the current context (thread / asyncio task)
+    until the ``with`` block exits.
+
+    Parsing, offloaded with ``funpayparsers.aio.Offloader``, inherits the hook.
+    ``None`` disables an outer hook.
+
+    Examples:
+        >>> from funpayparsers.parsers import MoneyValueParser
+        >>> with use_hook(TimingCollector()) as collector:
+        ...     _ = MoneyValueParser('10 ₽').parse()
+        >>> collector.trees[0].parser
+        'MoneyValueParser'
+    """
+    token = _hook.set(hook)
+    try:
+        yield hook
+    finally:
+        _hook.reset(token)
+
+
+@dataclass
+class SelectorStats:
+    """Stats of a CSS selector, called by a parser."""
+
+    calls: int = 0
+    """Amount of calls."""
+
+    matched: int = 0
+    """Total amount of matched nodes."""
+
+    elapsed_ns: int = 0
+    """Total time of calls, in nanoseconds."""
+
+
+@dataclass(eq=False)
+class TimingNode:
+    """Timing of a parser call with timings of nested parser calls."""
+
+    parser: str
+    """Parser class name."""
+
+    calls: int = 1
+    """Amount of merged calls (see ``merged()``)."""
+
+    elapsed_ns: int = 0
+    """Parsing time (including nested parsers), in nanoseconds."""
+
+    failed: int = 0
+    """Amount of failed calls."""
+
+    raw_source_chars: int = 0
+    """Length of raw sources, serialized while parsing (characters)."""
+
+    selectors: dict[str, SelectorStats] = field(default_factory=dict)
+    """Stats of CSS selectors, called by the parser (if selectors are traced)."""
+
+    children: list[TimingNode] = field(default_factory=list)
+    """Nested parser calls, in order of calls."""
+
+    @property
+    def self_ns(self) -> int:
+        """Parsing time, excluding nested parsers, in nanoseconds."""
+        return self.elapsed_ns - sum(i.elapsed_ns for i in self.children)
+
+    def merged(self) -> TimingNode:
+        """
+        Returns a copy of the tree, in which sibling calls of the same parser
+        (e.g., parsers of list items) are merged into a single node.
+        """
+        merged: dict[str, TimingNode] = {}
+        for child in self.children:
+            target = merged.get(child.parser)
+            if target is None:
+                merged[child.parser] = TimingNode(child.parser, calls=0)
+                target = merged[child.parser]
+            target.calls += child.calls
+            target.elapsed_ns += child.elapsed_ns
+            target.failed += child.failed
+            target.raw_source_chars += child.raw_source_chars
+            _merge_selectors(target.selectors, child.selectors)
+            target.children.extend(child.children)
+
+        return TimingNode(
+            self.parser,
+            calls=self.calls,
+            elapsed_ns=self.elapsed_ns,
+            failed=self.failed,
+            raw_source_chars=self.raw_source_chars,
+            selectors=dict(self.selectors),
+            children=[i.merged() for i in merged.values()],
+        )
+
+    def format(self, merge: bool = True) -> str:
+        """
+        Formats the tree as indented text.
+
+        :param merge: whether to merge sibling calls of the same parser (see ``merged()``).
+        """
+        lines: list[str] = []
+        self._format((self.merged() if merge else self), 0, lines)
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _format(node: TimingNode, depth: int, lines: list[str]) -> None:
+        indent = '  ' * depth
+        calls = f' x{node.calls}' if node.calls > 1 else ''
+        failed = f', {node.failed} failed' if node.failed else ''
+        raw_source = f', raw source {node.raw_source_chars} chars' if node.raw_source_chars else ''
+        lines.append(
+            f'{indent}{node.parser}{calls}: {node.elapsed_ns / 1e6:.3f} ms '
+            f'(self {node.self_ns / 1e6:.3f} ms{raw_source}{failed})'
+        )
+        for selector, stats in sorted(node.selectors.items(), key=lambda i: -i[1].elapsed_ns):
+            lines.append(
+                f'{indent}  > {selector!r}: {stats.calls} calls, {stats.matched} matched, '
+                f'{stats.elapsed_ns / 1e6:.3f} ms'
+            )
+        for child in node.children:
+            TimingNode._format(child, depth + 1, lines)
+
+
+def _merge_selectors(target: dict[str, SelectorStats], source: dict[str, SelectorStats]) -> None:
+    for selector, stats in source.items():
+        target_stats = target.setdefault(selector, SelectorStats())
+        target_stats.calls += stats.calls
+        target_stats.matched += stats.matched
+        target_stats.elapsed_ns += stats.elapsed_ns
+
+
+class TimingCollector(ParsingHook):
+    """
+    Hook, that builds a timing tree (see ``TimingNode``) for every top-level parse.
+
+    Trees of parses, running in different threads / asyncio tasks, are collected
+    independently.
+
+    Examples:
+        >>> from funpayparsers.parsers import MoneyValueParser
+        >>> collector = TimingCollector(trace_selectors=True)
+        >>> with use_hook(collector):
+        ...     _ = MoneyValueParser('10 ₽').parse()
+        >>> tree = collector.trees[0]
+        >>> tree.elapsed_ns > 0, tree.children
+        (True, [])
+    """
+
+    def __init__(self, trace_selectors: bool = False):
+        """
+        :param trace_selectors: whether to collect CSS selectors stats.
+        """
+        self.trace_selectors = trace_selectors
+        self.trees: list[TimingNode] = []
+        """Timing trees of top-level parses, in order of parsing start."""
+
+        self._stack: ContextVar[tuple[TimingNode, ...]] = ContextVar(
+            f'timing_collector_stack_{id(self)}', default=()
+        )
+
+    def parse_started(self, parser: FunPayObjectParser[Any, Any]) -> None:
+        stack = self._stack.get()
+        node = TimingNode(type(parser).__name__)
+        if stack:
+            stack[-1].children.append(node)
+        else:
+            self.trees.append(node)
+        self._stack.set((*stack, node))
+
+    def parse_finished(
+        self,
+        parser: FunPayObjectParser[Any, Any],
+        elapsed_ns: int,
+        error: BaseException | None,
+    ) -> None:
+        stack = self._stack.get()
+        node = stack[-1]
+        node.elapsed_ns = elapsed_ns
+        if error is not None:
+            node.failed = 1
+        self._stack.set(stack[:-1])
+
+    def selector_called(
+        self,
+        parser: FunPayObjectParser[Any, Any],
+        selector: str,
+        matched: int,
+        elapsed_ns: int,
+    ) -> None:
+        stack = self._stack.get()
+        if not stack:  # selector call outside of parse(), e.g., in iter_parse()
+            return
+        stats = stack[-1].selectors.setdefault(selector, SelectorStats())
+        stats.calls += 1
+        stats.matched += matched
+        stats.elapsed_ns += elapsed_ns
+
+    def raw_source_captured(self, parser: FunPayObjectParser[Any, Any], size: int) -> None:
+        stack = self._stack.get()
+        if stack:
+            stack[-1].raw_source_chars += size
+
+    def clear(self) -> None:
+        """Removes all collected trees."""
+        self.trees.clear()
+
+
+class _TracedNode:
+    """
+    Proxy of a ``LexborNode`` / ``LexborHTMLParser``, that reports ``css()`` and
+    ``css_first()`` calls to a hook. Nodes, returned by the proxy, are proxied as well.
+    """
+
+    __slots__ = ('node', '_parser', '_hook')
+
+    def __init__(self, node: Any, parser: FunPayObjectParser[Any, Any], hook: ParsingHook):
+        self.node = node
+        self._parser = parser
+        self._hook = hook
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, LexborNode):
+            return _TracedNode(value, self._parser, self._hook)
+        return value
+
+    def css(self, query: str) -> list[Any]:
+        start = time.perf_counter_ns()
+        result = self.node.css(query)
+        self._hook.selector_called(
+            self._parser, query, len(result), time.perf_counter_ns() - start
+        )
+        return [_TracedNode(i, self._parser, self._hook) for i in result]
+
+    def css_first(self, query: str, default: Any = None, strict: bool = False) -> Any:
+        start = time.perf_counter_ns()
+        result = self.node.css_first(query, default, strict)
+        matched = int(isinstance(result, LexborNode))
+        self._hook.selector_called(self._parser, query, matched, time.perf_counter_ns() - start)
+        return self._wrap(result)
+
+    def iter(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        return (self._wrap(i) for i in self.node.iter(*args, **kwargs))
+
+    def traverse(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        return (self._wrap(i) for i in self.node.traverse(*args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        return self._wrap(getattr(self.node, name))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _TracedNode):
+            other = other.node
+        return bool(self.node == other)
+
+    def __hash__(self) -> int:
+        return hash(self.node)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return repr(self.node)
+
+
+def _unwrap_node(source: Any) -> Any:
+    """Returns a node, proxied for selector tracing, or ``source`` as is."""
+    return source.node if isinstance(source, _TracedNode) else source
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+
+__all__ = (
+    'InternPool',
+    'get_intern_pool',
+    'set_intern_pool',
+    'reset_intern_pool',
+    'use_intern_pool',
+    'intern_string',
+)
+
+from typing import overload
+from contextlib import contextmanager
+from contextvars import Token, ContextVar
+from collections.abc import Iterator
+
+
+class InternPool:
+    """
+    Pool of interned strings.
+
+    Parsers intern low-cardinality string fields (usernames, avatar URLs, category names,
+    badge CSS classes, currency characters, etc.) in the pool of the current parse,
+    so equal values of different objects are the same ``str`` object: repeated values
+    are stored once and compared by identity first.
+
+    By default, every parse gets its own pool. A long-lived pool can be shared by many
+    parses (e.g., by all parses of a messages cache) with ``use_intern_pool()``
+    or ``ParsingOptions.intern_pool``.
+
+    Unlike ``sys.intern()``, pooled strings are released with the pool.
+
+    Examples:
+        >>> pool = InternPool()
+        >>> a = pool.intern(''.join(['Fun', 'Pay']))
+        >>> b = pool.intern(''.join(['Fun', 'Pay']))
+        >>> a is b, len(pool)
+        (True, 1)
+    """
+
+    __slots__ = ('_strings',)
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+
+    def intern(self, value: str, /) -> str:
+        """Returns the pooled string, equal to ``value`` (adds ``value`` if there is none)."""
+        return self._strings.setdefault(value, value)
+
+    def clear(self) -> None:
+        """Removes all strings from the pool."""
+        self._strings.clear()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._strings
+
+
+_intern_pool: ContextVar[InternPool | None] = ContextVar('funpayparsers_intern_pool', default=None)
+
+
+def get_intern_pool() -> InternPool | None:
+    """Returns the intern pool of the current context, if any."""
+    return _intern_pool.get()
+
+
+def set_intern_pool(pool: InternPool | None) -> Token[InternPool | None]:
+    """
+    Sets the intern pool of the current context.
+
+    Low-level counterpart of ``use_intern_pool()`` for code, that can't use
+    a ``with`` block. The returned token must be passed to ``reset_intern_pool()``.
+    """
+    return _intern_pool.set(pool)
+
+
+def reset_intern_pool(token: Token[InternPool | None]) -> None:
+    """Restores the intern pool, that was set before ``set_intern_pool()`` call."""
+    _intern_pool.reset(token)
+
+
+@contextmanager
+def use_intern_pool(pool: InternPool | None) -> Iterator[InternPool | None]:
+    """
+    Sets the intern pool of the current context (thread / asyncio task)
+    until the ``with`` block exits.
+
+    All parses in the ``with`` block intern strings in ``pool`` instead of their
+    own per-parse pools, unless ``ParsingOptions.intern_pool`` of the outermost parser
+    is set. Parsing, offloaded with ``funpayparsers.aio.Offloader``, inherits the pool.
+    ``None`` restores per-parse pools.
+
+    Examples:
+        >>> from funpayparsers.parsers import MoneyValueParser
+        >>> with use_intern_pool(InternPool()) as pool:
+        ...     a = MoneyValueParser('10 ₽').parse()
+        ...     b = MoneyValueParser('20 ₽').parse()
+        >>> a.character is b.character, '₽' in pool
+        (True, True)
+    """
+    token = set_intern_pool(pool)
+    try:
+        yield pool
+    finally:
+        reset_intern_pool(token)
+
+
+@overload
+def intern_string(value: str, /) -> str: ...
+
+
+@overload
+def intern_string(value: None, /) -> None: ...
+
+
+def intern_string(value: str | None, /) -> str | None:
+    """
+    Interns ``value`` in the intern pool of the current context.
+
+    Returns ``value`` as is, if there is no pool (e.g., outside of parsing) or ``value``
+    is ``None``.
+    """
+    pool = _intern_pool.get()
+    if pool is None or value is None:
+        return value
+    return pool.intern(value)
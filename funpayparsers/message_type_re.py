@@ -18,6 +18,7 @@ __all__ = (
     'FEEDBACK_REPLY_DELETED',
     'ORDER_ID',
     'USERNAME',
+    'TYPE_PREFIX',
 )
 
 
@@ -183,3 +184,29 @@ USERNAME = re.compile(_urs)
 """
 Username compiled RE.
 """
+
+
+TYPE_PREFIX = re.compile(
+    r'(?:Покупатель|The buyer) %(urs)s (?:has )?(?:'
+    r'(?P<NEW_ORDER>оплатил |paid )|'
+    r'(?P<ORDER_CLOSED>подтвердил |confirmed )|'
+    r'(?P<NEW_FEEDBACK>написал |given )|'
+    r'(?P<FEEDBACK_CHANGED>изменил |edited )|'
+    r'(?P<FEEDBACK_DELETED>удалил |deleted ))|'
+    r'(?:Администратор|The administrator) %(urs)s (?:has )?'
+    r'(?P<ORDER_CLOSED_BY_ADMIN>подтвердил |confirmed )|'
+    r'(?:Продавец|The seller) %(urs)s (?:has )?(?:'
+    r'(?P<ORDER_REFUNDED>вернул |refunded )|'
+    r'(?P<NEW_FEEDBACK_REPLY>ответил |replied )|'
+    r'(?P<FEEDBACK_REPLY_CHANGED>изменил |edited )|'
+    r'(?P<FEEDBACK_REPLY_DELETED>удалил |deleted ))|'
+    r'(?P<ORDER_REOPENED>Заказ #|Order #)|'
+    r'(?P<ORDER_PARTIALLY_REFUNDED>Часть средств |A part of the funds )' % _f_dict
+)
+"""
+Message type prefix compiled RE.
+
+Matches the beginning of a system message (actor, username and verb), that identifies
+the only possible message type: the name of the matched group is the name of
+a ``funpayparsers.types.enums.MessageType`` member, which RE must fully match the message.
+"""
@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+
+__all__ = ('ParsingPool', 'parse_parallel', 'parse_concurrently', 'pack', 'unpack')
+
+import os
+import traceback
+from typing import Any, Type, TypeVar, Callable
+from dataclasses import fields, replace
+from functools import partial
+from itertools import islice
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+from typing_extensions import Self
+
+from funpayparsers.interning import InternPool, get_intern_pool, use_intern_pool
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.types.base import FunPayObject
+from funpayparsers.parsers.base import RawSourceMode, ParsingOptions, FunPayObjectParser
+
+
+R = TypeVar('R')
+
+
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(cls: Type[FunPayObject]) -> tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        # ``raw_source`` is always the first field, since it is declared in ``FunPayObject``.
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls)[1:])
+    return names
+
+
+def pack(obj: Any, intern_pool: InternPool | None = None) -> Any:
+    """
+    Converts parsing result into a compact picklable representation.
+
+    ``FunPayObject``'s are converted into ``(cls, *field_values)`` tuples without
+    ``raw_source``, tuples are converted into ``(tuple, *items)`` tuples,
+    lists and dicts are converted recursively, other values are kept as is.
+
+    :param intern_pool: pool, strings were interned in during parsing.
+        Strings from the pool are converted into ``(str, value)`` tuples,
+        so ``unpack()`` interns them again.
+
+    Examples:
+        >>> from funpayparsers.types.common import MoneyValue
+        >>> pack([MoneyValue(raw_source='<div>...</div>', value=1.0, character='$')])
+        [(<class 'funpayparsers.types.common.MoneyValue'>, 1.0, '$')]
+    """
+    if isinstance(obj, FunPayObject):
+        cls = type(obj)
+        return (cls, *(pack(getattr(obj, name), intern_pool) for name in _field_names(cls)))
+    if isinstance(obj, list):
+        return [pack(i, intern_pool) for i in obj]
+    if isinstance(obj, tuple):
+        return (tuple, *(pack(i, intern_pool) for i in obj))
+    if isinstance(obj, dict):
+        return {k: pack(v, intern_pool) for k, v in obj.items()}
+    if intern_pool is not None and obj.__class__ is str and obj in intern_pool:
+        return str, obj
+    return obj
+
+
+def unpack(obj: Any, intern_pool: InternPool | None = None) -> Any:
+    """
+    Restores parsing result from a representation, created by ``pack()``.
+
+    ``raw_source`` of restored ``FunPayObject``'s is empty.
+
+    :param intern_pool: pool to intern strings, that were interned during parsing, in.
+        If not set, they are restored as is.
+
+    Examples:
+        >>> from funpayparsers.types.common import MoneyValue
+        >>> unpack(pack(MoneyValue(raw_source='<div>...</div>', value=1.0, character='$')))
+        MoneyValue(raw_source='', value=1.0, character='$')
+    """
+    if isinstance(obj, tuple):
+        cls, *values = obj
+        if cls is str:
+            return values[0] if intern_pool is None else intern_pool.intern(values[0])
+        if cls is tuple:
+            return tuple(unpack(i, intern_pool) for i in values)
+        return cls('', *(unpack(i, intern_pool) for i in values))
+    if isinstance(obj, list):
+        return [unpack(i, intern_pool) for i in obj]
+    if isinstance(obj, dict):
+        return {k: unpack(v, intern_pool) for k, v in obj.items()}
+    return obj
+
+
+def _parse_chunk(
+    parser_cls: Type[FunPayObjectParser[Any, Any]],
+    options: ParsingOptions | None,
+    sources: list[Any],
+) -> list[tuple[bool, Any]]:
+    """
+    Parses a chunk of sources in a worker process.
+
+    :return: list of ``(True, packed_result)`` or ``(False, (ParsingError, traceback))`` pairs.
+    """
+    options = parser_cls._build_options(options, raw_source_mode=RawSourceMode.OFF)
+    parser = None
+    result: list[tuple[bool, Any]] = []
+    # all sources of the chunk share a pool, so its strings are marked for ``unpack()``
+    with use_intern_pool(InternPool()) as pool:
+        for source in sources:
+            try:
+                if parser is None:
+                    parser = parser_cls(source, options=options)
+                else:
+                    parser._set_raw_source(source)
+                result.append((True, pack(parser.parse(), pool)))
+            except ParsingError as e:
+                result.append((False, (e, ''.join(traceback.format_exception(e)))))
+            except Exception as e:  # unpicklable result, etc.
+                error = ParsingError(raw_source=_source_repr(source))
+                result.append((False, (error, ''.join(traceback.format_exception(e)))))
+    return result
+
+
+def _parse_chunk_in_thread(
+    parser_cls: Type[FunPayObjectParser[Any, Any]],
+    options: ParsingOptions | None,
+    sources: list[Any],
+) -> list[tuple[bool, Any]]:
+    """
+    Parses a chunk of sources in a worker thread.
+
+    :return: list of ``(True, result)`` or ``(False, (ParsingError, ''))`` pairs.
+    """
+    options = parser_cls._build_options(options)
+    parser = None
+    result: list[tuple[bool, Any]] = []
+    for source in sources:
+        try:
+            if parser is None:
+                parser = parser_cls(source, options=options)
+            else:
+                parser._set_raw_source(source)
+            result.append((True, parser.parse()))
+        except ParsingError as e:
+            result.append((False, (e, '')))
+    return result
+
+
+def _source_repr(source: Any) -> str:
+    return source if isinstance(source, str) else repr(source)
+
+
+class _RemoteTracebackError(Exception):
+    """Traceback of an error, occurred in a worker process."""
+
+    def __init__(self, tb: str) -> None:
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+def _map_chunks(
+    executor: Executor,
+    fn: Callable[[Any, Any, list[Any]], list[tuple[bool, Any]]],
+    parser_cls: Type[FunPayObjectParser[Any, Any]],
+    sources: Iterable[Any],
+    options: ParsingOptions | None,
+    *,
+    chunksize: int,
+    max_in_flight: int,
+    return_exceptions: bool,
+    convert: Callable[[Any], Any] | None,
+) -> Iterator[Any]:
+    """
+    Submits chunks of ``sources`` to ``executor`` and yields results in order of ``sources``.
+
+    Amount of submitted and not yet consumed chunks is limited by ``max_in_flight``.
+    """
+    if chunksize < 1:
+        raise ValueError('chunksize must be greater than 0.')
+
+    in_flight: deque[tuple[list[Any], Future[list[tuple[bool, Any]]]]] = deque()
+    sources_iter = iter(sources)
+
+    try:
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = list(islice(sources_iter, chunksize))
+                if not chunk:
+                    break
+                in_flight.append((chunk, executor.submit(fn, parser_cls, options, chunk)))
+
+            if not in_flight:
+                return
+
+            chunk, future = in_flight.popleft()
+            try:
+                results = future.result()
+            except Exception as e:  # broken pool, unpicklable source, etc.
+                results = []
+                for source in chunk:
+                    error = ParsingError(raw_source=_source_repr(source))
+                    error.__cause__ = e
+                    results.append((False, (error, '')))
+
+            for ok, value in results:
+                if ok:
+                    yield convert(value) if convert is not None else value
+                    continue
+
+                error, tb = value
+                if error.__cause__ is None and tb:
+                    error.__cause__ = _RemoteTracebackError(tb)
+                if not return_exceptions:
+                    raise error
+                yield error
+    finally:
+        for _, future in in_flight:
+            future.cancel()
+
+
+class ParsingPool:
+    """
+    Process pool parsing engine.
+
+    Fans parsing out to worker processes, which is useful for CPU-bound workloads,
+    e.g., back-filling large amounts of pages.
+
+    Parsing results are transferred from workers in a compact form (see ``pack()``)
+    without ``raw_source``'s, so restored objects always have empty ``raw_source``'s.
+
+    Examples:
+        >>> from funpayparsers.parsers.money_value_parser import MoneyValueParser
+        >>> with ParsingPool(max_workers=2) as pool:  # doctest: +SKIP
+        ...     for value in pool.map(MoneyValueParser, ['1 $', '2 €']):
+        ...         print(value.value, value.character)
+        1.0 $
+        2.0 €
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_in_flight: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        :param max_workers: max amount of worker processes.
+            Defaults to ``os.cpu_count()``. Ignored if ``executor`` is passed.
+        :param max_in_flight: max amount of submitted and not yet consumed chunks.
+            Limits memory usage when the consumer is slower than workers.
+            Defaults to ``max_workers * 4``.
+        :param executor: external executor to use instead of creating
+            a ``ProcessPoolExecutor``. It is not shut down by ``ParsingPool``.
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_in_flight = max_in_flight or self._max_workers * 4
+        if self._max_in_flight < 1:
+            raise ValueError('max_in_flight must be greater than 0.')
+
+        self._own_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(max_workers=self._max_workers)
+
+    def map(
+        self,
+        parser_cls: Type[FunPayObjectParser[R, Any]],
+        sources: Iterable[Any],
+        options: ParsingOptions | None = None,
+        *,
+        chunksize: int = 1,
+        return_exceptions: bool = False,
+        unpack_results: bool = True,
+    ) -> Iterator[R | ParsingError]:
+        """
+        Parses sources in worker processes.
+
+        Results are yielded lazily, in order of ``sources``.
+
+        :param parser_cls: parser class (must be importable by worker processes).
+        :param sources: raw sources to parse.
+        :param options: parsing options instance.
+        :param chunksize: amount of sources, sent to a worker in a single task.
+            Values greater than ``1`` reduce inter-process communication overhead
+            for small sources (e.g., runner responses).
+        :param return_exceptions: whether to yield ``ParsingError`` in place of a failed
+            source result instead of raising it.
+        :param unpack_results: whether to restore parsing results into objects.
+            If ``False``, results are yielded as is (see ``pack()``).
+
+        Strings, interned by parsers, are interned in ``options.intern_pool`` or the pool
+        of the current context (see ``use_intern_pool()``) on unpacking,
+        so restored objects share them the same way locally parsed ones do.
+
+        :raises ParsingError: if parsing of a source failed and ``return_exceptions``
+            is ``False``.
+        """
+        # Workers can't intern strings in the caller's pool, so it is not sent to them:
+        # interned strings are marked by workers and interned in the pool by ``unpack()``.
+        if options is not None and options.intern_pool is not None:
+            intern_pool: InternPool | None = options.intern_pool
+            options = replace(options, intern_pool=None)
+        else:
+            intern_pool = get_intern_pool()
+
+        convert = None
+        if unpack_results:
+            convert = unpack if intern_pool is None else partial(unpack, intern_pool=intern_pool)
+
+        return _map_chunks(
+            self._executor,
+            _parse_chunk,
+            parser_cls,
+            sources,
+            options,
+            chunksize=chunksize,
+            max_in_flight=self._max_in_flight,
+            return_exceptions=return_exceptions,
+            convert=convert,
+        )
+
+    def close(self, wait: bool = True) -> None:
+        """Shuts down the underlying executor, if it was created by the pool."""
+        if self._own_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def parse_parallel(
+    parser_cls: Type[FunPayObjectParser[R, Any]],
+    sources: Iterable[Any],
+    options: ParsingOptions | None = None,
+    *,
+    max_workers: int | None = None,
+    max_in_flight: int | None = None,
+    chunksize: int = 1,
+    return_exceptions: bool = False,
+) -> Iterator[R | ParsingError]:
+    """
+    Parses sources in a temporary ``ParsingPool``.
+
+    See ``ParsingPool.map()`` for details.
+    """
+    with ParsingPool(max_workers=max_workers, max_in_flight=max_in_flight) as pool:
+        yield from pool.map(
+            parser_cls,
+            sources,
+            options,
+            chunksize=chunksize,
+            return_exceptions=return_exceptions,
+        )
+
+
+def parse_concurrently(
+    parser_cls: Type[FunPayObjectParser[R, Any]],
+    sources: Iterable[Any],
+    options: ParsingOptions | None = None,
+    *,
+    max_workers: int | None = None,
+    max_in_flight: int | None = None,
+    chunksize: int = 1,
+    return_exceptions: bool = False,
+    executor: ThreadPoolExecutor | None = None,
+) -> Iterator[R | ParsingError]:
+    """
+    Parses sources in a thread pool.
+
+    Unlike ``ParsingPool``, does not spawn processes and keeps results as is
+    (including ``raw_source``'s, according to ``options``).
+    HTML tokenization in lexbor releases the GIL, so it runs in parallel on regular CPython
+    builds; the rest of parsing (CSS selectors, building objects) runs in parallel
+    on free-threaded builds only.
+
+    Parsers and options hold no mutable state, shared between parser instances
+    (derived options of nested parsers are cached in a bounded, thread-safe
+    ``functools.lru_cache``), and enum lookups are read-only, so it is safe to parse
+    in multiple threads, as long as a single parser instance is not used by multiple threads
+    at the same time.
+
+    Results are yielded lazily, in order of ``sources``.
+
+    :param parser_cls: parser class.
+    :param sources: raw sources to parse.
+    :param options: parsing options instance.
+    :param max_workers: max amount of worker threads.
+        Defaults to ``os.cpu_count()``. Ignored if ``executor`` is passed.
+    :param max_in_flight: max amount of submitted and not yet consumed chunks.
+        Defaults to ``max_workers * 4``.
+    :param chunksize: amount of sources, parsed by a worker in a single task.
+    :param return_exceptions: whether to yield ``ParsingError`` in place of a failed
+        source result instead of raising it.
+    :param executor: external thread pool executor. It is not shut down after parsing.
+
+    :raises ParsingError: if parsing of a source failed and ``return_exceptions``
+        is ``False``.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    own_executor = executor is None
+    executor = executor or ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield from _map_chunks(
+            executor,
+            _parse_chunk_in_thread,
+            parser_cls,
+            sources,
+            options,
+            chunksize=chunksize,
+            max_in_flight=max_in_flight or max_workers * 4,
+            return_exceptions=return_exceptions,
+            convert=None,
+        )
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
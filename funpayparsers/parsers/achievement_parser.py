@@ -6,6 +6,7 @@ __all__ = ('AchievementParsingOptions', 'AchievementParser')
 from typing import cast
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import Achievement
 
@@ -26,10 +27,10 @@ class AchievementParser(FunPayHTMLObjectParser[Achievement, AchievementParsingOp
     """
 
     def _parse(self) -> Achievement:
-        div = self.tree.css_first('div.achievement-item')
+        div = self.tree.css_first(sel.ACHIEVEMENT)
         return Achievement(
-            raw_source=div.html or '',
+            raw_source=self.capture_raw_source(div),
             # achievement-item always has a class
-            css_class=cast(str, div.css_first('i').attributes['class']),
+            css_class=cast(str, div.css_first(sel.ICON).attributes['class']),
             text=div.text(deep=False).strip(),
         )
@@ -33,16 +33,14 @@ class AppDataParser(FunPayJSONObjectParser[AppData, AppDataParsingOptions]):
         webpush = self.data.get('webpush')
         if webpush is not None:
             webpush = WebPush(
-                raw_source=json.dumps(webpush, ensure_ascii=False),
+                raw_source=self.capture_raw_source(webpush),
                 app=webpush.get('app'),
                 enabled=webpush.get('enabled'),
                 hwid_required=webpush.get('hwid-required'),
             )
 
         return AppData(
-            raw_source=json.dumps(self.raw_source)
-            if not isinstance(self.raw_source, str)
-            else self.raw_source,
+            raw_source=self.capture_raw_source(serializer=json.dumps),
             locale=Language.get_by_lang_code(self.data.get('locale')),
             csrf_token=cast(str, self.data.get('csrf-token')),
             user_id=self.data.get('userId'),
@@ -7,6 +7,8 @@ __all__ = ('UserBadgeParser', 'UserBadgeParsingOptions')
 from typing import cast
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import UserBadge
 
@@ -28,9 +30,10 @@ class UserBadgeParser(FunPayHTMLObjectParser[UserBadge, UserBadgeParsingOptions]
     """
 
     def _parse(self) -> UserBadge:
-        badge_span = self.tree.css('span.label')[0]
+        badge_span = self.tree.css(sel.BADGE)[0]
         return UserBadge(
-            raw_source=badge_span.html or '',
-            text=badge_span.text(strip=True),
-            css_class=cast(str, badge_span.attributes['class']),  # badge_span always has a class
+            raw_source=self.capture_raw_source(badge_span),
+            text=intern_string(badge_span.text(strip=True)),
+            # badge_span always has a class
+            css_class=intern_string(cast(str, badge_span.attributes['class'])),
         )
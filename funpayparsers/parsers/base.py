@@ -4,27 +4,100 @@ from __future__ import annotations
 __all__ = (
     'FunPayObjectParser',
     'ParsingOptions',
+    'RawSourceMode',
     'FunPayHTMLObjectParser',
     'FunPayJSONObjectParser',
 )
 
 import json
-from typing import Any, Type, Generic, TypeVar, get_args, get_origin
+import time
+from typing import Any, Type, Generic, TypeVar, Callable, cast, get_args, get_origin
 from dataclasses import field, fields, replace, dataclass
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from enum import Enum
+from functools import cache, lru_cache
+from itertools import islice
+from contextvars import Token, ContextVar
+from collections.abc import Mapping, Iterable, Iterator, Sequence, AsyncIterator
 
-from selectolax.lexbor import LexborHTMLParser
+from selectolax.lexbor import LexborNode, LexborHTMLParser
 from typing_extensions import Self
 
+from funpayparsers.aio import Offloader, get_default_offloader
+from funpayparsers.interning import (
+    InternPool,
+    get_intern_pool,
+    set_intern_pool,
+    reset_intern_pool,
+)
 from funpayparsers.exceptions import ParsingError
+from funpayparsers.raw_source import LazyRawSource, RawSourceDocument
 from funpayparsers.types.base import FunPayObject
+from funpayparsers.instrumentation import get_hook, _TracedNode, _unwrap_node
 
 
 ReturnType = TypeVar('ReturnType', bound=Any)
+ItemType = TypeVar('ItemType')
 OptionsClass = TypeVar('OptionsClass', bound='ParsingOptions')
 
 
+class RawSourceMode(Enum):
+    """``FunPayObject.raw_source`` capture modes enumeration."""
+
+    EAGER = 0
+    """Raw sources are serialized while parsing."""
+
+    LAZY = 1
+    """
+    Raw sources are serialized on first access to ``FunPayObject.raw_source``.
+
+    Until then, each object keeps a reference to the parsed document.
+    """
+
+    OFF = 2
+    """Raw sources are not captured at all, ``FunPayObject.raw_source`` is empty."""
+
+    SPAN = 3
+    """
+    Raw sources of HTML objects are ``(document, start, end)`` spans into a single
+    document, shared by all objects parsed from it: the HTML string passed to the parser,
+    or a serialized copy of the tree, if a parsed tree / node was passed
+    (or the string is not the exact serialization of its tree).
+    Strings are materialized on access to ``FunPayObject.raw_source``.
+
+    SPAN reduces memory, retained by parsed objects, but it is not cheaper than
+    ``RawSourceMode.EAGER`` to capture: every object's node is still serialized
+    to locate it in the document.
+
+    Raw sources of non-HTML objects are captured as in ``RawSourceMode.LAZY``.
+    """
+
+
+@dataclass
+class _ParseScope:
+    """State of the outermost running parser, shared with all nested parsers."""
+
+    raw_source_mode: RawSourceMode
+    intern_pool: InternPool
+    documents: dict[LexborHTMLParser, RawSourceDocument] = field(default_factory=dict)
+    passed_documents: set[LexborHTMLParser] = field(default_factory=set)
+    """Trees, whose ``documents`` are the HTML strings passed to parsers."""
+
+
+_parse_scope: ContextVar[_ParseScope | None] = ContextVar(
+    'funpayparsers_parse_scope', default=None
+)
+
+
+def _enter_scope(scope: _ParseScope) -> tuple[Token[_ParseScope | None], Token[InternPool | None]]:
+    return _parse_scope.set(scope), set_intern_pool(scope.intern_pool)
+
+
+def _exit_scope(tokens: tuple[Token[_ParseScope | None], Token[InternPool | None]]) -> None:
+    reset_intern_pool(tokens[1])
+    _parse_scope.reset(tokens[0])
+
+
 @dataclass(frozen=True)
 class ParsingOptions:
     """
@@ -80,6 +153,27 @@ class ParsingOptions:
     are combined using ``dict.update()``.
     """
 
+    raw_source_mode: RawSourceMode = RawSourceMode.EAGER
+    """
+    ``raw_source`` capture mode (see ``RawSourceMode``).
+
+    Nested parsers inherit the mode of the outermost parser.
+    ``empty_raw_source=True`` implies ``RawSourceMode.OFF``.
+
+    Defaults to ``RawSourceMode.EAGER``.
+    """
+
+    intern_pool: InternPool | None = None
+    """
+    Pool to intern low-cardinality string fields in (see ``InternPool``).
+
+    Nested parsers use the pool of the outermost parser.
+    If not set, the pool of the current context (see ``use_intern_pool()``)
+    or a new per-parse pool is used.
+
+    Defaults to ``None``.
+    """
+
     def __merge_options__(self, other: OptionsClass, non_explicit: bool = False) -> Self:
         self_fields = {
             i.name: getattr(self, i.name)
@@ -137,13 +231,43 @@ class FunPayObjectParser(ABC, Generic[ReturnType, OptionsClass]):
         """
         :param raw_source: raw source of an object (HTML / JSON string)
         """
-        self._raw_source = raw_source
         self._options: OptionsClass = self._build_options(options, **overrides)
+        self._set_raw_source(raw_source)
+
+    def _set_raw_source(self, raw_source: Any) -> None:
+        """
+        Sets the raw source to parse and resets all the state, related to the previous one.
+
+        Allows reusing a single parser instance for multiple sources (see ``parse_many``).
+        """
+        self._raw_source = raw_source
 
     @abstractmethod
     def _parse(self) -> ReturnType: ...
 
     def parse(self) -> ReturnType:
+        hook = get_hook()
+        if hook is None:
+            return self._parse_in_scope()
+
+        hook.parse_started(self)
+        start, error = time.perf_counter_ns(), None
+        try:
+            return self._parse_in_scope()
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            hook.parse_finished(self, time.perf_counter_ns() - start, error)
+
+    def _new_scope(self) -> _ParseScope:
+        pool = self.options.intern_pool
+        if pool is None:
+            pool = get_intern_pool()
+        return _ParseScope(self.raw_source_mode, pool if pool is not None else InternPool())
+
+    def _parse_in_scope(self) -> ReturnType:
+        tokens = _enter_scope(self._new_scope()) if _parse_scope.get() is None else None
         try:
             result = self._parse()
 
@@ -153,7 +277,170 @@ class FunPayObjectParser(ABC, Generic[ReturnType, OptionsClass]):
             return result
 
         except Exception as e:
-            raise ParsingError(raw_source=self.raw_source) from e
+            raise self._parsing_error() from e
+
+        finally:
+            if tokens is not None:
+                _exit_scope(tokens)
+
+    async def aparse(self, offloader: Offloader | None = None) -> ReturnType:
+        """
+        Asynchronous version of ``parse()``.
+
+        Parsing is offloaded to an executor, so it doesn't block the event loop.
+
+        :param offloader: offloader to run parsing with.
+            Defaults to ``funpayparsers.aio.get_default_offloader()``.
+        """
+        return await (offloader or get_default_offloader()).run(self.parse)
+
+    def _parsing_error(self) -> ParsingError:
+        if self.raw_source_mode is RawSourceMode.SPAN:
+            return ParsingError(raw_source=self.capture_raw_source())
+        return ParsingError(raw_source=self.raw_source)
+
+    def _stream(self, items: Iterator[ItemType]) -> Iterator[ItemType]:
+        """
+        Yields items, produced by ``items`` generator, the same way ``parse()`` returns
+        a result: nested parsers share the same parse scope, errors are wrapped
+        into ``ParsingError``, ``empty_raw_source`` option is applied to every item.
+
+        The parse scope is entered only while an item is being produced, so a stream
+        may be advanced from different threads (one at a time).
+        """
+        scope = _parse_scope.get() or self._new_scope()
+        while True:
+            tokens = _enter_scope(scope)
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except Exception as e:
+                raise self._parsing_error() from e
+            finally:
+                _exit_scope(tokens)
+
+            if self.options.empty_raw_source:
+                self.empty_raw_source(cast(FunPayObject, item))
+            yield item
+
+    @staticmethod
+    async def _aiter_stream(
+        stream: Iterator[ItemType],
+        offloader: Offloader | None = None,
+        batch_size: int = 1,
+    ) -> AsyncIterator[ItemType]:
+        """
+        Advances ``stream`` in an executor and yields its items.
+
+        :param stream: items stream (see ``_stream()``).
+        :param offloader: offloader to run parsing with.
+            Defaults to ``funpayparsers.aio.get_default_offloader()``.
+        :param batch_size: amount of items, produced in a single executor call.
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be greater than 0.')
+
+        offloader = offloader or get_default_offloader()
+        while batch := await offloader.run(_take, stream, batch_size):
+            for item in batch:
+                yield item
+
+    @classmethod
+    def parse_many(
+        cls,
+        sources: Iterable[Any],
+        options: OptionsClass | None = None,
+        **overrides: Any,
+    ) -> Iterator[ReturnType]:
+        """
+        Parses multiple sources with the same options.
+
+        Options are built once and a single parser instance is reused for all sources,
+        results are yielded lazily, in order of ``sources``.
+
+        If parsing of a source fails, ``ParsingError`` is raised and the generator is closed.
+
+        :param sources: raw sources to parse.
+        :param options: parsing options instance.
+        :param overrides: options overrides.
+        """
+        options = cls._build_options(options, **overrides)
+        parser: FunPayObjectParser[ReturnType, OptionsClass] | None = None
+        for source in sources:
+            if parser is None:
+                parser = cls(source, options=options)
+            else:
+                parser._set_raw_source(source)
+            yield parser.parse()
+
+    @property
+    def raw_source_mode(self) -> RawSourceMode:
+        """
+        Effective raw source capture mode.
+
+        Mode of the outermost running parser, if this parser is a nested one.
+        """
+        scope = _parse_scope.get()
+        if scope is not None:
+            return scope.raw_source_mode
+        if self.options.empty_raw_source:
+            return RawSourceMode.OFF
+        return self.options.raw_source_mode
+
+    def capture_raw_source(
+        self,
+        source: Any = None,
+        serializer: Callable[[Any], str | None] | None = None,
+    ) -> str:
+        """
+        Returns a ``raw_source`` value for a ``FunPayObject`` according to
+        the effective raw source capture mode.
+
+        :param source: source of an object. Strings are used as is, other objects
+            are converted via ``serializer``. Defaults to the parser's own raw source.
+        :param serializer: callable, that converts ``source`` into a string.
+            Defaults to ``_serialize_raw_source``.
+
+        :return: empty string (``RawSourceMode.OFF``), ``LazyRawSource`` handle
+            (``RawSourceMode.LAZY``), ``RawSourceSpan`` handle (``RawSourceMode.SPAN``)
+            or serialized source (``RawSourceMode.EAGER``).
+        """
+        mode = self.raw_source_mode
+        if mode is RawSourceMode.OFF:
+            return ''
+
+        if source is None:
+            source = self._raw_source
+        if isinstance(source, str):
+            return source
+
+        source = _unwrap_node(source)
+        serializer = serializer or self._serialize_raw_source
+        if mode is RawSourceMode.LAZY:
+            return cast(str, LazyRawSource(source, serializer))
+
+        if mode is RawSourceMode.SPAN:
+            result = self._capture_span(source, serializer)
+        else:
+            result = serializer(source) or ''
+
+        hook = get_hook()
+        if hook is not None and not isinstance(result, LazyRawSource):
+            hook.raw_source_captured(self, len(result))
+        return result
+
+    def _capture_span(self, source: Any, serializer: Callable[[Any], str | None]) -> str:
+        """
+        Captures raw source in ``RawSourceMode.SPAN``.
+
+        Sources, that are not parts of a document, are captured lazily.
+        """
+        return cast(str, LazyRawSource(source, serializer))
+
+    @staticmethod
+    def _serialize_raw_source(source: Any) -> str | None:
+        return str(source)
 
     def empty_raw_source(self, obj: FunPayObject | Sequence[Any] | Mapping[Any, Any]) -> None:
         if hasattr(type(obj), '__dataclass_fields__') and isinstance(obj, FunPayObject):
@@ -165,11 +452,11 @@ class FunPayObjectParser(ABC, Generic[ReturnType, OptionsClass]):
 
         elif isinstance(obj, (list, tuple)):
             for item in obj:
-                self.empty_raw_source(item)
+                self.empty_raw_source(cast(FunPayObject, item))
 
         elif isinstance(obj, Mapping):
             for item in obj.values():
-                self.empty_raw_source(item)
+                self.empty_raw_source(cast(FunPayObject, item))
 
     @property
     def raw_source(self) -> Any:
@@ -181,6 +468,10 @@ class FunPayObjectParser(ABC, Generic[ReturnType, OptionsClass]):
 
     @classmethod
     def _build_options(cls, options: OptionsClass | None, **overrides: Any) -> OptionsClass:
+        if not overrides:
+            # options are immutable, there is nothing to copy
+            return options if options is not None else cls.get_options_cls()()
+
         base = options or cls.get_options_cls()()
         to_override = {
             k: v
@@ -189,8 +480,16 @@ class FunPayObjectParser(ABC, Generic[ReturnType, OptionsClass]):
         }
         if 'context' in overrides:
             to_override['context'] = base.context | overrides['context']
+            return replace(base, **to_override)
 
-        return replace(base, **to_override)
+        # Nested parsers are usually created with the same options and overrides
+        # (e.g., ``parsing_mode``) for every item of a list, so derived options are cached.
+        try:
+            return cast(
+                OptionsClass, _derive_options(_OptionsRef(base), frozenset(to_override.items()))
+            )
+        except TypeError:  # unhashable override value
+            return replace(base, **to_override)
 
     @classmethod
     def get_options_cls(cls) -> Type[OptionsClass]:
@@ -198,7 +497,7 @@ class FunPayObjectParser(ABC, Generic[ReturnType, OptionsClass]):
             return cls.__options_cls__
 
         try:
-            return cls._get_options_cls_inner()
+            return _resolve_options_cls(cls)
         except Exception as e:
             raise LookupError(
                 f'Unable to determine options class for `{cls.__name__}`.\n'
@@ -223,32 +522,144 @@ class FunPayObjectParser(ABC, Generic[ReturnType, OptionsClass]):
         raise LookupError('No suitable options class found.')
 
 
+def _take(items: Iterator[ItemType], amount: int) -> list[ItemType]:
+    return list(islice(items, amount))
+
+
+class _OptionsRef:
+    """Hashable reference to a ``ParsingOptions`` instance (compared by identity)."""
+
+    __slots__ = ('options',)
+
+    def __init__(self, options: ParsingOptions) -> None:
+        self.options = options
+
+    def __hash__(self) -> int:
+        return id(self.options)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _OptionsRef) and other.options is self.options
+
+
+@lru_cache(maxsize=256)
+def _derive_options(base: _OptionsRef, overrides: frozenset[tuple[str, Any]]) -> ParsingOptions:
+    """
+    Returns a copy of ``base`` options with ``overrides`` applied.
+
+    Cache entries keep their base options alive, so identity-based keys are never reused.
+    """
+    return replace(base.options, **dict(overrides))
+
+
+@cache
+def _resolve_options_cls(
+    parser_cls: Type[FunPayObjectParser[Any, OptionsClass]],
+) -> Type[OptionsClass]:
+    return parser_cls._get_options_cls_inner()
+
+
 class FunPayHTMLObjectParser(FunPayObjectParser[ReturnType, OptionsClass], ABC):
-    """Base parser for all HTML object parsers."""
+    """
+    Base parser for all HTML object parsers.
+
+    Accepts either an HTML string or an already parsed ``LexborHTMLParser`` / ``LexborNode``.
+    Passing a node allows composite parsers to hand a part of an already tokenized
+    document to nested parsers without serializing and reparsing it.
+    """
 
-    def __init__(self, raw_source: str, options: OptionsClass | None = None, **overrides: Any):
+    def __init__(
+        self,
+        raw_source: str | LexborNode | LexborHTMLParser,
+        options: OptionsClass | None = None,
+        **overrides: Any,
+    ):
         """
-        :param raw_source: raw source of an object (HTML string).
+        :param raw_source: raw source of an object (HTML string, ``LexborHTMLParser``
+            or ``LexborNode``).
         :param options: parsing options class.
         :param overrides: options overrides.
         """
         super().__init__(raw_source=raw_source, options=options, **overrides)
-        self._tree: LexborHTMLParser | None = None
+
+    def _set_raw_source(self, raw_source: str | LexborNode | LexborHTMLParser) -> None:
+        raw_source = _unwrap_node(raw_source)
+        super()._set_raw_source(raw_source)
+        self._tree: LexborHTMLParser | LexborNode | None = (
+            None if isinstance(raw_source, str) else raw_source
+        )
+        self._raw_source_html: str | None = None
 
     @property
-    def tree(self) -> LexborHTMLParser:
-        """HTML tree."""
+    def tree(self) -> LexborHTMLParser | LexborNode:
+        """
+        HTML tree.
 
-        if self._tree is not None:
-            return self._tree
+        If an already parsed tree / node was passed, it is used as is.
 
-        self._tree = LexborHTMLParser(self.raw_source)
+        If the installed parsing hook traces selectors
+        (see ``funpayparsers.instrumentation.ParsingHook.trace_selectors``),
+        the tree is wrapped into a tracing proxy.
+        """
+        if self._tree is None:
+            self._tree = LexborHTMLParser(self._raw_source)
+            scope = _parse_scope.get()
+            if scope is not None and scope.raw_source_mode is RawSourceMode.SPAN:
+                # Spans reference the passed string instead of a serialized copy of the tree.
+                scope.documents[self._tree] = RawSourceDocument(self._raw_source)
+                scope.passed_documents.add(self._tree)
+
+        hook = get_hook()
+        if hook is not None and hook.trace_selectors:
+            return cast(LexborHTMLParser, _TracedNode(self._tree, self, hook))
         return self._tree
 
     @property
     def raw_source(self) -> str:
-        """Passed raw source."""
-        return self._raw_source  # type: ignore[no-any-return] # raw_source type in __init__
+        """
+        Passed raw source.
+
+        If an already parsed tree / node was passed, it is serialized on first access.
+        """
+        if isinstance(self._raw_source, str):
+            return self._raw_source
+
+        if self._raw_source_html is None:
+            self._raw_source_html = self._raw_source.html or ''
+        return self._raw_source_html
+
+    def _capture_span(self, source: Any, serializer: Callable[[Any], str | None]) -> str:
+        if not isinstance(source, (LexborNode, LexborHTMLParser)):
+            return super()._capture_span(source, serializer)
+
+        fragment = serializer(source)
+        scope = _parse_scope.get()
+        if not fragment or scope is None:
+            return fragment or ''
+
+        tree = source if isinstance(source, LexborHTMLParser) else source.parser
+        document = scope.documents.get(tree)
+        if document is None:
+            document = scope.documents[tree] = RawSourceDocument(tree.html or '')
+
+        try:
+            return cast(str, document.span(fragment))
+        except ValueError:
+            pass
+
+        if tree in scope.passed_documents:
+            # The passed string is not the exact serialization of the tree
+            # (e.g., unquoted attributes): switch to a serialized copy.
+            scope.passed_documents.discard(tree)
+            document = scope.documents[tree] = RawSourceDocument(tree.html or '')
+            try:
+                return cast(str, document.span(fragment))
+            except ValueError:
+                pass
+        return fragment  # custom serializer output, that is not a part of the document
+
+    @staticmethod
+    def _serialize_raw_source(source: LexborNode | LexborHTMLParser) -> str | None:
+        return source.html
 
 
 class FunPayJSONObjectParser(FunPayObjectParser[ReturnType, OptionsClass], ABC):
@@ -266,6 +677,9 @@ class FunPayJSONObjectParser(FunPayObjectParser[ReturnType, OptionsClass], ABC):
         :param overrides: options overrides.
         """
         super().__init__(raw_source=raw_source, options=options, **overrides)
+
+    def _set_raw_source(self, raw_source: str | dict[str, Any] | list[Any]) -> None:
+        super()._set_raw_source(raw_source)
         self._data: dict[str, Any] | list[Any] | None = None
 
     @property
@@ -283,3 +697,7 @@ class FunPayJSONObjectParser(FunPayObjectParser[ReturnType, OptionsClass], ABC):
     def raw_source(self) -> str | dict[str, Any] | list[Any]:
         """Passed raw source."""
         return self._raw_source  # type: ignore[no-any-return] # raw_source type in __init__
+
+    @staticmethod
+    def _serialize_raw_source(source: Any) -> str | None:
+        return json.dumps(source, ensure_ascii=False)
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 
 from selectolax.lexbor import LexborNode
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.types.enums import SubcategoryType
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.categories import Category, Subcategory
@@ -33,37 +34,36 @@ class CategoriesParser(
     def _parse(self) -> list[Category]:
         result = []
 
-        for global_cat in self.tree.css('div.promo-game-item'):
-            categories = global_cat.css('div.game-title')
+        for global_cat in self.tree.css(sel.CATEGORY_GROUP):
+            categories = global_cat.css(sel.CATEGORY_TITLE)
+            locations = _by_data_id(global_cat.css(sel.CATEGORY_LOCATION))
+            subcategories_lists = _by_data_id(global_cat.css(sel.SUBCATEGORIES_LIST))
             # Some categories have "clones" with different locations (RU, US/EU, etc.)
             # FunPay treats them as different categories,
             # but on main page they are in the same div.
             for cat in categories:
                 id_ = int(cast(str, cat.attributes['data-id']))
-                locations = global_cat.css(f'button[data-id="{id_}"]')
-                location = locations[0].text(strip=True) if locations else None
+                location_div = locations.get(str(id_))
+                location = location_div.text(strip=True) if location_div is not None else None
 
                 result.append(
                     Category(
-                        raw_source=global_cat.html or '',
+                        raw_source=self.capture_raw_source(global_cat),
                         id=id_,
-                        name=cat.css('a')[0].text(strip=True),
+                        name=cat.css(sel.LINK)[0].text(strip=True),
                         location=location,
-                        subcategories=self._parse_subcategories(global_cat, id_),
+                        subcategories=self._parse_subcategories(subcategories_lists[str(id_)]),
                     )
                 )
         return result
 
-    def _parse_subcategories(
-        self, global_cat: LexborNode, data_id: int | str
-    ) -> tuple[Subcategory, ...]:
+    def _parse_subcategories(self, subcategories_list: LexborNode) -> tuple[Subcategory, ...]:
         result = []
-        div = global_cat.css(f'ul.list-inline[data-id="{data_id}"]')[0]
-        for link in div.css('a'):
+        for link in subcategories_list.css(sel.LINK):
             url: str = link.attributes['href']  # type: ignore[assignment] # always has href
             result.append(
                 Subcategory(
-                    raw_source=link.html or '',
+                    raw_source=self.capture_raw_source(link),
                     id=int(url.split('/')[-2]),
                     name=link.text(strip=True),
                     type=SubcategoryType.get_by_url(url),
@@ -72,3 +72,11 @@ class CategoriesParser(
             )
 
         return tuple(result)
+
+
+def _by_data_id(nodes: list[LexborNode]) -> dict[str, LexborNode]:
+    """Maps ``data-id`` attribute values to the first node with this value."""
+    result: dict[str, LexborNode] = {}
+    for node in nodes:
+        result.setdefault(node.attributes.get('data-id') or '', node)
+    return result
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 
 from selectolax.lexbor import LexborNode
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.types.chat import Chat
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import UserPreview
@@ -54,7 +55,7 @@ class ChatParser(FunPayHTMLObjectParser[Chat, ChatParsingOptions]):
     """
 
     def _parse(self) -> Chat:
-        chat_div = self.tree.css('div.chat')[0]
+        chat_div = self.tree.css(sel.CHAT)[0]
         interlocutor, notifications, banned = self._parse_chat_header(chat_div)
 
         chat_id = (
@@ -65,15 +66,15 @@ class ChatParser(FunPayHTMLObjectParser[Chat, ChatParsingOptions]):
 
         chat_name: str = cast(str, chat_div.attributes.get('data-name'))
 
-        messages_div = chat_div.css('div.chat-message-list')[0]
+        messages_div = chat_div.css(sel.CHAT_MESSAGE_LIST)[0]
         history = MessagesParser(
-            raw_source=messages_div.html or '',
+            raw_source=messages_div,
             options=self.options.messages_parsing_options,
             context={'chat_id': chat_id, 'chat_name': chat_name},
         ).parse()
 
         return Chat(
-            raw_source=chat_div.html or '',
+            raw_source=self.capture_raw_source(chat_div),
             id=chat_id,
             name=chat_name,
             interlocutor=interlocutor,
@@ -85,19 +86,19 @@ class ChatParser(FunPayHTMLObjectParser[Chat, ChatParsingOptions]):
     def _parse_chat_header(
         self, div: LexborNode
     ) -> tuple[UserPreview | None, bool | None, bool | None]:
-        header_div = div.css('div.chat-header')[0]
-        interlocutor_divs = header_div.css('div.media-user')
+        header_div = div.css(sel.CHAT_HEADER)[0]
+        interlocutor_divs = header_div.css(sel.MEDIA_USER)
 
         if not interlocutor_divs:
             return None, None, None
 
         interlocutor = UserPreviewParser(
-            raw_source=cast(str, interlocutor_divs[0].html),
+            raw_source=interlocutor_divs[0],
             options=self.options.user_preview_parsing_options,
             parsing_mode=UserPreviewParsingMode.FROM_CHAT,
         ).parse()
 
-        btn_divs = header_div.css('button')
+        btn_divs = header_div.css(sel.BUTTON)
         if not btn_divs:
             return interlocutor, None, None
         btn_div = btn_divs[0]
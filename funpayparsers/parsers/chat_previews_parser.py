@@ -4,7 +4,10 @@ from __future__ import annotations
 __all__ = ('PrivateChatPreviewsParser', 'PrivateChatPreviewParsingOptions')
 
 from dataclasses import dataclass
+from collections.abc import Iterator
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.types.chat import PrivateChatPreview
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.parsers.utils import extract_css_url
@@ -29,27 +32,31 @@ class PrivateChatPreviewsParser(
     """
 
     def _parse(self) -> list[PrivateChatPreview]:
-        previews = []
-        for chat in self.tree.css('a.contact-item'):
-            avatar_css: str = chat.css('div.avatar-photo')[0].attributes['style']  # type: ignore[assignment] # always has a style
+        return list(self._iter_items())
 
-            preview = PrivateChatPreview(
-                raw_source=chat.html or '',
+    def iter_parse(self) -> Iterator[PrivateChatPreview]:
+        """Yields private chat previews as soon as they are parsed."""
+        return self._stream(self._iter_items())
+
+    def _iter_items(self) -> Iterator[PrivateChatPreview]:
+        for chat in self.tree.css(sel.CHAT_PREVIEW):
+            avatar_css: str = chat.css(sel.AVATAR_PHOTO)[0].attributes['style']  # type: ignore[assignment] # always has a style
+
+            yield PrivateChatPreview(
+                raw_source=self.capture_raw_source(chat),
                 id=int(
                     chat.attributes['data-id']  # type: ignore[arg-type] # always has data-id
                 ),
                 # chat always has a class
                 is_unread='unread' in chat.attributes['class'],  # type: ignore[operator]
-                username=chat.css('div.media-user-name')[0].text(strip=True),
-                avatar_url=extract_css_url(avatar_css),
+                username=intern_string(chat.css(sel.MEDIA_USER_NAME)[0].text(strip=True)),
+                avatar_url=intern_string(extract_css_url(avatar_css)),
                 last_message_id=int(
                     chat.attributes['data-node-msg']  # type: ignore[arg-type] # always has data-node-msg
                 ),
                 last_read_message_id=int(
                     chat.attributes['data-user-msg']  # type: ignore[arg-type] # always has data-user-msg
                 ),
-                last_message_preview=chat.css('div.contact-item-message')[0].text(),
-                last_message_time_text=(chat.css('div.contact-item-time')[0].text(strip=True)),
+                last_message_preview=chat.css(sel.CHAT_PREVIEW_MESSAGE)[0].text(),
+                last_message_time_text=(chat.css(sel.CHAT_PREVIEW_TIME)[0].text(strip=True)),
             )
-            previews.append(preview)
-        return previews
@@ -6,6 +6,7 @@ __all__ = ('CurrentlyViewingOfferInfoParsingOptions', 'CurrentlyViewingOfferInfo
 
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import CurrentlyViewingOfferInfo
 
@@ -31,12 +32,12 @@ class CurrentlyViewingOfferInfoParser(
     """
 
     def _parse(self) -> CurrentlyViewingOfferInfo:
-        link = self.tree.css('a')[0]
+        link = self.tree.css(sel.LINK)[0]
         url: str = link.attributes['href']  # type: ignore[assignment] # always has href
         id_ = url.split('id=')[-1]
 
         return CurrentlyViewingOfferInfo(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             id=int(id_) if id_.isnumeric() else id_,
             title=link.text(strip=True),
         )
@@ -4,10 +4,15 @@ from __future__ import annotations
 __all__ = ('MessageMetaParsingOptions', 'MessageMetaParser')
 
 
+from typing import Any
 from dataclasses import dataclass
 
+from selectolax.lexbor import LexborNode, LexborHTMLParser
+
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.types.enums import MessageType
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
+from funpayparsers.parsers.utils import inner_html
 from funpayparsers.types.messages import MessageMeta
 
 
@@ -24,8 +29,32 @@ class MessageMetaParser(FunPayHTMLObjectParser[MessageMeta, MessageMetaParsingOp
     Possible locations:
         - On chat pages (https://funpay.com/chat/?node=<chat_id>).
         - In runners response.
+
+    Accepts inner HTML of a message text block (``div.chat-msg-text``) or the block node
+    itself. ``MessagesParser`` passes nodes of an already parsed document along with
+    already extracted message texts, so message HTML is neither reparsed nor re-read.
+    Raw sources of nodes are captured as their inner HTML.
     """
 
+    def __init__(
+        self,
+        raw_source: str | LexborNode | LexborHTMLParser,
+        options: MessageMetaParsingOptions | None = None,
+        *,
+        message_text: str | None = None,
+        **overrides: Any,
+    ):
+        """
+        :param raw_source: raw source of an object (HTML string, ``LexborHTMLParser``
+            or ``LexborNode``).
+        :param options: parsing options class.
+        :param message_text: already extracted text of the message.
+            If ``None``, the text is extracted from the tree.
+        :param overrides: options overrides.
+        """
+        super().__init__(raw_source, options=options, **overrides)
+        self._message_text = message_text
+
     def _parse(self) -> MessageMeta:
         parse_mapping = {
             MessageType.NEW_ORDER: self.parse_new_order_message,
@@ -42,19 +71,22 @@ class MessageMetaParser(FunPayHTMLObjectParser[MessageMeta, MessageMetaParsingOp
             MessageType.FEEDBACK_REPLY_DELETED: self.parse_feedback_reply_message,
         }
 
-        msg_type = MessageType.get_by_message_text(self.tree.text())
+        text = self._message_text
+        if text is None:
+            text = self.tree.text()
+        msg_type = MessageType.get_by_message_text(text)
 
         if msg_type not in parse_mapping:
-            return MessageMeta(raw_source=self.raw_source, type=msg_type)
+            return MessageMeta(raw_source=self.capture_raw_source(), type=msg_type)
 
         result = parse_mapping[msg_type]()
         result.type = msg_type
         return result
 
     def parse_new_order_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[1].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
             order_desc=links[1].next.text()[2:],  # type: ignore[union-attr]
             buyer_id=int(links[0].attributes['href'].split('/')[-2]),  # type: ignore[union-attr]
@@ -62,10 +94,10 @@ class MessageMetaParser(FunPayHTMLObjectParser[MessageMeta, MessageMetaParsingOp
         )
 
     def parse_order_closed_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
 
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[1].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
             buyer_id=int(links[0].attributes['href'].split('/')[-2]),  # type: ignore[union-attr]
             buyer_username=links[0].text(strip=True),
@@ -74,10 +106,10 @@ class MessageMetaParser(FunPayHTMLObjectParser[MessageMeta, MessageMetaParsingOp
         )
 
     def parse_order_closed_by_admin_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
 
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[1].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
             admin_id=int(links[0].attributes['href'].split('/')[-2]),  # type: ignore[union-attr]
             admin_username=links[0].text(strip=True),
@@ -86,18 +118,18 @@ class MessageMetaParser(FunPayHTMLObjectParser[MessageMeta, MessageMetaParsingOp
         )
 
     def parse_order_reopened_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
 
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[0].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
         )
 
     def parse_order_refunded_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
 
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[2].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
             buyer_id=int(links[1].attributes['href'].split('/')[-2]),  # type: ignore[union-attr]
             buyer_username=links[1].text(strip=True),
@@ -106,29 +138,35 @@ class MessageMetaParser(FunPayHTMLObjectParser[MessageMeta, MessageMetaParsingOp
         )
 
     def parse_order_partially_refunded_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
 
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[0].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
         )
 
     def parse_feedback_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
 
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[1].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
             buyer_id=int(links[0].attributes['href'].split('/')[-2]),  # type: ignore[union-attr]
             buyer_username=links[0].text(strip=True),
         )
 
     def parse_feedback_reply_message(self) -> MessageMeta:
-        links = self.tree.css('a')
+        links = self.tree.css(sel.LINK)
 
         return MessageMeta(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             order_id=links[1].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
             seller_id=int(links[0].attributes['href'].split('/')[-2]),  # type: ignore[union-attr]
             seller_username=links[0].text(strip=True),
         )
+
+    @staticmethod
+    def _serialize_raw_source(source: LexborNode | LexborHTMLParser) -> str | None:
+        if isinstance(source, LexborNode):
+            return inner_html(source)
+        return source.html
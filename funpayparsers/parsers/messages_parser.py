@@ -5,16 +5,27 @@ __all__ = ('MessagesParsingOptions', 'MessagesParser')
 
 from typing import cast
 from dataclasses import dataclass
+from collections.abc import Iterator, AsyncIterator
 
 from selectolax.lexbor import LexborNode
 
+from funpayparsers.aio import Offloader
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.types.enums import MessageType
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import UserBadge
-from funpayparsers.parsers.utils import resolve_messages_senders
+from funpayparsers.parsers.utils import (
+    inner_html,
+    resolve_messages_senders,
+    iter_resolve_messages_senders,
+)
 from funpayparsers.types.messages import Message, MessageMeta
 from funpayparsers.parsers.badge_parser import UserBadgeParser, UserBadgeParsingOptions
-from funpayparsers.parsers.message_meta_parser import MessageMetaParser, MessageMetaParsingOptions
+from funpayparsers.parsers.message_meta_parser import (
+    MessageMetaParser,
+    MessageMetaParsingOptions,
+)
 
 
 @dataclass(frozen=True)
@@ -72,8 +83,45 @@ class MessagesParser(FunPayHTMLObjectParser[list[Message], MessagesParsingOption
     """
 
     def _parse(self) -> list[Message]:
-        messages = []
-        for msg_div in self.tree.css('div.chat-msg-item'):
+        messages = list(self._iter_items())
+
+        if self.options.sort_by_id or self.options.resolve_senders:
+            messages.sort(key=lambda m: m.id)
+
+        if self.options.resolve_senders:
+            resolve_messages_senders(messages)
+        return messages
+
+    def iter_parse(self) -> Iterator[Message]:
+        """
+        Yields messages as soon as they are parsed.
+
+        Messages are yielded in document order, ``sort_by_id`` option is ignored.
+        If ``resolve_senders`` is ``True``, senders are resolved from the preceding
+        heading messages of the document.
+        """
+        stream = self._stream(self._iter_items())
+        if self.options.resolve_senders:
+            return iter_resolve_messages_senders(stream)
+        return stream
+
+    def aiter_parse(
+        self, offloader: Offloader | None = None, batch_size: int = 1
+    ) -> AsyncIterator[Message]:
+        """
+        Asynchronously yields messages as soon as they are parsed.
+
+        Parsing is offloaded to an executor, so it doesn't block the event loop.
+        Messages are yielded the same way ``iter_parse()`` yields them.
+
+        :param offloader: offloader to run parsing with.
+            Defaults to ``funpayparsers.aio.get_default_offloader()``.
+        :param batch_size: amount of messages, parsed in a single executor call.
+        """
+        return self._aiter_stream(self.iter_parse(), offloader, batch_size)
+
+    def _iter_items(self) -> Iterator[Message]:
+        for msg_div in self.tree.css(sel.MESSAGE):
             userid, username, date, badge = None, None, None, None
             has_header = 'chat-msg-with-head' in msg_div.attributes['class']  # type: ignore[operator]
             # always has a class
@@ -81,50 +129,47 @@ class MessagesParser(FunPayHTMLObjectParser[list[Message], MessagesParsingOption
             if has_header:
                 userid, username, date, badge = self._parse_message_header(msg_div)
 
-            if image_tag := msg_div.css('a.chat-img-link'):
-                image_url, text, text_html = image_tag[0].attributes['href'], None, ''
+            if image_tag := msg_div.css(sel.MESSAGE_IMAGE_LINK):
+                image_url, text, text_div = image_tag[0].attributes['href'], None, None
             else:
                 image_url = None
 
                 # Every FunPay *system* message is heading, so we will know sender id
-                text_div = msg_div.css('div.chat-msg-text')[0]
-                text_html = ''.join(i.html or '' for i in text_div.iter(include_text=True))
+                text_div = msg_div.css(sel.MESSAGE_TEXT)[0]
                 text = text_div.text()
 
             if userid != 0:
-                meta = MessageMeta(raw_source=text_html, type=MessageType.NON_SYSTEM)
+                meta = MessageMeta(
+                    raw_source=self.capture_raw_source(text_div, inner_html)
+                    if text_div is not None
+                    else '',
+                    type=MessageType.NON_SYSTEM,
+                )
             else:
                 meta = MessageMetaParser(
-                    raw_source=text_html, options=self.options.message_meta_parsing_options
+                    raw_source=text_div if text_div is not None else '',
+                    options=self.options.message_meta_parsing_options,
+                    message_text=text,
                 ).parse()
 
-            messages.append(
-                Message(
-                    raw_source=msg_div.html or '',
-                    id=int(
-                        msg_div.attributes['id'].split('-')[1]  # type: ignore[union-attr]
-                        # always has an id
-                    ),
-                    is_heading=has_header,
-                    sender_id=userid,
-                    sender_username=username,
-                    send_date_text=date,
-                    badge=badge,
-                    text=text,
-                    image_url=image_url,
-                    chat_id=self.options.context.get('chat_id'),
-                    chat_name=self.options.context.get('chat_name'),
-                    meta=meta,
-                )
+            yield Message(
+                raw_source=self.capture_raw_source(msg_div),
+                id=int(
+                    msg_div.attributes['id'].split('-')[1]  # type: ignore[union-attr]
+                    # always has an id
+                ),
+                is_heading=has_header,
+                sender_id=userid,
+                sender_username=intern_string(username),
+                send_date_text=date,
+                badge=badge,
+                text=text,
+                image_url=image_url,
+                chat_id=self.options.context.get('chat_id'),
+                chat_name=self.options.context.get('chat_name'),
+                meta=meta,
             )
 
-        if self.options.sort_by_id or self.options.resolve_senders:
-            messages.sort(key=lambda m: m.id)
-
-        if self.options.resolve_senders:
-            resolve_messages_senders(messages)
-        return messages
-
     def _parse_message_header(self, msg_tag: LexborNode) -> tuple[int, str, str, UserBadge | None]:
         """
         Parses the message header to extract the author ID, author nickname,
@@ -140,14 +185,14 @@ class MessagesParser(FunPayHTMLObjectParser[list[Message], MessagesParsingOption
 
         id_, name = 0, 'FunPay'
 
-        if user_tag := msg_tag.css('a.chat-msg-author-link'):
+        if user_tag := msg_tag.css(sel.MESSAGE_AUTHOR_LINK):
             id_ = int(user_tag[0].attributes['href'].split('/')[-2])  # type: ignore[union-attr]
             # always has href
             name = user_tag[0].text(strip=True)
 
-        date = cast(str, msg_tag.css('div.chat-msg-date')[0].attributes['title'])
+        date = cast(str, msg_tag.css(sel.MESSAGE_DATE)[0].attributes['title'])
 
-        if not (badge := msg_tag.css('span.label')):
+        if not (badge := msg_tag.css(sel.BADGE)):
             return id_, name, date, None
 
         return (
@@ -155,7 +200,7 @@ class MessagesParser(FunPayHTMLObjectParser[list[Message], MessagesParsingOption
             name,
             date,
             UserBadgeParser(
-                raw_source=badge[0].html or '',
+                raw_source=badge[0],
                 options=self.options.user_badge_parsing_options,
             ).parse(),
         )
@@ -6,7 +6,11 @@ __all__ = ('MoneyValueParser', 'MoneyValueParsingOptions', 'MoneyValueParsingMod
 from typing import cast
 from dataclasses import dataclass
 from enum import Enum
+from decimal import Decimal
 
+from selectolax.lexbor import LexborNode
+
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import MoneyValue
 from funpayparsers.parsers.utils import parse_money_value_string
@@ -56,6 +60,15 @@ class MoneyValueParsingOptions(ParsingOptions):
     Defaults to ``True``.
     """
 
+    exact: bool = False
+    """
+    Whether to represent money values as ``decimal.Decimal`` instead of ``float``.
+
+    Exact values can be summed up without accumulating floating point errors.
+
+    Defaults to ``False``.
+    """
+
 
 class MoneyValueParser(FunPayHTMLObjectParser[MoneyValue, MoneyValueParsingOptions]):
     """
@@ -70,41 +83,65 @@ class MoneyValueParser(FunPayHTMLObjectParser[MoneyValue, MoneyValueParsingOptio
     """
 
     def _parse(self) -> MoneyValue:
-        types = {
-            MoneyValueParsingMode.FROM_ORDER_PREVIEW: self._parse_order_preview_type,
-            MoneyValueParsingMode.FROM_TRANSACTION_PREVIEW: self._parse_transaction_preview_type,
-            MoneyValueParsingMode.FROM_OFFER_PREVIEW: self._parse_offer_preview_type,
-            MoneyValueParsingMode.FROM_STRING: self._parse_string_type,
-        }
-        return types[self.options.parsing_mode]()
+        mode = self.options.parsing_mode
+        if mode is MoneyValueParsingMode.FROM_STRING:
+            return self._parse_string_type()
+        if mode is MoneyValueParsingMode.FROM_OFFER_PREVIEW:
+            return self._parse_offer_preview_type()
+        if mode is MoneyValueParsingMode.FROM_ORDER_PREVIEW:
+            return self._parse_order_preview_type()
+        return self._parse_transaction_preview_type()
+
+    def _price_div(self) -> LexborNode:
+        """
+        Returns the price node (``div.tc-price``).
+
+        Composite parsers pass the price node itself, so it is taken as is,
+        without a selector call.
+        """
+        tree = self.tree
+        if isinstance(tree, LexborNode) and tree.tag == 'div':
+            css_class = tree.attributes.get('class')
+            if css_class and 'tc-price' in css_class.split():
+                return tree
+        return cast(LexborNode, tree.css_first(sel.PRICE))
 
     def _parse_order_preview_type(self) -> MoneyValue:
-        val = self.tree.css_first('div.tc-price')
+        val = self._price_div()
         return parse_money_value_string(
             val.text().strip(),
-            raw_source=val.html or '',
+            raw_source=self.capture_raw_source(val),
             raise_on_error=True,
+            exact=self.options.exact,
         )
 
     def _parse_transaction_preview_type(self) -> MoneyValue:
-        val = self.tree.css_first('div.tc-price')
+        val = self._price_div()
         return parse_money_value_string(
             val.text().strip(),
-            raw_source=val.html,
+            raw_source=self.capture_raw_source(val),
             raise_on_error=True,
+            exact=self.options.exact,
         )
 
     def _parse_offer_preview_type(self) -> MoneyValue:
-        div = self.tree.css_first('div.tc-price')
-        val_str = div.css('div')[0].text().strip()
+        div = self._price_div()
+        val_str = div.css(sel.DIV)[0].text().strip()
         value = parse_money_value_string(
             val_str,
-            raw_source=div.html,
+            raw_source=self.capture_raw_source(div),
             raise_on_error=True,
+            exact=self.options.exact,
         )
         if self.options.parse_value_from_attribute:
-            value.value = float(cast(str, div.attributes.get('data-s')))
+            data_s = cast(str, div.attributes.get('data-s'))
+            value.value = Decimal(data_s) if self.options.exact else float(data_s)
         return value
 
     def _parse_string_type(self) -> MoneyValue:
-        return parse_money_value_string(self.raw_source, raise_on_error=True)
+        return parse_money_value_string(
+            self.raw_source,
+            raw_source=self.capture_raw_source(),
+            raise_on_error=True,
+            exact=self.options.exact,
+        )
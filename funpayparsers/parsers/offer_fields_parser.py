@@ -5,6 +5,7 @@ __all__ = ('OfferFieldsParser', 'OfferFieldsParsingOptions')
 
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.offers import OfferFields
 from funpayparsers.parsers.utils import serialize_form
@@ -28,8 +29,8 @@ class OfferFieldsParser(FunPayHTMLObjectParser[OfferFields, OfferFieldsParsingOp
     """
 
     def _parse(self) -> OfferFields:
-        form = self.tree.css('div.page-content > form')[0]
+        form = self.tree.css(sel.OFFER_FIELDS_FORM)[0]
         return OfferFields(
-            raw_source=form.html or '',
+            raw_source=self.capture_raw_source(form),
             fields_dict=serialize_form(form),
         )
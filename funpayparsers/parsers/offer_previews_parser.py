@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 
-__all__ = ('OfferPreviewsParser', 'OfferPreviewsParsingOptions')
+__all__ = ('OfferPreviewsParser', 'OfferPreviewsParsingOptions', 'OfferPreviewAttributes')
 
 import re
+import math
+from typing import Any, Callable
 from dataclasses import dataclass
 from copy import deepcopy
+from array import array
+from collections.abc import Iterator, AsyncIterator
 
 from selectolax.lexbor import LexborNode
 
+from funpayparsers.aio import Offloader
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.offers import OfferSeller, OfferPreview
-from funpayparsers.parsers.utils import extract_css_url
+from funpayparsers.parsers.utils import extract_css_url, parse_money_value_string
+from funpayparsers.types.columns import DictionaryColumn, OfferPreviewColumns
 from funpayparsers.parsers.money_value_parser import (
     MoneyValueParser,
     MoneyValueParsingMode,
@@ -33,6 +41,121 @@ class OfferPreviewsParsingOptions(ParsingOptions):
     Defaults to ``UserPreviewParsingOptions()``.
     """
 
+    filter: Callable[[OfferPreviewAttributes], bool] | None = None
+    """
+    Offer previews filter.
+
+    Called with an ``OfferPreviewAttributes`` view of every offer preview node before
+    the offer preview is parsed. Offer previews, for which it returns ``False``,
+    are skipped without parsing the seller, the price and the other data.
+
+    Defaults to ``None`` (no filtering).
+    """
+
+    limit: int | None = None
+    """
+    Max amount of offer previews to parse.
+
+    Parsing stops as soon as ``limit`` offer previews (that passed ``filter``) are parsed,
+    the rest of the nodes are not even looked at.
+
+    Defaults to ``None`` (no limit).
+    """
+
+
+class OfferPreviewAttributes:
+    """
+    Cheap view of an offer preview node, passed to ``OfferPreviewsParsingOptions.filter``.
+
+    All values are taken from node attributes (and, for currency offers price,
+    from the price node text), no nested parsers are involved.
+
+    Examples:
+        >>> from selectolax.lexbor import LexborHTMLParser
+        >>> node = LexborHTMLParser(
+        ...     '<a href="https://funpay.com/lots/offer?id=1" class="tc-item" data-auto="1" '
+        ...     'data-server="97"><div class="tc-price" data-s="10.5"><div>11 ₽</div></div></a>'
+        ... ).css_first(sel.OFFER_PREVIEW)
+        >>> attrs = OfferPreviewAttributes(node)
+        >>> attrs.id, attrs.auto_delivery, attrs.online, attrs.price, attrs.data
+        (1, True, False, 10.5, {'auto': 1, 'server': 97})
+    """
+
+    __slots__ = ('node', 'attributes')
+
+    def __init__(self, node: LexborNode) -> None:
+        """
+        :param node: ``a.tc-item`` node.
+        """
+        self.node = node
+        self.attributes: dict[str, str | None] = node.attributes
+        """Node attributes."""
+
+    @property
+    def id(self) -> int | str:
+        """Offer ID."""
+        offer_id_str = self.attributes['href'].split('id=')[1]  # type: ignore[union-attr] # always has href
+        return int(offer_id_str) if offer_id_str.isnumeric() else offer_id_str
+
+    @property
+    def is_currency(self) -> bool:
+        """Whether the offer is a currency offer."""
+        return 'chips' in self.attributes['href']  # type: ignore[operator] # always has href
+
+    @property
+    def online(self) -> bool:
+        """Whether the seller is online (``data-online``)."""
+        return bool(self.attributes.get('data-online'))
+
+    @property
+    def auto_delivery(self) -> bool:
+        """Whether auto delivery is enabled (``data-auto``)."""
+        return bool(self.attributes.get('data-auto'))
+
+    @property
+    def price(self) -> float | None:
+        """
+        Offer price.
+
+        Taken from ``data-s`` attribute of the price node. Currency offers store
+        the minimal purchase amount there instead, so their price is taken from the price
+        node text (as ``float`` in both cases, even if money values are parsed
+        as ``Decimal``'s).
+        """
+        price_div = self.node.css_first(sel.PRICE)
+        if price_div is None:
+            return None
+
+        if not self.is_currency:
+            price_str = price_div.attributes.get('data-s')
+            return float(price_str) if price_str else None
+
+        value_div = price_div.css_first(sel.DIV)
+        value = parse_money_value_string(value_div.text()) if value_div is not None else None
+        return float(value.value) if value is not None else None
+
+    @property
+    def data(self) -> dict[str, str | int]:
+        """
+        ``data-*`` attributes without ``data-`` prefix, converted the same way
+        as in ``OfferPreview.other_data`` (``data-online`` and ``data-auto`` included).
+        """
+        return {
+            key[5:]: int(value) if value.isnumeric() else value
+            for key, value in self.attributes.items()
+            if key.startswith('data-') and value is not None
+        }
+
+    def get(self, name: str, default: Any = None) -> str | Any:
+        """
+        Returns a raw ``data-<name>`` attribute value.
+
+        :param name: attribute name without ``data-`` prefix.
+        :param default: value to return if there is no such attribute.
+        """
+        value = self.attributes.get(f'data-{name}')
+        return default if value is None else value
+
 
 class OfferPreviewsParser(
     FunPayHTMLObjectParser[list[OfferPreview], OfferPreviewsParsingOptions],
@@ -47,8 +170,31 @@ class OfferPreviewsParser(
     """
 
     def _parse(self) -> list[OfferPreview]:
-        result = []
+        return list(self._iter_items())
+
+    def iter_parse(self) -> Iterator[OfferPreview]:
+        """
+        Yields offer previews as soon as they are parsed.
+
+        The consumer can stop early without parsing the rest of the offer previews.
+        """
+        return self._stream(self._iter_items())
 
+    def aiter_parse(
+        self, offloader: Offloader | None = None, batch_size: int = 1
+    ) -> AsyncIterator[OfferPreview]:
+        """
+        Asynchronously yields offer previews as soon as they are parsed.
+
+        Parsing is offloaded to an executor, so it doesn't block the event loop.
+
+        :param offloader: offloader to run parsing with.
+            Defaults to ``funpayparsers.aio.get_default_offloader()``.
+        :param batch_size: amount of offer previews, parsed in a single executor call.
+        """
+        return self._aiter_stream(self.iter_parse(), offloader, batch_size)
+
+    def _iter_items(self) -> Iterator[OfferPreview]:
         # don't add these data-fields to OfferPreview.other_data,
         # cz there are specific fields in OfferPreview class for them.
         skip_data = ['data-online', 'data-auto']
@@ -58,44 +204,34 @@ class OfferPreviewsParser(
         skip_match_data = ['user', 'online', 'auto']
 
         processed_users: dict[str, OfferSeller] = {}
+        filter_, limit = self.options.filter, self.options.limit
+        if limit is not None and limit < 1:
+            return
+
+        for offer_div in self.tree.css(sel.OFFER_PREVIEW):
+            attributes = offer_div.attributes
+            if filter_ is not None and not filter_(OfferPreviewAttributes(offer_div)):
+                continue
 
-        for offer_div in self.tree.css('a.tc-item'):
-            url: str = offer_div.attributes['href']  # type: ignore[assignment] # always has href
+            url: str = attributes['href']  # type: ignore[assignment] # always has href
             offer_id_str = url.split('id=')[1]
-            desc_divs = offer_div.css('div.tc-desc-text')
+            desc_divs = offer_div.css(sel.OFFER_DESC)
             # currency offers don't have description.
             desc = desc_divs[0].text(strip=True) if desc_divs else None
 
-            # Currency offers have 'data-s' attribute in tc-amount div,
-            # where amount is stored.
-            #
-            # Common offers don't have it, so we need to parse tc-amount divs text.
-            #
-            # Common offers don't have tc-amount div, if the seller didn't
-            # specify the amount of goods.
-            amount_div = offer_div.css('div.tc-amount')
-            if amount_div:
-                amount_str = amount_div[0].attributes.get('data-s') or amount_div[0].text(
-                    strip=True
-                )
-                amount = int(amount_str) if amount_str.isnumeric() else None
-            else:
-                amount = None
-
-            price_div = offer_div.css('div.tc-price')[0]
+            amount = _offer_amount(offer_div)
+            price_div = offer_div.css(sel.PRICE)[0]
             price = MoneyValueParser(
-                price_div.html or '',
+                price_div,
                 options=self.options.money_value_parsing_options,
                 parsing_mode=MoneyValueParsingMode.FROM_OFFER_PREVIEW,
-                parse_value_from_attribute=(
-                    False if 'chips' in offer_div.attributes['href'] else True  # type: ignore[operator]
-                ),
+                parse_value_from_attribute='chips' not in url,
             ).parse()
 
             seller = self._parse_user_tag(offer_div, processed_users)
 
             additional_data: dict[str, str | int] = {}
-            for key, data in offer_div.attributes.items():
+            for key, data in attributes.items():
                 if not key.startswith('data-') or key in skip_data:
                     continue
                 if data is None:
@@ -105,47 +241,106 @@ class OfferPreviewsParser(
                 )
 
             names = {}
-            for data_key in additional_data:
-                if data_key in skip_match_data:
-                    continue
-                divs = offer_div.css(f'div.tc-{data_key}')
-                if not divs:
-                    continue
-                names[data_key] = divs[0].text(strip=True)
-
-            result.append(
-                OfferPreview(
-                    raw_source=offer_div.html or '',
-                    id=int(offer_id_str) if offer_id_str.isnumeric() else offer_id_str,
-                    auto_delivery=bool(offer_div.attributes.get('data-auto')),
-                    is_pinned=bool(offer_div.attributes.get('data-user')),
-                    title=desc,
-                    amount=amount,
-                    price=price,
-                    seller=seller,
-                    other_data=additional_data,
-                    other_data_names=names,
-                )
+            data_keys = [i for i in additional_data if i not in skip_match_data]
+            if data_keys:
+                data_divs = _data_field_divs(offer_div)
+                for data_key in data_keys:
+                    if data_key in data_divs:
+                        names[data_key] = data_divs[data_key].text(strip=True)
+
+            yield OfferPreview(
+                raw_source=self.capture_raw_source(offer_div),
+                id=int(offer_id_str) if offer_id_str.isnumeric() else offer_id_str,
+                auto_delivery=bool(attributes.get('data-auto')),
+                is_pinned='offer-promo' in (attributes.get('class') or '').split(),
+                title=desc,
+                amount=amount,
+                price=price,
+                seller=seller,
+                other_data=additional_data,
+                other_data_names=names,
             )
 
-        return result
+            if limit is not None:
+                limit -= 1
+                if not limit:
+                    return
+
+    def parse_columns(self) -> OfferPreviewColumns:
+        """
+        Parses offer previews into columns (see ``OfferPreviewColumns``)
+        instead of ``OfferPreview`` objects.
+
+        Values are taken from node attributes directly (prices are taken the same way
+        as ``OfferPreviewAttributes.price`` does), no nested parsers are involved and
+        no objects are created per offer preview, so it is much faster than ``parse()``.
+        ``filter`` and ``limit`` options are applied, raw sources are not captured.
+        """
+        try:
+            return self._parse_columns()
+        except Exception as e:
+            raise self._parsing_error() from e
+
+    def _parse_columns(self) -> OfferPreviewColumns:
+        columns = OfferPreviewColumns()
+        ids: list[int | str] = []
+        other_data = columns.other_data
+        filter_, limit = self.options.filter, self.options.limit
+        if limit is not None and limit < 1:
+            return columns
+
+        for offer_div in self.tree.css(sel.OFFER_PREVIEW):
+            attributes = OfferPreviewAttributes(offer_div)
+            if filter_ is not None and not filter_(attributes):
+                continue
+
+            ids.append(attributes.id)
+            price = attributes.price
+            columns.prices.append(math.nan if price is None else price)
+            amount = _offer_amount(offer_div)
+            columns.amounts.append(-1 if amount is None else amount)
+            columns.seller_ids.append(_seller_id(offer_div))
+            columns.online.append(attributes.online)
+            columns.auto_delivery.append(attributes.auto_delivery)
+
+            for key, value in attributes.data.items():
+                if key == 'online' or key == 'auto':
+                    continue
+                column = other_data.get(key)
+                if column is None:
+                    column = other_data[key] = DictionaryColumn()
+                    column.codes.extend([-1] * (len(ids) - 1))  # previous rows
+                column.append(value)
+            for column in other_data.values():
+                if len(column) < len(ids):
+                    column.append(None)
+
+            if limit is not None:
+                limit -= 1
+                if not limit:
+                    break
+
+        if all(isinstance(i, int) for i in ids):
+            columns.ids = array('q', ids)  # type: ignore[arg-type] # all ids are ints
+        else:
+            columns.ids = [str(i) for i in ids]
+        return columns
 
-    @staticmethod
     def _parse_user_tag(
-        offer_tag: LexborNode, processed_users: dict[str, OfferSeller]
+        self, offer_tag: LexborNode, processed_users: dict[str, OfferSeller]
     ) -> OfferSeller | None:
         # If this offer preview is from sellers page,
         # and not from subcategory offers page, there is no user div.
-        user_divs = offer_tag.css('div.tc-user')
+        user_divs = offer_tag.css(sel.OFFER_SELLER)
         if not user_divs:
             return None
 
         user_div = user_divs[0]
-        username = user_div.css('div.media-user-name')[0].text(strip=True)
+        username = user_div.css(sel.MEDIA_USER_NAME)[0].text(strip=True)
         if username in processed_users:
             return deepcopy(processed_users[username])
 
-        avatar_tag = user_div.css_first('div.avatar-photo')
+        avatar_tag = user_div.css_first(sel.AVATAR_PHOTO)
         user_id = int(avatar_tag.attributes['data-href'].split('/')[-2])  # type: ignore[union-attr]
         # always has data-href
         avatar_tag_style: str = avatar_tag.attributes['style']  # type: ignore[assignment]  # always has style
@@ -155,26 +350,26 @@ class OfferPreviewsParser(
         # as "N reviews" (or "No reviews" if there are none).
         # Otherwise, the user sees rating stars along with the number
         # of reviews next to them.
-        stars_amount = len(user_div.css('i.fas'))
+        stars_amount = len(user_div.css(sel.OFFER_SELLER_STAR))
         if stars_amount:
             reviews_amount = int(
-                user_div.css('span.rating-mini-count')[0].text(deep=True, strip=True)
+                user_div.css(sel.OFFER_SELLER_REVIEWS_AMOUNT)[0].text(deep=True, strip=True)
             )
         else:
-            reviews_amount_txt = user_div.css('div.media-user-reviews')[0].text(
+            reviews_amount_txt = user_div.css(sel.MEDIA_USER_REVIEWS)[0].text(
                 deep=True, strip=True
             )
             reviews_amount_find = re.findall(r'\d+', reviews_amount_txt)
             reviews_amount = int(reviews_amount_find[0]) if reviews_amount_find else 0
 
         result = OfferSeller(
-            raw_source=user_div.html or '',
+            raw_source=self.capture_raw_source(user_div),
             id=user_id,
-            username=username,
+            username=intern_string(username),
             online=bool(offer_tag.attributes.get('data-online')),
-            avatar_url=extract_css_url(avatar_tag_style),
+            avatar_url=intern_string(extract_css_url(avatar_tag_style)),
             registration_date_text=(
-                user_div.css('div.media-user-info')[0].text(deep=True, strip=True)
+                user_div.css(sel.MEDIA_USER_INFO)[0].text(deep=True, strip=True)
             ),
             rating=stars_amount,
             reviews_amount=reviews_amount,
@@ -182,3 +377,47 @@ class OfferPreviewsParser(
 
         processed_users[username] = result
         return result
+
+
+def _offer_amount(offer_div: LexborNode) -> int | None:
+    """Returns the amount of goods of an offer preview, if specified."""
+    # Currency offers have 'data-s' attribute in tc-amount div,
+    # where amount is stored.
+    #
+    # Common offers don't have it, so we need to parse tc-amount divs text.
+    #
+    # Common offers don't have tc-amount div, if the seller didn't
+    # specify the amount of goods.
+    amount_div = offer_div.css_first(sel.OFFER_AMOUNT)
+    if amount_div is None:
+        return None
+    amount_str = amount_div.attributes.get('data-s') or amount_div.text(strip=True)
+    return int(amount_str) if amount_str.isnumeric() else None
+
+
+def _seller_id(offer_div: LexborNode) -> int:
+    """Returns the seller ID of an offer preview, ``-1`` if there is no seller."""
+    # Common offers have the seller ID in 'data-user' attribute, currency offers don't,
+    # so it is taken from the seller avatar link.
+    user_id = offer_div.attributes.get('data-user')
+    if user_id and user_id.isnumeric():
+        return int(user_id)
+
+    avatar_tag = offer_div.css_first(sel.OFFER_SELLER_AVATAR)
+    if avatar_tag is None:
+        return -1
+    return int(avatar_tag.attributes['data-href'].split('/')[-2])  # type: ignore[union-attr]
+
+
+def _data_field_divs(offer_div: LexborNode) -> dict[str, LexborNode]:
+    """
+    Collects ``div.tc-<name>`` elements of an offer preview in a single scan.
+
+    :return: ``{<name>: <first div.tc-<name> element>}``.
+    """
+    result: dict[str, LexborNode] = {}
+    for div in offer_div.css(sel.OFFER_DATA_FIELDS):
+        for css_class in (div.attributes.get('class') or '').split():
+            if css_class.startswith('tc-'):
+                result.setdefault(css_class[3:], div)
+    return result
@@ -4,7 +4,11 @@ from __future__ import annotations
 __all__ = ('OrderPreviewsParsingOptions', 'OrderPreviewsParser')
 
 from dataclasses import dataclass
+from collections.abc import Iterator, AsyncIterator
 
+from funpayparsers.aio import Offloader
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.types.enums import OrderStatus
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.orders import OrderPreview, OrderPreviewsBatch
@@ -61,42 +65,61 @@ class OrderPreviewsParser(
     """
 
     def _parse(self) -> OrderPreviewsBatch:
-        result = []
+        next_id = self.tree.css(sel.FORM_CONTINUE)
 
-        for order in self.tree.css('a.tc-item'):
-            status_class: str = order.css('div.tc-status')[0].attributes['class']  # type: ignore[assignment] # always has a class
+        return OrderPreviewsBatch(
+            raw_source=self.capture_raw_source(),
+            orders=list(self._iter_items()),
+            next_order_id=next_id[0].attributes.get('value') if next_id else None,
+        )
+
+    def iter_parse(self) -> Iterator[OrderPreview]:
+        """
+        Yields order previews as soon as they are parsed.
+
+        The consumer can stop early without parsing the rest of the order previews.
+        """
+        return self._stream(self._iter_items())
+
+    def aiter_parse(
+        self, offloader: Offloader | None = None, batch_size: int = 1
+    ) -> AsyncIterator[OrderPreview]:
+        """
+        Asynchronously yields order previews as soon as they are parsed.
+
+        Parsing is offloaded to an executor, so it doesn't block the event loop.
+
+        :param offloader: offloader to run parsing with.
+            Defaults to ``funpayparsers.aio.get_default_offloader()``.
+        :param batch_size: amount of order previews, parsed in a single executor call.
+        """
+        return self._aiter_stream(self.iter_parse(), offloader, batch_size)
+
+    def _iter_items(self) -> Iterator[OrderPreview]:
+        for order in self.tree.css(sel.ORDER_PREVIEW):
+            status_class: str = order.css(sel.ORDER_STATUS)[0].attributes['class']  # type: ignore[assignment] # always has a class
 
             value = MoneyValueParser(
-                order.css('div.tc-price')[0].html or '',
+                order.css(sel.PRICE)[0],
                 options=self.options.money_value_parsing_options,
                 parsing_mode=MoneyValueParsingMode.FROM_ORDER_PREVIEW,
             ).parse()
 
-            user_tag = order.css('div.media-user')[0]
+            user_tag = order.css(sel.MEDIA_USER)[0]
             counterparty = UserPreviewParser(
-                user_tag.html or '',
+                user_tag,
                 options=self.options.user_preview_parsing_options,
                 parsing_mode=UserPreviewParsingMode.FROM_ORDER_PREVIEW,
             ).parse()
 
-            result.append(
-                OrderPreview(
-                    raw_source=order.html or '',
-                    id=order.attributes['href'].split('/')[-2],  # type: ignore[union-attr]
-                    # always has href
-                    date_text=order.css('div.tc-date-time')[0].text(strip=True),
-                    title=order.css('div.order-desc > div')[0].text(deep=False, strip=True),
-                    category_text=order.css('div.text-muted')[0].text(strip=True),
-                    status=OrderStatus.get_by_css_class(status_class),
-                    total=value,
-                    counterparty=counterparty,
-                )
+            yield OrderPreview(
+                raw_source=self.capture_raw_source(order),
+                id=order.attributes['href'].split('/')[-2],  # type: ignore[union-attr]
+                # always has href
+                date_text=order.css(sel.ORDER_DATE)[0].text(strip=True),
+                title=order.css(sel.ORDER_TITLE)[0].text(deep=False, strip=True),
+                category_text=intern_string(order.css(sel.ORDER_CATEGORY)[0].text(strip=True)),
+                status=OrderStatus.get_by_css_class(status_class),
+                total=value,
+                counterparty=counterparty,
             )
-
-        next_id = self.tree.css('input[type="hidden"][name="continue"]')
-
-        return OrderPreviewsBatch(
-            raw_source=self.raw_source,
-            orders=result,
-            next_order_id=next_id[0].attributes.get('value') if next_id else None,
-        )
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 
 from selectolax.lexbor import LexborNode
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.types.enums import Currency, Language
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import MoneyValue
@@ -43,18 +44,18 @@ class PageHeaderParser(FunPayHTMLObjectParser[PageHeader, PageHeaderParsingOptio
     """
 
     def _parse(self) -> PageHeader:
-        header = self.tree.css('header')[0]
+        header = self.tree.css(sel.HEADER)[0]
 
-        user_dropdown = header.css('a.dropdown-toggle.user-link')
+        user_dropdown = header.css(sel.HEADER_USER_DROPDOWN)
         if user_dropdown:
             return self._parse_authorized_header(header)
         return self._parse_anonymous_header(header)
 
     def _parse_authorized_header(self, header: LexborNode) -> PageHeader:
-        purchases_div = header.css('a.menu-item-orders > span.badge')
-        sales_div = header.css('a.menu-item-trade > span.badge')
-        chats_div = header.css('a.menu-item-chat > span.badge')
-        balance_div = header.css('a.menu-item-balance > span.badge')
+        purchases_div = header.css(sel.HEADER_PURCHASES_COUNTER)
+        sales_div = header.css(sel.HEADER_SALES_COUNTER)
+        chats_div = header.css(sel.HEADER_CHATS_COUNTER)
+        balance_div = header.css(sel.HEADER_BALANCE)
 
         if balance_div:
             money_value = parse_money_value_string(balance_div[0].text().strip())
@@ -64,12 +65,7 @@ class PageHeaderParser(FunPayHTMLObjectParser[PageHeader, PageHeaderParsingOptio
         if money_value is not None:
             currency = money_value.currency
         else:
-            currency_text = (
-                header.css('a.dropdown-toggle.menu-item-currencies')[0]
-                .text(deep=False)
-                .strip()
-                .lower()
-            )
+            currency_text = header.css(sel.HEADER_CURRENCY)[0].text(deep=False).strip().lower()
 
             currency = _CURRENCIES.get(currency_text, Currency.UNKNOWN)
             money_value = MoneyValue(
@@ -79,16 +75,16 @@ class PageHeaderParser(FunPayHTMLObjectParser[PageHeader, PageHeaderParsingOptio
             )
 
         language_class: str = header.css(
-            'a.dropdown-toggle.menu-item-langs > i.menu-icon',
+            sel.HEADER_LANGUAGE_ICON,
         )[0].attributes['class']  # type: ignore[assignment] # always has a class
 
         return PageHeader(
-            raw_source=header.html or '',
+            raw_source=self.capture_raw_source(header),
             user_id=int(
-                header.css('a.user-link-dropdown')[0].attributes['href'].split('/')[-2],  # type: ignore[union-attr] # always has href
+                header.css(sel.HEADER_PROFILE_LINK)[0].attributes['href'].split('/')[-2],  # type: ignore[union-attr] # always has href
             ),
-            username=header.css('div.user-link-name')[0].text().strip(),
-            avatar_url=header.css('img')[0].attributes['src'],
+            username=header.css(sel.HEADER_USERNAME)[0].text().strip(),
+            avatar_url=header.css(sel.IMAGE)[0].attributes['src'],
             language=Language.get_by_header_menu_css_class(language_class),
             currency=currency,
             purchases=int(purchases_div[0].text().strip()) if purchases_div else None,
@@ -98,20 +94,13 @@ class PageHeaderParser(FunPayHTMLObjectParser[PageHeader, PageHeaderParsingOptio
         )
 
     def _parse_anonymous_header(self, header: LexborNode) -> PageHeader:
-        currency_text = (
-            header.css('a.dropdown-toggle.menu-item-currencies')[0]
-            .text(deep=False)
-            .strip()
-            .lower()
-        )
+        currency_text = header.css(sel.HEADER_CURRENCY)[0].text(deep=False).strip().lower()
         currency = _CURRENCIES.get(currency_text, Currency.UNKNOWN)
 
-        language_class: str = header.css('a.dropdown-toggle.menu-item-langs > i.menu-icon')[
-            0
-        ].attributes['class']  # type: ignore[assignment] # always has a class
+        language_class: str = header.css(sel.HEADER_LANGUAGE_ICON)[0].attributes['class']  # type: ignore[assignment] # always has a class
 
         return PageHeader(
-            raw_source=header.html or '',
+            raw_source=self.capture_raw_source(header),
             user_id=None,
             username=None,
             avatar_url=None,
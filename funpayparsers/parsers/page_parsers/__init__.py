@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .base import *
 from .chat_page_parser import *
 from .main_page_parser import *
 from .order_page_parser import *
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+
+__all__ = ('PageParsingOptions', 'FunPayPageParser')
+
+from typing import Any, Type, TypeVar, ClassVar
+from dataclasses import fields, dataclass
+from abc import ABC
+from collections.abc import Iterable
+
+from selectolax.lexbor import LexborNode, LexborHTMLParser
+
+from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
+from funpayparsers.types.pages.base import FunPayPage
+
+
+PageType = TypeVar('PageType', bound=FunPayPage)
+PageOptionsClass = TypeVar('PageOptionsClass', bound='PageParsingOptions')
+
+
+@dataclass(frozen=True)
+class PageParsingOptions(ParsingOptions):
+    """
+    Base class for page parsers option dataclasses.
+
+    Examples:
+        >>> PageParsingOptions(fields=['header']).fields
+        frozenset({'header'})
+    """
+
+    fields: Iterable[str] | None = None
+    """
+    Names of page fields to parse.
+
+    Fields, that are not requested, are set to ``funpayparsers.types.NOT_PARSED``
+    and the parsers of these fields are not run at all.
+    Unknown field names cause ``ValueError`` on parser creation.
+
+    Converted to ``frozenset``.
+
+    Defaults to ``None`` (all fields).
+    """
+
+    def __post_init__(self) -> None:
+        if self.fields is not None and not isinstance(self.fields, frozenset):
+            object.__setattr__(self, 'fields', frozenset(self.fields))
+
+
+class FunPayPageParser(FunPayHTMLObjectParser[PageType, PageOptionsClass], ABC):
+    """Base parser for all page parsers."""
+
+    __page_cls__: ClassVar[Type[FunPayPage]]
+    """Page class, that is used to validate ``PageParsingOptions.fields``."""
+
+    def __init__(
+        self,
+        raw_source: str | LexborNode | LexborHTMLParser,
+        options: PageOptionsClass | None = None,
+        **overrides: Any,
+    ):
+        """
+        :param raw_source: raw source of a page (HTML string, ``LexborHTMLParser``
+            or ``LexborNode``).
+        :param options: parsing options class.
+        :param overrides: options overrides.
+
+        :raises ValueError: if ``fields`` option contains unknown field names.
+        """
+        super().__init__(raw_source=raw_source, options=options, **overrides)
+        if self.options.fields is not None:
+            unknown = set(self.options.fields) - _page_fields(self.__page_cls__)
+            if unknown:
+                raise ValueError(
+                    f'Unknown {self.__page_cls__.__name__} fields: {", ".join(sorted(unknown))}.'
+                )
+
+    def _requested(self, field_name: str) -> bool:
+        """Whether the page field is requested via ``fields`` option."""
+        return self.options.fields is None or field_name in self.options.fields
+
+
+_PAGE_FIELDS: dict[Type[FunPayPage], frozenset[str]] = {}
+
+
+def _page_fields(page_cls: Type[FunPayPage]) -> frozenset[str]:
+    result = _PAGE_FIELDS.get(page_cls)
+    if result is None:
+        result = _PAGE_FIELDS[page_cls] = frozenset(
+            i.name for i in fields(page_cls) if i.name != 'raw_source'
+        )
+    return result
@@ -5,10 +5,13 @@ __all__ = ('ChatPageParsingOptions', 'ChatPageParser')
 
 from dataclasses import dataclass
 
-from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.types.base import NOT_PARSED
+from funpayparsers.types.chat import Chat, PrivateChatInfo, PrivateChatPreview
 from funpayparsers.parsers.chat_parser import ChatParser, ChatParsingOptions
 from funpayparsers.types.pages.chat_page import ChatPage
 from funpayparsers.parsers.appdata_parser import AppDataParser, AppDataParsingOptions
+from funpayparsers.parsers.page_parsers.base import FunPayPageParser, PageParsingOptions
 from funpayparsers.parsers.page_header_parser import (
     PageHeaderParser,
     PageHeaderParsingOptions,
@@ -24,7 +27,7 @@ from funpayparsers.parsers.private_chat_info_parser import (
 
 
 @dataclass(frozen=True)
-class ChatPageParsingOptions(ParsingOptions):
+class ChatPageParsingOptions(PageParsingOptions):
     """Options class for ``ChatPageParser``."""
 
     page_header_parsing_options: PageHeaderParsingOptions = PageHeaderParsingOptions()
@@ -68,50 +71,61 @@ class ChatPageParsingOptions(ParsingOptions):
     """
 
 
-class ChatPageParser(FunPayHTMLObjectParser[ChatPage, ChatPageParsingOptions]):
+class ChatPageParser(FunPayPageParser[ChatPage, ChatPageParsingOptions]):
     """
     Class for parsing chat pages (`https://funpay.com/chat/?node=<chat_id>`).
     """
 
-    def _parse(self) -> ChatPage:
-        chat_preview_div = self.tree.css('div.contact-list')
-        chat_divs = self.tree.css('div.chat:not(.chat-not-selected)')
-        if not chat_divs:
-            chat = None
-        else:
-            chat = ChatParser(
-                raw_source=chat_divs[0].html or '',
-                options=self.options.chat_parsing_options,
-            ).parse()
-
-        if not chat_divs:
-            chat_info = None
-        else:
-            chat_info_divs = self.tree.css('div.chat-detail-list:has(*)')
-            if not chat_info_divs:
-                chat_info = None
-            else:
-                chat_info = PrivateChatInfoParser(
-                    raw_source=chat_info_divs[0].html or '',
-                    options=self.options.private_chat_info_parsing_options,
-                ).parse()
+    __page_cls__ = ChatPage
 
+    def _parse(self) -> ChatPage:
         return ChatPage(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             header=PageHeaderParser(
-                self.tree.css_first('header').html or '',
+                self.tree.css_first(sel.HEADER),
                 options=self.options.page_header_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('header')
+            else NOT_PARSED,
             app_data=AppDataParser(
-                self.tree.css_first('body').attributes['data-app-data'] or '',
+                self.tree.css_first(sel.BODY).attributes['data-app-data'] or '',
                 options=self.options.app_data_parsing_options,
-            ).parse(),
-            chat_previews=PrivateChatPreviewsParser(
-                chat_preview_div[0].html or '',
-                options=self.options.private_chat_previews_parsing_options,
             ).parse()
-            if chat_preview_div
-            else None,
-            chat=chat,
-            chat_info=chat_info,
+            if self._requested('app_data')
+            else NOT_PARSED,
+            chat_previews=self._parse_chat_previews()
+            if self._requested('chat_previews')
+            else NOT_PARSED,
+            chat=self._parse_chat() if self._requested('chat') else NOT_PARSED,
+            chat_info=self._parse_chat_info() if self._requested('chat_info') else NOT_PARSED,
         )
+
+    def _parse_chat_previews(self) -> list[PrivateChatPreview] | None:
+        chat_preview_div = self.tree.css(sel.CHAT_PREVIEWS_LIST)
+        if not chat_preview_div:
+            return None
+        return PrivateChatPreviewsParser(
+            chat_preview_div[0],
+            options=self.options.private_chat_previews_parsing_options,
+        ).parse()
+
+    def _parse_chat(self) -> Chat | None:
+        chat_divs = self.tree.css(sel.SELECTED_CHAT)
+        if not chat_divs:
+            return None
+        return ChatParser(
+            raw_source=chat_divs[0],
+            options=self.options.chat_parsing_options,
+        ).parse()
+
+    def _parse_chat_info(self) -> PrivateChatInfo | None:
+        if not self.tree.css(sel.SELECTED_CHAT):
+            return None
+
+        chat_info_divs = self.tree.css(sel.NON_EMPTY_CHAT_DETAIL_LIST)
+        if not chat_info_divs:
+            return None
+        return PrivateChatInfoParser(
+            raw_source=chat_info_divs[0],
+            options=self.options.private_chat_info_parsing_options,
+        ).parse()
@@ -5,7 +5,10 @@ __all__ = ('MainPageParser', 'MainPageParsingOptions')
 
 from dataclasses import dataclass
 
-from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.types.base import NOT_PARSED
+from funpayparsers.types.chat import Chat
+from funpayparsers.types.categories import Category
 from funpayparsers.parsers.chat_parser import ChatParser, ChatParsingOptions
 from funpayparsers.types.pages.main_page import MainPage
 from funpayparsers.parsers.appdata_parser import AppDataParser, AppDataParsingOptions
@@ -13,6 +16,7 @@ from funpayparsers.parsers.categories_parser import (
     CategoriesParser,
     CategoriesParsingOptions,
 )
+from funpayparsers.parsers.page_parsers.base import FunPayPageParser, PageParsingOptions
 from funpayparsers.parsers.page_header_parser import (
     PageHeaderParser,
     PageHeaderParsingOptions,
@@ -20,7 +24,7 @@ from funpayparsers.parsers.page_header_parser import (
 
 
 @dataclass(frozen=True)
-class MainPageParsingOptions(ParsingOptions):
+class MainPageParsingOptions(PageParsingOptions):
     """Options class for ``MainPageParser``."""
 
     page_header_parsing_options: PageHeaderParsingOptions = PageHeaderParsingOptions()
@@ -52,48 +56,64 @@ class MainPageParsingOptions(ParsingOptions):
     """
 
 
-class MainPageParser(FunPayHTMLObjectParser[MainPage, MainPageParsingOptions]):
+class MainPageParser(FunPayPageParser[MainPage, MainPageParsingOptions]):
     """
     Class for parsing the main page (https://funpay.com).
     """
 
+    __page_cls__ = MainPage
+
     def _parse(self) -> MainPage:
-        header_div = self.tree.css('header')[0]
-        categories_divs = self.tree.css('div.promo-game-list')
+        if self._requested('last_categories') or self._requested('categories'):
+            last_categories, categories = self._parse_categories()
+        else:
+            last_categories, categories = NOT_PARSED, NOT_PARSED
+
+        return MainPage(
+            raw_source=self.capture_raw_source(self.tree),
+            header=PageHeaderParser(
+                self.tree.css(sel.HEADER)[0],
+                options=self.options.page_header_parsing_options,
+            ).parse()
+            if self._requested('header')
+            else NOT_PARSED,
+            last_categories=last_categories if self._requested('last_categories') else NOT_PARSED,
+            categories=categories if self._requested('categories') else NOT_PARSED,
+            secret_chat=self._parse_secret_chat()
+            if self._requested('secret_chat')
+            else NOT_PARSED,
+            app_data=AppDataParser(
+                self.tree.css(sel.BODY)[0].attributes.get('data-app-data') or '',
+                self.options.app_data_parsing_options,
+            ).parse()
+            if self._requested('app_data')
+            else NOT_PARSED,
+        )
+
+    def _parse_categories(self) -> tuple[list[Category], list[Category]]:
+        categories_divs = self.tree.css(sel.CATEGORIES_LIST)
         if len(categories_divs) == 1:
             last_categories = []
             categories = CategoriesParser(
-                categories_divs[0].html or '',
+                categories_divs[0],
                 options=self.options.categories_parsing_options,
             ).parse()
         else:
             last_categories = CategoriesParser(
-                categories_divs[0].html or '',
+                categories_divs[0],
                 options=self.options.categories_parsing_options,
             ).parse()
             categories = CategoriesParser(
-                categories_divs[1].html or '',
+                categories_divs[1],
                 options=self.options.categories_parsing_options,
             ).parse()
-
-        secret_chat_div = self.tree.css('div.chat')
-
-        return MainPage(
-            raw_source=self.tree.html or '',
-            header=PageHeaderParser(
-                header_div.html or '',
-                options=self.options.page_header_parsing_options,
-            ).parse(),
-            last_categories=last_categories,
-            categories=categories,
-            secret_chat=ChatParser(
-                secret_chat_div[0].html or '',
-                options=self.options.chat_parsing_options,
-            ).parse()
-            if secret_chat_div
-            else None,
-            app_data=AppDataParser(
-                self.tree.css('body')[0].attributes.get('data-app-data') or '',
-                self.options.app_data_parsing_options,
-            ).parse(),
-        )
+        return last_categories, categories
+
+    def _parse_secret_chat(self) -> Chat | None:
+        secret_chat_div = self.tree.css(sel.CHAT)
+        if not secret_chat_div:
+            return None
+        return ChatParser(
+            secret_chat_div[0],
+            options=self.options.chat_parsing_options,
+        ).parse()
@@ -7,12 +7,14 @@ import re
 from typing import cast
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.types.base import NOT_PARSED
 from funpayparsers.types.enums import OrderStatus, SubcategoryType
 from funpayparsers.types.pages import OrderPage
-from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.parsers.chat_parser import ChatParser, ChatParsingOptions
 from funpayparsers.parsers.appdata_parser import AppDataParser, AppDataParsingOptions
 from funpayparsers.parsers.reviews_parser import ReviewsParser, ReviewsParsingOptions
+from funpayparsers.parsers.page_parsers.base import FunPayPageParser, PageParsingOptions
 from funpayparsers.parsers.page_header_parser import (
     PageHeaderParser,
     PageHeaderParsingOptions,
@@ -20,7 +22,7 @@ from funpayparsers.parsers.page_header_parser import (
 
 
 @dataclass(frozen=True)
-class OrderPageParsingOptions(ParsingOptions):
+class OrderPageParsingOptions(PageParsingOptions):
     """Options class for ``MainPageParser``."""
 
     page_header_parsing_options: PageHeaderParsingOptions = PageHeaderParsingOptions()
@@ -52,75 +54,107 @@ class OrderPageParsingOptions(ParsingOptions):
     """
 
 
-class OrderPageParser(FunPayHTMLObjectParser[OrderPage, OrderPageParsingOptions]):
+class OrderPageParser(FunPayPageParser[OrderPage, OrderPageParsingOptions]):
     """
     Class for parsing order pages (`https://funpay.com/users/<user_id>/`).
     """
 
-    def _parse(self) -> OrderPage:
-        order_header = self.tree.css_first('h1.page-header')
-        order_id = re.search(  # type: ignore[union-attr]
-            r'#[A-Z0-9]{8}',
-            order_header.text(deep=False).strip(),
-        ).group()[1:]
-        order_status = (
-            OrderStatus.REFUNDED
-            if order_header.css('span.text-warning')
-            else OrderStatus.COMPLETED
-            if order_header.css('span.text-success')
-            else OrderStatus.PAID
-        )
+    __page_cls__ = OrderPage
 
-        goods = self.tree.css('ul.order-secrets-list')
-        if not goods:
-            delivered_goods = None
+    def _parse(self) -> OrderPage:
+        order_header = self.tree.css_first(sel.ORDER_PAGE_HEADER)
+        if self._requested('order_id'):
+            order_id = re.search(  # type: ignore[union-attr]
+                r'#[A-Z0-9]{8}',
+                order_header.text(deep=False).strip(),
+            ).group()[1:]
         else:
-            delivered_goods = [i.attributes['data-copy'] or '' for i in goods[0].css('a.btn-copy')]
-
-        data = {}
-        for i in self.tree.css('div.param-item:has(h5):not(:has(ul, ol))'):
-            name = i.css('h5')
-            if not name:
-                continue
-
-            try:
-                value = i.css('div')
-            except Exception:
-                continue
-
-            data[name[0].text().strip().lower()] = value[-1].text().strip()
+            order_id = NOT_PARSED
+
+        if self._requested('order_status'):
+            order_status = (
+                OrderStatus.REFUNDED
+                if order_header.css(sel.ORDER_PAGE_REFUNDED_STATUS)
+                else OrderStatus.COMPLETED
+                if order_header.css(sel.ORDER_PAGE_CLOSED_STATUS)
+                else OrderStatus.PAID
+            )
+        else:
+            order_status = NOT_PARSED
 
-        subcategory_url: str = self.tree.css_first(  # type: ignore[assignment,union-attr]
-            'div.param-item:has(h5):not(:has(ul, ol)) a',
-            strict=False,
-        ).attributes['href']
+        if self._requested('order_subcategory_id') or self._requested('order_subcategory_type'):
+            subcategory_url: str = self.tree.css_first(  # type: ignore[assignment,union-attr]
+                sel.ORDER_PAGE_SUBCATEGORY_LINK,
+                strict=False,
+            ).attributes['href']
+        else:
+            subcategory_url = NOT_PARSED
 
         return OrderPage(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             header=PageHeaderParser(
-                self.tree.css_first('header').html or '',
+                self.tree.css_first(sel.HEADER),
                 options=self.options.page_header_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('header')
+            else NOT_PARSED,
             app_data=AppDataParser(
-                self.tree.css_first('body').attributes['data-app-data'] or '',
+                self.tree.css_first(sel.BODY).attributes['data-app-data'] or '',
                 self.options.app_data_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('app_data')
+            else NOT_PARSED,
             order_id=order_id,
             order_status=order_status,
-            delivered_goods=delivered_goods,
-            images=[cast(str, i.attributes['href']) for i in self.tree.css('a.attachments-thumb')]
-            or None,
-            order_subcategory_id=int(subcategory_url.split('/')[-2]),
-            order_subcategory_type=SubcategoryType.get_by_url(subcategory_url),
+            delivered_goods=self._parse_delivered_goods()
+            if self._requested('delivered_goods')
+            else NOT_PARSED,
+            images=(
+                [cast(str, i.attributes['href']) for i in self.tree.css(sel.ORDER_PAGE_ATTACHMENT)]
+                or None
+            )
+            if self._requested('images')
+            else NOT_PARSED,
+            order_subcategory_id=int(subcategory_url.split('/')[-2])
+            if self._requested('order_subcategory_id')
+            else NOT_PARSED,
+            order_subcategory_type=SubcategoryType.get_by_url(subcategory_url)
+            if self._requested('order_subcategory_type')
+            else NOT_PARSED,
             review=ReviewsParser(
-                self.tree.css_first('div.review-container').html or '',
+                self.tree.css_first(sel.REVIEW),
                 options=self.options.reviews_parsing_options,
             )
             .parse()
-            .reviews[0],
+            .reviews[0]
+            if self._requested('review')
+            else NOT_PARSED,
             chat=ChatParser(
-                self.tree.css_first('div.chat').html or '',
+                self.tree.css_first(sel.CHAT),
                 options=self.options.chat_parsing_options,
-            ).parse(),
-            data=data,
+            ).parse()
+            if self._requested('chat')
+            else NOT_PARSED,
+            data=self._parse_data() if self._requested('data') else NOT_PARSED,
         )
+
+    def _parse_delivered_goods(self) -> list[str] | None:
+        goods = self.tree.css(sel.ORDER_PAGE_GOODS_LIST)
+        if not goods:
+            return None
+        return [i.attributes['data-copy'] or '' for i in goods[0].css(sel.ORDER_PAGE_GOODS_ITEM)]
+
+    def _parse_data(self) -> dict[str, str]:
+        data = {}
+        for i in self.tree.css(sel.ORDER_PAGE_PARAM):
+            name = i.css(sel.PARAM_NAME)
+            if not name:
+                continue
+
+            try:
+                value = i.css(sel.DIV)
+            except Exception:
+                continue
+
+            data[name[0].text().strip().lower()] = value[-1].text().strip()
+        return data
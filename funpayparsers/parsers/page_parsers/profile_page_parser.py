@@ -7,10 +7,14 @@ __all__ = ('ProfilePageParsingOptions', 'ProfilePageParser')
 from typing import cast
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.types.base import NOT_PARSED
+from funpayparsers.types.chat import Chat
 from funpayparsers.types.enums import BadgeType, SubcategoryType
-from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
+from funpayparsers.types.common import UserRating
 from funpayparsers.types.offers import OfferPreview
 from funpayparsers.parsers.utils import extract_css_url
+from funpayparsers.types.reviews import ReviewsBatch
 from funpayparsers.parsers.chat_parser import ChatParser, ChatParsingOptions
 from funpayparsers.parsers.badge_parser import UserBadgeParser, UserBadgeParsingOptions
 from funpayparsers.parsers.rating_parser import (
@@ -20,6 +24,7 @@ from funpayparsers.parsers.rating_parser import (
 from funpayparsers.parsers.appdata_parser import AppDataParser, AppDataParsingOptions
 from funpayparsers.parsers.reviews_parser import ReviewsParser, ReviewsParsingOptions
 from funpayparsers.types.pages.profile_page import ProfilePage
+from funpayparsers.parsers.page_parsers.base import FunPayPageParser, PageParsingOptions
 from funpayparsers.parsers.achievement_parser import (
     AchievementParser,
     AchievementParsingOptions,
@@ -35,7 +40,7 @@ from funpayparsers.parsers.offer_previews_parser import (
 
 
 @dataclass(frozen=True)
-class ProfilePageParsingOptions(ParsingOptions):
+class ProfilePageParsingOptions(PageParsingOptions):
     """Options class for ``ProfilePageParser``."""
 
     page_header_parsing_options: PageHeaderParsingOptions = PageHeaderParsingOptions()
@@ -96,114 +101,144 @@ class ProfilePageParsingOptions(ParsingOptions):
     """
 
 
-class ProfilePageParser(FunPayHTMLObjectParser[ProfilePage, ProfilePageParsingOptions]):
+class ProfilePageParser(FunPayPageParser[ProfilePage, ProfilePageParsingOptions]):
     """
     Class for parsing user profile pages (`https://funpay.com/users/<user_id>/`).
     """
 
-    def _parse(self) -> ProfilePage:
-        profile_header = self.tree.css_first('div.profile-header')
-        reg_date_text_div = profile_header.css('div.param-item')
-        offer_divs = self.tree.css('div.mb20 div.offer')
-        achievements_divs = self.tree.css('div.achievement-item')
-        chat_div = self.tree.css('div.chat')
-
-        # It is better to parse the rating from the reviews block,
-        # because some old profiles have only old type reviews (without rating)
-        # and then there is no full rating block in profile header,
-        # but in the reviews block it is always present when there are any reviews.
-        rating_div = self.tree.css_first('div.param-item.mb10')
-        reviews_div = self.tree.css('div.offer:has(div.dyn-table-body)') if rating_div else None
-
-        badges = []
-        for i in profile_header.css('small.user-badges > span'):
-            badges.append(
-                UserBadgeParser(
-                    i.html or '', options=self.options.user_badge_parsing_options
-                ).parse(),
-            )
+    __page_cls__ = ProfilePage
 
-        for j in badges:
-            if j.type is BadgeType.BANNED:
-                banned = True
-                badges.remove(j)
+    def _parse(self) -> ProfilePage:
+        profile_header = self.tree.css_first(sel.PROFILE_HEADER)
+
+        if self._requested('badge') or self._requested('banned') or self._requested('status_text'):
+            badges = []
+            for i in profile_header.css(sel.PROFILE_BADGES):
+                badges.append(
+                    UserBadgeParser(i, options=self.options.user_badge_parsing_options).parse(),
+                )
+
+            for j in badges:
+                if j.type is BadgeType.BANNED:
+                    banned = True
+                    badges.remove(j)
+                    badge = badges[0] if badges else None
+                    break
+            else:
+                banned = False
                 badge = badges[0] if badges else None
-                break
-        else:
-            banned = False
-            badge = badges[0] if badges else None
-
-        if offer_divs:
-            offers: dict[SubcategoryType, dict[int, list[OfferPreview]]] | None = {
-                SubcategoryType.COMMON: {},
-                SubcategoryType.CURRENCY: {},
-                SubcategoryType.UNKNOWN: {},
-            }
-            for offer_div in offer_divs:
-                url: str = offer_div.css_first('div.offer-list-title a').attributes['href']  # type: ignore[assignment]  # 'a' always contains href.
-                id_ = int(url.split('/')[-2])
-                offers_objs = OfferPreviewsParser(
-                    offer_div.html or '',
-                    options=self.options.offer_previews_parsing_options,
-                ).parse()
-                offers[SubcategoryType.get_by_url(url)][id_] = offers_objs  # type: ignore[index] # it is indexable, stupid mypy.
         else:
-            offers = None
+            banned, badge = NOT_PARSED, NOT_PARSED
 
         return ProfilePage(
-            raw_source=self.tree.html or '',
+            raw_source=self.capture_raw_source(self.tree),
             header=PageHeaderParser(
-                self.tree.css_first('header').html or '',
+                self.tree.css_first(sel.HEADER),
                 options=self.options.page_header_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('header')
+            else NOT_PARSED,
             app_data=AppDataParser(
-                self.tree.css_first('body').attributes['data-app-data'] or '',
+                self.tree.css_first(sel.BODY).attributes['data-app-data'] or '',
                 options=self.options.app_data_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('app_data')
+            else NOT_PARSED,
             user_id=int(
-                self.tree.css_first('head > link[rel="canonical"]')  # type: ignore[union-attr] # need to raise an exception if None.
+                self.tree.css_first(sel.CANONICAL_LINK)  # type: ignore[union-attr] # need to raise an exception if None.
                 .attributes['href']
                 .split('/')[-2],
-            ),
-            username=profile_header.css_first('span.mr4').text().strip(),
-            badge=badge,
+            )
+            if self._requested('user_id')
+            else NOT_PARSED,
+            username=profile_header.css_first(sel.PROFILE_USERNAME).text().strip()
+            if self._requested('username')
+            else NOT_PARSED,
+            badge=badge if self._requested('badge') else NOT_PARSED,
             achievements=[
                 AchievementParser(
-                    i.html or '',
+                    i,
                     options=self.options.achievement_parsing_options,
                 ).parse()
-                for i in achievements_divs
-            ],
+                for i in self.tree.css(sel.ACHIEVEMENT)
+            ]
+            if self._requested('achievements')
+            else NOT_PARSED,
             avatar_url=extract_css_url(
-                cast(str, self.tree.css_first('div.avatar-photo').attributes['style']),
-            ),
-            online='online' in profile_header.css_first('h1.mb40').attributes['class'],  # type: ignore[operator] # always has a class
-            banned=banned,
+                cast(str, self.tree.css_first(sel.AVATAR_PHOTO).attributes['style']),
+            )
+            if self._requested('avatar_url')
+            else NOT_PARSED,
+            online='online' in profile_header.css_first(sel.PROFILE_TITLE).attributes['class']  # type: ignore[operator] # always has a class
+            if self._requested('online')
+            else NOT_PARSED,
+            banned=banned if self._requested('banned') else NOT_PARSED,
             registration_date_text=(
-                reg_date_text_div[0].text(separator='\n', strip=True).strip().split('\n')[-2]
-            ),
+                profile_header.css(sel.PARAM_ITEM)[0]
+                .text(separator='\n', strip=True)
+                .strip()
+                .split('\n')[-2]
+            )
+            if self._requested('registration_date_text')
+            else NOT_PARSED,
             status_text=(
-                profile_header.css_first('span.media-user-status').text().strip()
-                if not banned
-                else None
-            ),
-            rating=UserRatingParser(
-                rating_div.html or '',
-                options=self.options.user_rating_parsing_options,
-            ).parse()
-            if rating_div
-            else None,
-            offers=offers,
-            chat=ChatParser(
-                chat_div[0].html or '',
-                options=self.options.chat_parsing_options,
-            ).parse()
-            if chat_div
-            else None,
-            reviews=ReviewsParser(
-                reviews_div[0].html or '',
-                options=self.options.reviews_parsing_options,
-            ).parse()
-            if reviews_div
-            else None,
+                profile_header.css_first(sel.PROFILE_STATUS).text().strip() if not banned else None
+            )
+            if self._requested('status_text')
+            else NOT_PARSED,
+            rating=self._parse_rating() if self._requested('rating') else NOT_PARSED,
+            offers=self._parse_offers() if self._requested('offers') else NOT_PARSED,
+            chat=self._parse_chat() if self._requested('chat') else NOT_PARSED,
+            reviews=self._parse_reviews() if self._requested('reviews') else NOT_PARSED,
         )
+
+    def _parse_rating(self) -> UserRating | None:
+        # It is better to parse the rating from the reviews block,
+        # because some old profiles have only old type reviews (without rating)
+        # and then there is no full rating block in profile header,
+        # but in the reviews block it is always present when there are any reviews.
+        rating_div = self.tree.css_first(sel.RATING_PARAM)
+        if not rating_div:
+            return None
+        return UserRatingParser(
+            rating_div,
+            options=self.options.user_rating_parsing_options,
+        ).parse()
+
+    def _parse_offers(self) -> dict[SubcategoryType, dict[int, list[OfferPreview]]] | None:
+        offer_divs = self.tree.css(sel.PROFILE_OFFERS)
+        if not offer_divs:
+            return None
+
+        offers: dict[SubcategoryType, dict[int, list[OfferPreview]]] = {
+            SubcategoryType.COMMON: {},
+            SubcategoryType.CURRENCY: {},
+            SubcategoryType.UNKNOWN: {},
+        }
+        for offer_div in offer_divs:
+            url: str = offer_div.css_first(sel.PROFILE_OFFERS_TITLE_LINK).attributes['href']  # type: ignore[assignment]  # 'a' always contains href.
+            id_ = int(url.split('/')[-2])
+            offers[SubcategoryType.get_by_url(url)][id_] = OfferPreviewsParser(
+                offer_div,
+                options=self.options.offer_previews_parsing_options,
+            ).parse()
+        return offers
+
+    def _parse_chat(self) -> Chat | None:
+        chat_div = self.tree.css(sel.CHAT)
+        if not chat_div:
+            return None
+        return ChatParser(chat_div[0], options=self.options.chat_parsing_options).parse()
+
+    def _parse_reviews(self) -> ReviewsBatch | None:
+        # See ``_parse_rating``: reviews block exists only if the rating block exists.
+        if not self.tree.css_first(sel.RATING_PARAM):
+            return None
+
+        reviews_div = self.tree.css(sel.PROFILE_REVIEWS)
+        if not reviews_div:
+            return None
+        return ReviewsParser(
+            reviews_div[0],
+            options=self.options.reviews_parsing_options,
+        ).parse()
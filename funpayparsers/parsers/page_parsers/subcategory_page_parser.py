@@ -5,11 +5,14 @@ __all__ = ('SubcategoryPageParsingOptions', 'SubcategoryPageParser')
 
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.types.base import NOT_PARSED
 from funpayparsers.types.enums import SubcategoryType
 from funpayparsers.types.pages import SubcategoryPage
-from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
+from funpayparsers.types.columns import OfferPreviewColumns
 from funpayparsers.types.categories import Subcategory
 from funpayparsers.parsers.appdata_parser import AppDataParser, AppDataParsingOptions
+from funpayparsers.parsers.page_parsers.base import FunPayPageParser, PageParsingOptions
 from funpayparsers.parsers.page_header_parser import (
     PageHeaderParser,
     PageHeaderParsingOptions,
@@ -21,7 +24,7 @@ from funpayparsers.parsers.offer_previews_parser import (
 
 
 @dataclass(frozen=True)
-class SubcategoryPageParsingOptions(ParsingOptions):
+class SubcategoryPageParsingOptions(PageParsingOptions):
     """Options class for ``SubcategoryPageParser``."""
 
     page_header_parsing_options: PageHeaderParsingOptions = PageHeaderParsingOptions()
@@ -49,7 +52,7 @@ class SubcategoryPageParsingOptions(ParsingOptions):
 
 
 class SubcategoryPageParser(
-    FunPayHTMLObjectParser[
+    FunPayPageParser[
         SubcategoryPage,
         SubcategoryPageParsingOptions,
     ]
@@ -59,47 +62,81 @@ class SubcategoryPageParser(
     (`https://funpay.com/<lots/chips>/<subcategory_id>/`).
     """
 
+    __page_cls__ = SubcategoryPage
+
     def _parse(self) -> SubcategoryPage:
-        showcase = self.tree.css_first('div.showcase')
+        showcase = self.tree.css_first(sel.SHOWCASE)
 
         # lot-ID / chips-ID
         subcategory_id_str: str = showcase.attributes['data-section']  # type: ignore[assignment]
         # always has 'data-section'
-        related_subcategories = []
         subcategory_type = SubcategoryType.get_by_showcase_data_section(subcategory_id_str)
 
-        for i in self.tree.css('a.counter-item'):
-            url: str = i.attributes['href']  # type: ignore[assignment]
-            # 'a' always has 'href'.
-            related_subcategories.append(
-                Subcategory(
-                    raw_source=i.html or '',
-                    id=int(url.split('/')[-2]),
-                    type=subcategory_type,
-                    name=i.css_first('div.counter-param').text().strip(),
-                    offers_amount=int(i.css_first('div.counter-value').text().strip()),
-                )
-            )
-
         return SubcategoryPage(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             header=PageHeaderParser(
-                self.tree.css_first('header').html or '',
+                self.tree.css_first(sel.HEADER),
                 options=self.options.page_header_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('header')
+            else NOT_PARSED,
             app_data=AppDataParser(
-                self.tree.css_first('body').attributes['data-app-data'] or '',
+                self.tree.css_first(sel.BODY).attributes['data-app-data'] or '',
                 options=self.options.app_data_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('app_data')
+            else NOT_PARSED,
             category_id=int(
                 showcase.attributes['data-game']  # type: ignore[arg-type] # always has data-game
             ),
             subcategory_id=int(subcategory_id_str.split('-')[-1]),
             subcategory_type=subcategory_type,
-            related_subcategories=related_subcategories or None,
-            offers=OfferPreviewsParser(
-                showcase.html or '',
-                options=self.options.offer_previews_parsing_options,
-            ).parse()
-            or None,
+            related_subcategories=self._parse_related_subcategories(subcategory_type)
+            if self._requested('related_subcategories')
+            else NOT_PARSED,
+            offers=(
+                OfferPreviewsParser(
+                    showcase,
+                    options=self.options.offer_previews_parsing_options,
+                ).parse()
+                or None
+            )
+            if self._requested('offers')
+            else NOT_PARSED,
         )
+
+    def parse_offer_columns(self) -> OfferPreviewColumns:
+        """
+        Parses only offer previews of the page into columns
+        (see ``OfferPreviewsParser.parse_columns()``).
+
+        Uses ``offer_previews_parsing_options``, other page fields are not parsed.
+
+        :raises ParsingError: if the page has no offers showcase.
+        """
+        showcase = self.tree.css_first(sel.SHOWCASE)
+        if showcase is None:
+            raise self._parsing_error() from ValueError('The page has no offers showcase.')
+
+        return OfferPreviewsParser(
+            showcase,
+            options=self.options.offer_previews_parsing_options,
+        ).parse_columns()
+
+    def _parse_related_subcategories(
+        self, subcategory_type: SubcategoryType
+    ) -> list[Subcategory] | None:
+        related_subcategories = []
+        for i in self.tree.css(sel.RELATED_SUBCATEGORY):
+            url: str = i.attributes['href']  # type: ignore[assignment]
+            # 'a' always has 'href'.
+            related_subcategories.append(
+                Subcategory(
+                    raw_source=self.capture_raw_source(i),
+                    id=int(url.split('/')[-2]),
+                    type=subcategory_type,
+                    name=i.css_first(sel.RELATED_SUBCATEGORY_NAME).text().strip(),
+                    offers_amount=int(i.css_first(sel.RELATED_SUBCATEGORY_OFFERS).text().strip()),
+                )
+            )
+        return related_subcategories or None
@@ -5,10 +5,13 @@ __all__ = ('TransactionsPageParsingOptions', 'TransactionsPageParser')
 
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.types.base import NOT_PARSED
 from funpayparsers.types.enums import Currency
 from funpayparsers.types.pages import TransactionsPage
-from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
+from funpayparsers.types.finances import TransactionPreviewsBatch
 from funpayparsers.parsers.appdata_parser import AppDataParser, AppDataParsingOptions
+from funpayparsers.parsers.page_parsers.base import FunPayPageParser, PageParsingOptions
 from funpayparsers.parsers.money_value_parser import (
     MoneyValueParser,
     MoneyValueParsingMode,
@@ -25,7 +28,7 @@ from funpayparsers.parsers.transaction_previews_parser import (
 
 
 @dataclass(frozen=True)
-class TransactionsPageParsingOptions(ParsingOptions):
+class TransactionsPageParsingOptions(PageParsingOptions):
     """Options class for ``TransactionsPageParser``."""
 
     page_header_parsing_options: PageHeaderParsingOptions = PageHeaderParsingOptions()
@@ -66,46 +69,63 @@ class TransactionsPageParsingOptions(ParsingOptions):
 
 
 class TransactionsPageParser(
-    FunPayHTMLObjectParser[TransactionsPage, TransactionsPageParsingOptions],
+    FunPayPageParser[TransactionsPage, TransactionsPageParsingOptions],
 ):
     """Class for parsing the transactions page (https://funpay.com/account/balance)."""
 
+    __page_cls__ = TransactionsPage
+
     def _parse(self) -> TransactionsPage:
-        money_values = []
-        for i in self.tree.css('span.balances-value'):
-            money_values.append(
-                MoneyValueParser(
-                    i.text().strip(),
-                    options=self.options.money_value_parsing_options,
-                    parsing_mode=MoneyValueParsingMode.FROM_STRING,
-                ).parse(),
-            )
+        if any(self._requested(i) for i in ('rub_balance', 'usd_balance', 'eur_balance')):
+            money_values = []
+            for i in self.tree.css(sel.BALANCE):
+                money_values.append(
+                    MoneyValueParser(
+                        i.text().strip(),
+                        options=self.options.money_value_parsing_options,
+                        parsing_mode=MoneyValueParsingMode.FROM_STRING,
+                    ).parse(),
+                )
+        else:
+            money_values = []
 
         rub_balance = [i for i in money_values if i.currency is Currency.RUB]
         usd_balance = [i for i in money_values if i.currency is Currency.USD]
         eur_balance = [i for i in money_values if i.currency is Currency.EUR]
 
-        transactions_div = self.tree.css('div.tc-finance:not(.hidden)')
-        if not transactions_div:
-            transactions = None
-        else:
-            transactions = TransactionPreviewsParser(
-                transactions_div[0].html or '',
-                options=self.options.transaction_previews_parsing_options,
-            ).parse()
-
         return TransactionsPage(
-            raw_source=self.raw_source,
+            raw_source=self.capture_raw_source(),
             header=PageHeaderParser(
-                self.tree.css_first('header').html or '',
+                self.tree.css_first(sel.HEADER),
                 options=self.options.page_header_parsing_options,
-            ).parse(),
+            ).parse()
+            if self._requested('header')
+            else NOT_PARSED,
             app_data=AppDataParser(
-                self.tree.css_first('body').attributes['data-app-data'] or '',
+                self.tree.css_first(sel.BODY).attributes['data-app-data'] or '',
                 options=self.options.app_data_parsing_options,
-            ).parse(),
-            rub_balance=rub_balance[0] if rub_balance else None,
-            usd_balance=usd_balance[0] if usd_balance else None,
-            eur_balance=eur_balance[0] if eur_balance else None,
-            transactions=transactions,
+            ).parse()
+            if self._requested('app_data')
+            else NOT_PARSED,
+            rub_balance=(rub_balance[0] if rub_balance else None)
+            if self._requested('rub_balance')
+            else NOT_PARSED,
+            usd_balance=(usd_balance[0] if usd_balance else None)
+            if self._requested('usd_balance')
+            else NOT_PARSED,
+            eur_balance=(eur_balance[0] if eur_balance else None)
+            if self._requested('eur_balance')
+            else NOT_PARSED,
+            transactions=self._parse_transactions()
+            if self._requested('transactions')
+            else NOT_PARSED,
         )
+
+    def _parse_transactions(self) -> TransactionPreviewsBatch | None:
+        transactions_div = self.tree.css(sel.TRANSACTIONS_LIST)
+        if not transactions_div:
+            return None
+        return TransactionPreviewsParser(
+            transactions_div[0],
+            options=self.options.transaction_previews_parsing_options,
+        ).parse()
@@ -5,6 +5,7 @@ __all__ = ('PrivateChatInfoParsingOptions', 'PrivateChatInfoParser')
 
 from dataclasses import dataclass
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.types.chat import PrivateChatInfo
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.parsers.cpu_parser import (
@@ -39,11 +40,11 @@ class PrivateChatInfoParser(
     """
 
     def _parse(self) -> PrivateChatInfo:
-        info_div = self.tree.css('div.chat-detail-list')[0]
-        blocks = info_div.css('div.param-item:not(.hidden)')
+        info_div = self.tree.css(sel.CHAT_DETAIL_LIST)[0]
+        blocks = info_div.css(sel.CHAT_DETAIL_ITEM)
 
         result = PrivateChatInfo(
-            raw_source=info_div.html or '',
+            raw_source=self.capture_raw_source(info_div),
             registration_date_text=(
                 blocks[0].text(separator='\n', strip=True).strip().split('\n')[-2]
             ),
@@ -55,13 +56,13 @@ class PrivateChatInfoParser(
         for div in blocks:
             if div.attributes.get('data-type') == 'c-p-u':
                 cpu = CurrentlyViewingOfferInfoParser(
-                    raw_source=div.html or '',
+                    raw_source=div,
                     options=self.options.cpu_parsing_options,
                 ).parse()
                 result.currently_viewing_offer = cpu
             else:
                 result.language = (
-                    div.css('div')[0]
+                    div.css(sel.DIV)[0]
                     .text(separator='\n', strip=True)
                     .strip()
                     .split('\n')[-1]
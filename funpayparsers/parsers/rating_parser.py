@@ -10,6 +10,7 @@ from enum import Enum
 
 from selectolax.lexbor import LexborNode
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import UserRating
 
@@ -57,9 +58,9 @@ class UserRatingParser(FunPayHTMLObjectParser[UserRating, UserRatingParsingOptio
         return self._parse_from_reviews_section()
 
     def _parse_from_profile_header(self) -> UserRating:
-        rating_div = self.tree.css('div.profile-header-col-rating')[0]
+        rating_div = self.tree.css(sel.RATING_COLUMN)[0]
 
-        stars_text = rating_div.css('div.rating-value > span.big')[0].text().strip()
+        stars_text = rating_div.css(sel.RATING_STARS)[0].text().strip()
         try:
             stars = float(stars_text)
         except ValueError:
@@ -67,12 +68,12 @@ class UserRatingParser(FunPayHTMLObjectParser[UserRating, UserRatingParsingOptio
 
         percentage = self._parse_percentage(rating_div)
 
-        reviews_text = rating_div.css('div.rating-full-count')[0].text().replace(' ', '')
+        reviews_text = rating_div.css(sel.RATING_REVIEWS_AMOUNT)[0].text().replace(' ', '')
         match = re.search(r'\d+', reviews_text)
         reviews_amount = int(match.group())  # type: ignore[union-attr] # always has \d+
 
         return UserRating(
-            raw_source=rating_div.html or '',
+            raw_source=self.capture_raw_source(rating_div),
             stars=stars,
             reviews_amount=reviews_amount,
             five_star_reviews_percentage=percentage[4],
@@ -83,8 +84,8 @@ class UserRatingParser(FunPayHTMLObjectParser[UserRating, UserRatingParsingOptio
         )
 
     def _parse_from_reviews_section(self) -> UserRating:
-        rating_div = self.tree.css_first('div.param-item.mb10')
-        stars_text = rating_div.css('div.rating-value > span.big')[0].text().strip()
+        rating_div = self.tree.css_first(sel.RATING_PARAM)
+        stars_text = rating_div.css(sel.RATING_STARS)[0].text().strip()
         try:
             stars = float(stars_text)
         except ValueError:
@@ -92,12 +93,14 @@ class UserRatingParser(FunPayHTMLObjectParser[UserRating, UserRatingParsingOptio
 
         percentage = self._parse_percentage(rating_div)
 
-        reviews_text = rating_div.css_first('div.mb5').text().replace(' ', '')
+        reviews_text = (
+            rating_div.css_first(sel.RATING_PARAM_REVIEWS_AMOUNT).text().replace(' ', '')
+        )
         match = re.search(r'\d+', reviews_text)
         reviews_amount = int(match.group())  # type: ignore[union-attr] # always has \d+
 
         return UserRating(
-            raw_source=rating_div.html or '',
+            raw_source=self.capture_raw_source(rating_div),
             stars=stars,
             reviews_amount=reviews_amount,
             five_star_reviews_percentage=percentage[4],
@@ -108,12 +111,18 @@ class UserRatingParser(FunPayHTMLObjectParser[UserRating, UserRatingParsingOptio
         )
 
     def _parse_percentage(self, rating_div: LexborNode) -> list[float]:
-        percentage: list[float] = []
-        for i in range(1, 6):
-            style: str = rating_div.css(f'div.rating-full-item{i} > div.rating-progress > div')[
-                0
-            ].attributes['style']  # type: ignore[assignment]  # always has a style
+        # Progress bars of all star values are collected in a single scan,
+        # the star value is taken from the ``rating-full-item<N>`` class of a bar container.
+        percentage: dict[int, float] = {}
+        for bar in rating_div.css(sel.RATING_PROGRESS_BARS):
+            item_class: str = bar.parent.parent.attributes['class']  # type: ignore[union-attr,assignment] # always has a class
+            stars = next(
+                int(i.removeprefix('rating-full-item'))
+                for i in item_class.split()
+                if i.startswith('rating-full-item')
+            )
+            style: str = bar.attributes['style']  # type: ignore[assignment]  # always has a style
             value = re.search(r'\d+', style)
-            percentage.append(float(value.group()))  # type: ignore[union-attr] # always has \d+
+            percentage.setdefault(stars, float(value.group()))  # type: ignore[union-attr] # always has \d+
 
-        return percentage
+        return [percentage[i] for i in range(1, 6)]
@@ -8,9 +8,12 @@ __all__ = (
 
 from typing import cast
 from dataclasses import dataclass
+from collections.abc import Iterator
 
 from selectolax.lexbor import LexborNode
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import MoneyValue
 from funpayparsers.types.reviews import Review, ReviewsBatch
@@ -46,30 +49,24 @@ class ReviewsParser(FunPayHTMLObjectParser[ReviewsBatch, ReviewsParsingOptions])
     """
 
     def _parse(self) -> ReviewsBatch:
-        result: list[Review] = []
-
-        for review_div in self.tree.css('div.review-container'):
-            order_id = review_div.attributes.get('data-order')
-
-            if order_id is not None:
-                rating_str = review_div.attributes.get('data-rating')
-                return ReviewsBatch(
-                    raw_source=self.raw_source,
-                    reviews=[self._parse_order_page_review(order_id, rating_str, review_div)],
-                    user_id=None,
-                    filter=None,
-                    next_review_id=None,
-                )
-
-            result.append(self._parse_common_review(review_div))
+        reviews = list(self._iter_items())
+
+        if self.tree.css_first(sel.ORDER_REVIEW) is not None:
+            return ReviewsBatch(
+                raw_source=self.capture_raw_source(),
+                reviews=reviews,
+                user_id=None,
+                filter=None,
+                next_review_id=None,
+            )
 
-        user_id = self.tree.css('input[type="hidden"][name="user_id"]')
-        filter_ = self.tree.css('input[type="hidden"][name="filter"]')
-        next_id = self.tree.css('input[type="hidden"][name="continue"]')
+        user_id = self.tree.css(sel.FORM_USER_ID)
+        filter_ = self.tree.css(sel.FORM_FILTER)
+        next_id = self.tree.css(sel.FORM_CONTINUE)
 
         return ReviewsBatch(
-            raw_source=self.raw_source,
-            reviews=result,
+            raw_source=self.capture_raw_source(),
+            reviews=reviews,
             user_id=int(
                 user_id[0].attributes.get('value')  # type: ignore[arg-type] # always has value
             )
@@ -79,36 +76,59 @@ class ReviewsParser(FunPayHTMLObjectParser[ReviewsBatch, ReviewsParsingOptions])
             next_review_id=next_id[0].attributes.get('value') if next_id else None,
         )
 
+    def iter_parse(self) -> Iterator[Review]:
+        """
+        Yields reviews as soon as they are parsed.
+
+        Unlike ``parse()``, doesn't build a ``ReviewsBatch``, so the consumer
+        can stop early without parsing the rest of the reviews.
+        """
+        return self._stream(self._iter_items())
+
+    def _iter_items(self) -> Iterator[Review]:
+        order_review_div = self.tree.css_first(sel.ORDER_REVIEW)
+        if order_review_div is not None:
+            # Only the review of the order is parsed from order pages, other reviews are ignored.
+            yield self._parse_order_page_review(
+                cast(str, order_review_div.attributes['data-order']),
+                order_review_div.attributes.get('data-rating'),
+                order_review_div,
+            )
+            return
+
+        for review_div in self.tree.css(sel.REVIEW):
+            yield self._parse_common_review(review_div)
+
     def _parse_common_review(self, review_div: LexborNode) -> Review:
         date_str, text, game, value = self._parse_review_meta(review_div)
-        rating_divs = review_div.css(','.join(f'div.rating{i}' for i in range(1, 5 + 1)))
+        rating_divs = review_div.css(sel.REVIEW_RATING)
 
         # old reviews might have no rating
         rating = int(cast(str, rating_divs[0].attributes['class'])[-1]) if rating_divs else None
 
-        order_id_div = review_div.css('div.review-item-order')
+        order_id_div = review_div.css(sel.REVIEW_ORDER)
 
         # "Order #ORDERID"
         order_id = None if not order_id_div else order_id_div[0].text().strip().split()[1][1:]
 
-        user_tag = review_div.css('div.review-item-user')[0]
-        usernames = user_tag.css('div.media-user-name')
+        user_tag = review_div.css(sel.REVIEW_USER)[0]
+        usernames = user_tag.css(sel.MEDIA_USER_NAME)
         username = usernames[0].text().strip() if usernames else None
 
         return Review(
-            raw_source=review_div.html or '',
+            raw_source=self.capture_raw_source(review_div),
             rating=rating,
             text=text.strip(),
             order_total=value,
-            category_str=game,
-            sender_username=username,
+            category_str=intern_string(game),
+            sender_username=intern_string(username),
             sender_id=int(
-                user_tag.css('a')[0].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
+                user_tag.css(sel.LINK)[0].attributes['href'].split('/')[-2],  # type: ignore[union-attr]
                 # always has href
             )
             if username
             else None,
-            sender_avatar_url=user_tag.css('img')[0].attributes['src'],
+            sender_avatar_url=intern_string(user_tag.css(sel.IMAGE)[0].attributes['src']),
             order_id=order_id,
             date_text=date_str,
             reply=self._parse_reply(review_div),
@@ -117,40 +137,38 @@ class ReviewsParser(FunPayHTMLObjectParser[ReviewsBatch, ReviewsParsingOptions])
     def _parse_order_page_review(
         self, order_id: str, rating_str: str | None, review_div: LexborNode
     ) -> Review:
-        author_id_str: str = review_div.css('div.review-item-row[data-row="review"]')[
-            0
-        ].attributes.get('data-author')  # type: ignore[assignment]  # always has data-author
+        author_id_str: str = review_div.css(sel.REVIEW_ROW)[0].attributes.get('data-author')  # type: ignore[assignment]  # always has data-author
         author_id = int(author_id_str)
 
         if rating_str:  # if review exists
             rating = int(rating_str)
             date_str, text, game, value = self._parse_review_meta(review_div)
 
-            user_tag = review_div.css('div.review-item-user')[0]
-            avatar_url = user_tag.css('img')[0].attributes['src']
+            user_tag = review_div.css(sel.REVIEW_USER)[0]
+            avatar_url = user_tag.css(sel.IMAGE)[0].attributes['src']
 
         else:
             rating = text = value = game = avatar_url = date_str = None  # type: ignore[assignment]
 
         return Review(
-            raw_source=review_div.html or '',
+            raw_source=self.capture_raw_source(review_div),
             rating=rating,
             text=text,
             order_total=value,
-            category_str=game,
+            category_str=intern_string(game),
             sender_username=self.options.context.get('sender_username'),
             sender_id=author_id,
-            sender_avatar_url=avatar_url,
+            sender_avatar_url=intern_string(avatar_url),
             order_id=order_id,
             date_text=date_str,
             reply=self._parse_reply(review_div),
         )
 
     def _parse_review_meta(self, review_div: LexborNode) -> tuple[str, str, str, MoneyValue]:
-        date_str = review_div.css('div.review-item-date')[0].text().strip()
-        text = review_div.css('div.review-item-text')[0].text().strip()
+        date_str = review_div.css(sel.REVIEW_DATE)[0].text().strip()
+        text = review_div.css(sel.REVIEW_TEXT)[0].text().strip()
 
-        review_details_str = review_div.css('div.review-item-detail')[0].text().strip()
+        review_details_str = review_div.css(sel.REVIEW_DETAIL)[0].text().strip()
         split = review_details_str.split(', ')
         game, value = ', '.join(split[:-1]), split[-1]
         money_value = MoneyValueParser(
@@ -163,7 +181,7 @@ class ReviewsParser(FunPayHTMLObjectParser[ReviewsBatch, ReviewsParsingOptions])
 
     def _parse_reply(self, review_div: LexborNode) -> str | None:
         reply = None
-        reply_divs = review_div.css('div.review-compiled-reply > div:not([class])')
+        reply_divs = review_div.css(sel.REVIEW_REPLY)
         if not reply_divs:
             return None
 
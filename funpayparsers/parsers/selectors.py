@@ -0,0 +1,287 @@
+"""
+CSS selectors, used by parsers.
+
+All parsers take selectors from this module instead of passing literals to ``css()``,
+so every selector is defined exactly once and there are no selectors, built at runtime
+(e.g., with f-strings) for every parsed item: ``lexbor`` parses a query on every
+``css()`` / ``css_first()`` call, and a dynamic selector also costs formatting
+and a separate tree scan for every value.
+Elements, that are looked up by a variable value, are collected with a single scan
+over a static selector instead.
+
+Note:
+    ``selectolax`` doesn't expose compiled selector objects, so selectors are stored
+    as strings. Having them all in one place allows switching to compiled selectors
+    without touching parsers, once it is possible.
+"""
+
+from __future__ import annotations
+
+
+__all__ = (
+    'HEADER',
+    'BODY',
+    'CANONICAL_LINK',
+    'LINK',
+    'DIV',
+    'IMAGE',
+    'ICON',
+    'BUTTON',
+    'PARAM_ITEM',
+    'PARAM_NAME',
+    'PRICE',
+    'FORM',
+    'FORM_FIELDS',
+    'FORM_SELECTED_OPTION',
+    'FORM_USER_ID',
+    'FORM_FILTER',
+    'FORM_CONTINUE',
+    'OFFER_FIELDS_FORM',
+    'HEADER_USER_DROPDOWN',
+    'HEADER_PURCHASES_COUNTER',
+    'HEADER_SALES_COUNTER',
+    'HEADER_CHATS_COUNTER',
+    'HEADER_BALANCE',
+    'HEADER_CURRENCY',
+    'HEADER_LANGUAGE_ICON',
+    'HEADER_PROFILE_LINK',
+    'HEADER_USERNAME',
+    'MEDIA_USER',
+    'MEDIA_USER_NAME',
+    'MEDIA_USER_NAME_SPAN',
+    'MEDIA_USER_NAME_LINK',
+    'MEDIA_USER_STATUS',
+    'MEDIA_USER_REVIEWS',
+    'MEDIA_USER_INFO',
+    'AVATAR_PHOTO',
+    'AVATAR_IMAGE',
+    'BADGE',
+    'ACHIEVEMENT',
+    'RATING_COLUMN',
+    'RATING_PARAM',
+    'RATING_STARS',
+    'RATING_REVIEWS_AMOUNT',
+    'RATING_PARAM_REVIEWS_AMOUNT',
+    'RATING_PROGRESS_BARS',
+    'CATEGORIES_LIST',
+    'CATEGORY_GROUP',
+    'CATEGORY_TITLE',
+    'CATEGORY_LOCATION',
+    'SUBCATEGORIES_LIST',
+    'OFFER_PREVIEW',
+    'OFFER_DESC',
+    'OFFER_AMOUNT',
+    'OFFER_DATA_FIELDS',
+    'OFFER_SELLER',
+    'OFFER_SELLER_AVATAR',
+    'OFFER_SELLER_STAR',
+    'OFFER_SELLER_REVIEWS_AMOUNT',
+    'ORDER_PREVIEW',
+    'ORDER_STATUS',
+    'ORDER_DATE',
+    'ORDER_TITLE',
+    'ORDER_CATEGORY',
+    'TRANSACTION_PREVIEW',
+    'TRANSACTION_RECIPIENT',
+    'TRANSACTION_PAYMENT_METHOD',
+    'TRANSACTION_DATE',
+    'TRANSACTION_TITLE',
+    'REVIEW',
+    'ORDER_REVIEW',
+    'REVIEW_RATING',
+    'REVIEW_ORDER',
+    'REVIEW_USER',
+    'REVIEW_ROW',
+    'REVIEW_DATE',
+    'REVIEW_TEXT',
+    'REVIEW_DETAIL',
+    'REVIEW_REPLY',
+    'CHAT',
+    'SELECTED_CHAT',
+    'CHAT_HEADER',
+    'CHAT_MESSAGE_LIST',
+    'CHAT_DETAIL_LIST',
+    'NON_EMPTY_CHAT_DETAIL_LIST',
+    'CHAT_DETAIL_ITEM',
+    'CHAT_PREVIEWS_LIST',
+    'CHAT_PREVIEW',
+    'CHAT_PREVIEW_MESSAGE',
+    'CHAT_PREVIEW_TIME',
+    'MESSAGE',
+    'MESSAGE_IMAGE_LINK',
+    'MESSAGE_TEXT',
+    'MESSAGE_AUTHOR_LINK',
+    'MESSAGE_DATE',
+    'ORDER_PAGE_HEADER',
+    'ORDER_PAGE_REFUNDED_STATUS',
+    'ORDER_PAGE_CLOSED_STATUS',
+    'ORDER_PAGE_PARAM',
+    'ORDER_PAGE_SUBCATEGORY_LINK',
+    'ORDER_PAGE_ATTACHMENT',
+    'ORDER_PAGE_GOODS_LIST',
+    'ORDER_PAGE_GOODS_ITEM',
+    'PROFILE_HEADER',
+    'PROFILE_BADGES',
+    'PROFILE_USERNAME',
+    'PROFILE_TITLE',
+    'PROFILE_STATUS',
+    'PROFILE_OFFERS',
+    'PROFILE_OFFERS_TITLE_LINK',
+    'PROFILE_REVIEWS',
+    'SHOWCASE',
+    'RELATED_SUBCATEGORY',
+    'RELATED_SUBCATEGORY_NAME',
+    'RELATED_SUBCATEGORY_OFFERS',
+    'BALANCE',
+    'TRANSACTIONS_LIST',
+)
+
+from typing import Final
+
+
+# Common
+HEADER: Final = 'header'
+BODY: Final = 'body'
+CANONICAL_LINK: Final = 'head > link[rel="canonical"]'
+LINK: Final = 'a'
+DIV: Final = 'div'
+IMAGE: Final = 'img'
+ICON: Final = 'i'
+BUTTON: Final = 'button'
+PARAM_ITEM: Final = 'div.param-item'
+PARAM_NAME: Final = 'h5'
+PRICE: Final = 'div.tc-price'
+
+# Forms
+FORM: Final = 'form'
+FORM_FIELDS: Final = '*[name]:not([disabled])'
+FORM_SELECTED_OPTION: Final = 'option[selected]'
+FORM_USER_ID: Final = 'input[type="hidden"][name="user_id"]'
+FORM_FILTER: Final = 'input[type="hidden"][name="filter"]'
+FORM_CONTINUE: Final = 'input[type="hidden"][name="continue"]'
+OFFER_FIELDS_FORM: Final = 'div.page-content > form'
+
+# Page header
+HEADER_USER_DROPDOWN: Final = 'a.dropdown-toggle.user-link'
+HEADER_PURCHASES_COUNTER: Final = 'a.menu-item-orders > span.badge'
+HEADER_SALES_COUNTER: Final = 'a.menu-item-trade > span.badge'
+HEADER_CHATS_COUNTER: Final = 'a.menu-item-chat > span.badge'
+HEADER_BALANCE: Final = 'a.menu-item-balance > span.badge'
+HEADER_CURRENCY: Final = 'a.dropdown-toggle.menu-item-currencies'
+HEADER_LANGUAGE_ICON: Final = 'a.dropdown-toggle.menu-item-langs > i.menu-icon'
+HEADER_PROFILE_LINK: Final = 'a.user-link-dropdown'
+HEADER_USERNAME: Final = 'div.user-link-name'
+
+# Users
+MEDIA_USER: Final = 'div.media-user'
+MEDIA_USER_NAME: Final = 'div.media-user-name'
+MEDIA_USER_NAME_SPAN: Final = 'div.media-user-name > span'
+MEDIA_USER_NAME_LINK: Final = 'div.media-user-name > a'
+MEDIA_USER_STATUS: Final = 'div.media-user-status'
+MEDIA_USER_REVIEWS: Final = 'div.media-user-reviews'
+MEDIA_USER_INFO: Final = 'div.media-user-info'
+AVATAR_PHOTO: Final = 'div.avatar-photo'
+AVATAR_IMAGE: Final = 'img.img-circle'
+BADGE: Final = 'span.label'
+ACHIEVEMENT: Final = 'div.achievement-item'
+
+# Ratings
+RATING_COLUMN: Final = 'div.profile-header-col-rating'
+RATING_PARAM: Final = 'div.param-item.mb10'
+RATING_STARS: Final = 'div.rating-value > span.big'
+RATING_REVIEWS_AMOUNT: Final = 'div.rating-full-count'
+RATING_PARAM_REVIEWS_AMOUNT: Final = 'div.mb5'
+RATING_PROGRESS_BARS: Final = 'div[class*="rating-full-item"] > div.rating-progress > div'
+
+# Categories
+CATEGORIES_LIST: Final = 'div.promo-game-list'
+CATEGORY_GROUP: Final = 'div.promo-game-item'
+CATEGORY_TITLE: Final = 'div.game-title'
+CATEGORY_LOCATION: Final = 'button[data-id]'
+SUBCATEGORIES_LIST: Final = 'ul.list-inline[data-id]'
+
+# Offer previews
+OFFER_PREVIEW: Final = 'a.tc-item'
+OFFER_DESC: Final = 'div.tc-desc-text'
+OFFER_AMOUNT: Final = 'div.tc-amount'
+OFFER_DATA_FIELDS: Final = 'div[class*="tc-"]'
+OFFER_SELLER: Final = 'div.tc-user'
+OFFER_SELLER_AVATAR: Final = 'div.tc-user div.avatar-photo'
+OFFER_SELLER_STAR: Final = 'i.fas'
+OFFER_SELLER_REVIEWS_AMOUNT: Final = 'span.rating-mini-count'
+
+# Order previews
+ORDER_PREVIEW: Final = 'a.tc-item'
+ORDER_STATUS: Final = 'div.tc-status'
+ORDER_DATE: Final = 'div.tc-date-time'
+ORDER_TITLE: Final = 'div.order-desc > div'
+ORDER_CATEGORY: Final = 'div.text-muted'
+
+# Transaction previews
+TRANSACTION_PREVIEW: Final = 'div.tc-item'
+TRANSACTION_RECIPIENT: Final = 'span.tc-payment-number'
+TRANSACTION_PAYMENT_METHOD: Final = 'span.payment-logo'
+TRANSACTION_DATE: Final = 'span.tc-date-time'
+TRANSACTION_TITLE: Final = 'span.tc-title'
+
+# Reviews
+REVIEW: Final = 'div.review-container'
+ORDER_REVIEW: Final = 'div.review-container[data-order]'
+REVIEW_RATING: Final = 'div.rating1, div.rating2, div.rating3, div.rating4, div.rating5'
+REVIEW_ORDER: Final = 'div.review-item-order'
+REVIEW_USER: Final = 'div.review-item-user'
+REVIEW_ROW: Final = 'div.review-item-row[data-row="review"]'
+REVIEW_DATE: Final = 'div.review-item-date'
+REVIEW_TEXT: Final = 'div.review-item-text'
+REVIEW_DETAIL: Final = 'div.review-item-detail'
+REVIEW_REPLY: Final = 'div.review-compiled-reply > div:not([class])'
+
+# Chats
+CHAT: Final = 'div.chat'
+SELECTED_CHAT: Final = 'div.chat:not(.chat-not-selected)'
+CHAT_HEADER: Final = 'div.chat-header'
+CHAT_MESSAGE_LIST: Final = 'div.chat-message-list'
+CHAT_DETAIL_LIST: Final = 'div.chat-detail-list'
+NON_EMPTY_CHAT_DETAIL_LIST: Final = 'div.chat-detail-list:has(*)'
+CHAT_DETAIL_ITEM: Final = 'div.param-item:not(.hidden)'
+CHAT_PREVIEWS_LIST: Final = 'div.contact-list'
+CHAT_PREVIEW: Final = 'a.contact-item'
+CHAT_PREVIEW_MESSAGE: Final = 'div.contact-item-message'
+CHAT_PREVIEW_TIME: Final = 'div.contact-item-time'
+
+# Messages
+MESSAGE: Final = 'div.chat-msg-item'
+MESSAGE_IMAGE_LINK: Final = 'a.chat-img-link'
+MESSAGE_TEXT: Final = 'div.chat-msg-text'
+MESSAGE_AUTHOR_LINK: Final = 'a.chat-msg-author-link'
+MESSAGE_DATE: Final = 'div.chat-msg-date'
+
+# Order page
+ORDER_PAGE_HEADER: Final = 'h1.page-header'
+ORDER_PAGE_REFUNDED_STATUS: Final = 'span.text-warning'
+ORDER_PAGE_CLOSED_STATUS: Final = 'span.text-success'
+ORDER_PAGE_PARAM: Final = 'div.param-item:has(h5):not(:has(ul, ol))'
+ORDER_PAGE_SUBCATEGORY_LINK: Final = 'div.param-item:has(h5):not(:has(ul, ol)) a'
+ORDER_PAGE_ATTACHMENT: Final = 'a.attachments-thumb'
+ORDER_PAGE_GOODS_LIST: Final = 'ul.order-secrets-list'
+ORDER_PAGE_GOODS_ITEM: Final = 'a.btn-copy'
+
+# Profile page
+PROFILE_HEADER: Final = 'div.profile-header'
+PROFILE_BADGES: Final = 'small.user-badges > span'
+PROFILE_USERNAME: Final = 'span.mr4'
+PROFILE_TITLE: Final = 'h1.mb40'
+PROFILE_STATUS: Final = 'span.media-user-status'
+PROFILE_OFFERS: Final = 'div.mb20 div.offer'
+PROFILE_OFFERS_TITLE_LINK: Final = 'div.offer-list-title a'
+PROFILE_REVIEWS: Final = 'div.offer:has(div.dyn-table-body)'
+
+# Subcategory page
+SHOWCASE: Final = 'div.showcase'
+RELATED_SUBCATEGORY: Final = 'a.counter-item'
+RELATED_SUBCATEGORY_NAME: Final = 'div.counter-param'
+RELATED_SUBCATEGORY_OFFERS: Final = 'div.counter-value'
+
+# Transactions page
+BALANCE: Final = 'span.balances-value'
+TRANSACTIONS_LIST: Final = 'div.tc-finance:not(.hidden)'
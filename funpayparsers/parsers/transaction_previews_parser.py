@@ -5,7 +5,9 @@ __all__ = ('TransactionPreviewsParser', 'TransactionPreviewsParsingOptions')
 
 from typing import cast
 from dataclasses import dataclass
+from collections.abc import Iterator
 
+from funpayparsers.parsers import selectors as sel
 from funpayparsers.types.enums import PaymentMethod, TransactionStatus
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.finances import TransactionPreview, TransactionPreviewsBatch
@@ -45,16 +47,40 @@ class TransactionPreviewsParser(
     """
 
     def _parse(self) -> TransactionPreviewsBatch:
-        result = []
-        for i in self.tree.css('div.tc-item'):
+        transactions = list(self._iter_items())
+        user_id = self.tree.css(sel.FORM_USER_ID)
+        filter_ = self.tree.css(sel.FORM_FILTER)
+        next_id = self.tree.css(sel.FORM_CONTINUE)
+
+        return TransactionPreviewsBatch(
+            raw_source=self.capture_raw_source(),
+            transactions=transactions,
+            user_id=int(cast(str, user_id[0].attributes.get('value'))) if user_id else None,
+            filter=filter_[0].attributes.get('value') if filter_ else None,
+            next_transaction_id=int(cast(str, next_id[0].attributes.get('value')))
+            if next_id
+            else None,
+        )
+
+    def iter_parse(self) -> Iterator[TransactionPreview]:
+        """
+        Yields transaction previews as soon as they are parsed.
+
+        Unlike ``parse()``, doesn't build a ``TransactionPreviewsBatch``, so the consumer
+        can stop early without parsing the rest of the transactions.
+        """
+        return self._stream(self._iter_items())
+
+    def _iter_items(self) -> Iterator[TransactionPreview]:
+        for i in self.tree.css(sel.TRANSACTION_PREVIEW):
             value = MoneyValueParser(
-                raw_source=i.css('div.tc-price')[0].html or '',
+                raw_source=i.css(sel.PRICE)[0],
                 options=self.options.money_value_parsing_options,
                 parsing_mode=MoneyValueParsingMode.FROM_TRANSACTION_PREVIEW,
             ).parse()
-            recipient_div = i.css('span.tc-payment-number')
+            recipient_div = i.css(sel.TRANSACTION_RECIPIENT)
 
-            payment_method_divs = i.css('span.payment-logo')
+            payment_method_divs = i.css(sel.TRANSACTION_PAYMENT_METHOD)
             payment_method = (
                 PaymentMethod.get_by_css_class(
                     payment_method_divs[0].attributes['class'],  # type: ignore[arg-type]
@@ -64,31 +90,13 @@ class TransactionPreviewsParser(
                 else None
             )
 
-            result.append(
-                TransactionPreview(
-                    raw_source=i.html or '',
-                    id=int(cast(str, i.attributes['data-transaction'])),
-                    date_text=i.css('span.tc-date-time')[0].text(strip=True),
-                    desc=i.css('span.tc-title')[0].text(strip=True),
-                    status=TransactionStatus.get_by_css_class(cast(str, i.attributes['class'])),
-                    amount=value,
-                    payment_method=payment_method,
-                    withdrawal_number=(
-                        recipient_div[0].text(strip=True) if recipient_div else None
-                    ),
-                )
+            yield TransactionPreview(
+                raw_source=self.capture_raw_source(i),
+                id=int(cast(str, i.attributes['data-transaction'])),
+                date_text=i.css(sel.TRANSACTION_DATE)[0].text(strip=True),
+                desc=i.css(sel.TRANSACTION_TITLE)[0].text(strip=True),
+                status=TransactionStatus.get_by_css_class(cast(str, i.attributes['class'])),
+                amount=value,
+                payment_method=payment_method,
+                withdrawal_number=(recipient_div[0].text(strip=True) if recipient_div else None),
             )
-
-        user_id = self.tree.css('input[type="hidden"][name="user_id"]')
-        filter_ = self.tree.css('input[type="hidden"][name="filter"]')
-        next_id = self.tree.css('input[type="hidden"][name="continue"]')
-
-        return TransactionPreviewsBatch(
-            raw_source=self.raw_source,
-            transactions=result,
-            user_id=int(cast(str, user_id[0].attributes.get('value'))) if user_id else None,
-            filter=filter_[0].attributes.get('value') if filter_ else None,
-            next_transaction_id=int(cast(str, next_id[0].attributes.get('value')))
-            if next_id
-            else None,
-        )
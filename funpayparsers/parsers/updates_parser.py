@@ -3,7 +3,6 @@ from __future__ import annotations
 
 __all__ = ('UpdatesParser', 'UpdatesParsingOptions')
 
-import json
 from typing import Any, cast
 from dataclasses import dataclass
 
@@ -74,7 +73,7 @@ class UpdatesParser(FunPayJSONObjectParser[RunnerResponse, UpdatesParsingOptions
 
     def _parse(self) -> RunnerResponse:
         updates_obj = RunnerResponse(
-            raw_source=str(self.raw_source),
+            raw_source=self.capture_raw_source(serializer=str),
             orders_counters=None,
             chat_counter=None,
             chat_bookmarks=None,
@@ -108,21 +107,21 @@ class UpdatesParser(FunPayJSONObjectParser[RunnerResponse, UpdatesParsingOptions
 
     def _parse_orders_counters(self, obj: dict[str, Any]) -> OrdersCounters:
         return OrdersCounters(
-            raw_source=json.dumps(obj, ensure_ascii=False),
+            raw_source=self.capture_raw_source(obj),
             purchases=int(cast(str, obj.get('buyer'))) if obj.get('seller') else 0,
             sales=int(cast(str, obj.get('seller'))) if obj.get('seller') else 0,
         )
 
     def _parse_chat_counter(self, obj: dict[str, Any]) -> ChatCounter:
         return ChatCounter(
-            raw_source=str(obj),
+            raw_source=self.capture_raw_source(obj, str),
             counter=int(obj['counter']),
             latest_message_id=int(obj['message']),
         )
 
     def _parse_chat_bookmarks(self, obj: dict[str, Any]) -> ChatBookmarks:
         return ChatBookmarks(
-            raw_source=str(obj),
+            raw_source=self.capture_raw_source(obj, str),
             counter=int(obj['counter']),
             latest_message_id=int(obj['message']),
             order=obj['order'],
@@ -142,7 +141,7 @@ class UpdatesParser(FunPayJSONObjectParser[RunnerResponse, UpdatesParsingOptions
     def _parse_node(self, obj: dict[str, Any]) -> ChatNode:
         node_obj = obj['node']
         node_info = NodeInfo(
-            raw_source=str(node_obj),
+            raw_source=self.capture_raw_source(node_obj, str),
             id=int(node_obj['id']),
             name=node_obj['name'],
             silent=node_obj['silent'],
@@ -155,7 +154,7 @@ class UpdatesParser(FunPayJSONObjectParser[RunnerResponse, UpdatesParsingOptions
         ).parse()
 
         return ChatNode(
-            raw_source=str(obj),
+            raw_source=self.capture_raw_source(obj, str),
             node=node_info,
             messages=messages,
             has_history=obj['hasHistory'],
@@ -163,7 +162,7 @@ class UpdatesParser(FunPayJSONObjectParser[RunnerResponse, UpdatesParsingOptions
 
     def _parse_action_response(self, obj: dict[str, Any]) -> ActionResponse:
         return ActionResponse(
-            raw_source=str(obj),
+            raw_source=self.capture_raw_source(obj, str),
             error=obj.get('error'),
         )
 
@@ -176,7 +175,7 @@ class UpdatesParser(FunPayJSONObjectParser[RunnerResponse, UpdatesParsingOptions
         obj = method(self, update_dict['data'])
 
         return RunnerResponseObject(
-            raw_source=str(update_dict),
+            raw_source=self.capture_raw_source(update_dict, str),
             type=update_type,
             id=update_dict['id'],
             tag=update_dict['tag'],
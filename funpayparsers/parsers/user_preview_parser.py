@@ -7,6 +7,8 @@ __all__ = ('UserPreviewParser', 'UserPreviewParsingOptions', 'UserPreviewParsing
 from dataclasses import dataclass
 from enum import Enum
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.parsers.base import ParsingOptions, FunPayHTMLObjectParser
 from funpayparsers.types.common import UserPreview
 from funpayparsers.parsers.utils import extract_css_url
@@ -50,36 +52,36 @@ class UserPreviewParser(FunPayHTMLObjectParser[UserPreview, UserPreviewParsingOp
         return self._parse_from_chat()
 
     def _parse_from_order_preview(self) -> UserPreview:
-        user_div = self.tree.css('div.media-user')[0]
-        photo_style: str = user_div.css('div.avatar-photo')[0].attributes['style']  # type: ignore[assignment] # always has a style
-        username_tag = user_div.css('div.media-user-name > span')[0]
-        user_status_text: str = user_div.css('div.media-user-status')[0].text().strip()
+        user_div = self.tree.css(sel.MEDIA_USER)[0]
+        photo_style: str = user_div.css(sel.AVATAR_PHOTO)[0].attributes['style']  # type: ignore[assignment] # always has a style
+        username_tag = user_div.css(sel.MEDIA_USER_NAME_SPAN)[0]
+        user_status_text: str = user_div.css(sel.MEDIA_USER_STATUS)[0].text().strip()
 
         return UserPreview(
-            raw_source=user_div.html or '',
+            raw_source=self.capture_raw_source(user_div),
             id=int(username_tag.attributes['data-href'].split('/')[-2]),  # type: ignore[union-attr]
-            username=username_tag.text(strip=True),
+            username=intern_string(username_tag.text(strip=True)),
             # user div always has a class
             online='online' in user_div.attributes['class'],  # type: ignore[operator]
-            avatar_url=extract_css_url(photo_style),
+            avatar_url=intern_string(extract_css_url(photo_style)),
             # user div always has a class
             banned='banned' in user_div.attributes['class'],  # type: ignore[operator]
             status_text=user_status_text,
         )
 
     def _parse_from_chat(self) -> UserPreview:
-        user_div = self.tree.css('div.media-user')[0]
-        username_tag = user_div.css_first('div.media-user-name > a')
+        user_div = self.tree.css(sel.MEDIA_USER)[0]
+        username_tag = user_div.css_first(sel.MEDIA_USER_NAME_LINK)
 
         return UserPreview(
-            raw_source=user_div.html or '',
+            raw_source=self.capture_raw_source(user_div),
             # username tag always has href
             id=int(username_tag.attributes['href'].split('/')[-2]),  # type: ignore[union-attr]
-            username=username_tag.text(strip=True),
+            username=intern_string(username_tag.text(strip=True)),
             # user div always has a class
             online='online' in user_div.attributes['class'],  # type: ignore[operator]
-            avatar_url=user_div.css_first('img.img-circle').attributes['src'] or '',
+            avatar_url=intern_string(user_div.css_first(sel.AVATAR_IMAGE).attributes['src'] or ''),
             # user div always has a class
             banned='banned' in user_div.attributes['class'],  # type: ignore[operator]
-            status_text=user_div.css_first('div.media-user-status').text().strip(),
+            status_text=user_div.css_first(sel.MEDIA_USER_STATUS).text().strip(),
         )
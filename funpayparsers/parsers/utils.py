@@ -4,20 +4,33 @@ from __future__ import annotations
 __all__ = (
     'extract_css_url',
     'resolve_messages_senders',
+    'iter_resolve_messages_senders',
     'parse_date_string',
+    'parse_date_strings',
+    'use_reference_time',
+    'get_reference_time',
+    'get_reference_day',
     'parse_money_value_string',
     'serialize_form',
+    'inner_html',
 )
 
 import re
 from typing import Literal, cast, overload
 from copy import deepcopy
-from datetime import datetime, timedelta
+from array import array
+from decimal import Decimal
+from datetime import date, time, datetime, timedelta
 from zoneinfo import ZoneInfo
-from collections.abc import Iterable
+from functools import lru_cache
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Iterable, Iterator
 
 from selectolax.lexbor import LexborNode, LexborHTMLParser
 
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.interning import intern_string
 from funpayparsers.types.enums import BadgeType
 from funpayparsers.types.common import MoneyValue
 from funpayparsers.types.messages import Message
@@ -25,6 +38,8 @@ from funpayparsers.types.messages import Message
 
 CSS_URL_RE = re.compile(r'url\(([^()]+)\)', re.IGNORECASE)
 MONEY_VALUE_RE = re.compile(r'^([+\-]?\d+(?:\.\d+)?)(.)$')
+# Removes spaces (to support space separated values, e.g., 12 345.67) and replaces minus signs.
+_MONEY_VALUE_TRANSLATION = str.maketrans({' ': None, '\u2212': '-'})
 
 
 TODAY_WORDS = ['сегодня', 'сьогодні', 'today']
@@ -94,7 +109,57 @@ DATE_RE = re.compile(
 )
 
 
-def parse_date_string(date_string: str, /) -> int:
+MOSCOW_TZ = ZoneInfo('Europe/Moscow')
+"""Timezone of FunPay dates."""
+
+
+_reference_time: ContextVar[datetime | None] = ContextVar(
+    'funpayparsers_reference_time', default=None
+)
+
+
+@contextmanager
+def use_reference_time(reference: datetime | None) -> Iterator[datetime | None]:
+    """
+    Sets the reference time of ``parse_date_string()`` in the current context
+    (thread / asyncio task) until the ``with`` block exits.
+
+    Relative dates (``today``, ``yesterday``, time only, dates without a year) are
+    resolved against the reference time instead of the current time, so a batch of dates
+    is resolved consistently and reproducibly. Applies to ``timestamp`` properties of objects
+    as well. ``None`` restores the current time.
+
+    Examples:
+        >>> with use_reference_time(datetime(2025, 1, 1, tzinfo=MOSCOW_TZ)):
+        ...     parse_date_string('yesterday, 12:00')
+        1735635600
+    """
+    token = _reference_time.set(reference)
+    try:
+        yield reference
+    finally:
+        _reference_time.reset(token)
+
+
+def get_reference_time() -> datetime | None:
+    """
+    Returns the reference time of the current context (see ``use_reference_time()``),
+    ``None`` if dates are resolved against the current time.
+    """
+    return _reference_time.get()
+
+
+def get_reference_day() -> date:
+    """
+    Returns the day, relative dates are resolved against in the current context:
+    the day of the reference time (see ``use_reference_time()``) or the current day.
+
+    Unlike ``get_reference_time()``, it changes at midnight, if no reference time is set.
+    """
+    return _reference_day(None)
+
+
+def parse_date_string(date_string: str, /, reference: datetime | None = None) -> int:
     """
     Parses a FunPay-style date string and converts it to a UNIX timestamp.
 
@@ -103,58 +168,169 @@ def parse_date_string(date_string: str, /) -> int:
     - The returned timestamp is in UTC+0.
     - Internally, the parsed datetime is localized to UTC+3 and then converted to UTC.
 
+    Results are cached by the normalized date string and the reference day.
+
+    :param reference: time to resolve relative dates against. Aware datetimes are converted
+        to UTC+3, naive ones are taken as is.
+        Defaults to the reference time of the current context (see ``use_reference_time()``)
+        or the current time.
+
     :return: timestamp in UTC+0 timezone.
     """
-    date_string = date_string.lower().strip()
-    date = datetime.now().replace(second=0, microsecond=0, tzinfo=ZoneInfo('Europe/Moscow'))
+    return _parse_date_string(date_string.lower().strip(), _reference_day(reference))
+
+
+def _reference_day(reference: datetime | None) -> date:
+    if reference is None:
+        reference = _reference_time.get() or datetime.now()
+    if reference.tzinfo is not None:
+        reference = reference.astimezone(MOSCOW_TZ)
+    return reference.date()
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_string: str, reference_day: date, /) -> int:
+    year, month, day = reference_day.year, reference_day.month, reference_day.day
 
     if match := TIME_ONLY_RE.match(date_string):
         return int(
-            date.replace(
-                hour=int(match.group('h')),
-                minute=int(match.group('m')),
-                second=int(match.group('s') or 0),
+            datetime(
+                year,
+                month,
+                day,
+                int(match.group('h')),
+                int(match.group('m')),
+                int(match.group('s') or 0),
+                tzinfo=MOSCOW_TZ,
             ).timestamp()
         )
 
     if match := SHORT_DATE_RE.match(date_string):
         return int(
-            date.replace(
-                year=int(match.group('year')) + 2000,
-                month=int(match.group('month')),
-                day=int(match.group('day')),
-                hour=0,
-                minute=0,
+            datetime(
+                int(match.group('year')) + 2000,
+                int(match.group('month')),
+                int(match.group('day')),
+                tzinfo=MOSCOW_TZ,
             ).timestamp()
         )
 
     if match := TODAY_OR_YESTERDAY_RE.match(date_string):
-        day = match.group('day')
-        date = date.replace(
-            hour=int(match.group('h')),
-            minute=int(match.group('m')),
+        result = datetime(
+            year, month, day, int(match.group('h')), int(match.group('m')), tzinfo=MOSCOW_TZ
         )
-        if day in TODAY_WORDS:
-            return int(date.timestamp())
-        return int((date - timedelta(days=1)).timestamp())
+        if match.group('day') in TODAY_WORDS:
+            return int(result.timestamp())
+        return int((result - timedelta(days=1)).timestamp())
 
     if match := DATE_RE.match(date_string):
-        month = match.group('month')
-        month = MONTHS[month]
         return int(
-            date.replace(
-                year=int(match.group('year') or date.year),
-                month=month,
-                day=int(match.group('day')),
-                hour=int(match.group('h')),
-                minute=int(match.group('m')),
-                second=int(match.group('s') or 0),
+            datetime(
+                int(match.group('year') or year),
+                MONTHS[match.group('month')],
+                int(match.group('day')),
+                int(match.group('h')),
+                int(match.group('m')),
+                int(match.group('s') or 0),
+                tzinfo=MOSCOW_TZ,
             ).timestamp()
         )
 
     raise ValueError(f"Unable to parse date string '{date_string}'.")
 
 
+def parse_date_strings(
+    date_strings: Iterable[str],
+    /,
+    reference: datetime | None = None,
+    default: int | None = None,
+) -> array[int]:
+    """
+    Parses FunPay-style date strings (see ``parse_date_string()``) in bulk.
+
+    All relative dates are resolved against the same reference day. Equal strings are
+    parsed once, and timestamps are computed from calendar fields with a per-day
+    UTC offset, so no ``datetime`` objects are created for most of the strings.
+
+    :param date_strings: date strings.
+    :param reference: see ``parse_date_string()``.
+    :param default: timestamp for strings, that can't be parsed.
+        If ``None``, ``ValueError`` is raised instead.
+
+    :return: ``array('q')`` of timestamps in UTC+0 timezone, in order of ``date_strings``.
+
+    Examples:
+        >>> reference = datetime(2025, 1, 1, tzinfo=MOSCOW_TZ)
+        >>> parse_date_strings(['вчера, 12:00', '31.12.24', 'date'], reference, default=0)
+        array('q', [1735635600, 1735592400, 0])
+    """
+    reference_ordinal = _reference_day(reference).toordinal()
+    parsed: dict[str, int] = {}
+    offsets: dict[int, int | None] = {}
+    result = array('q')
+    for date_string in date_strings:
+        timestamp = parsed.get(date_string)
+        if timestamp is None:
+            try:
+                timestamp = _bulk_timestamp(
+                    date_string.lower().strip(), reference_ordinal, offsets
+                )
+            except ValueError:
+                if default is None:
+                    raise
+                timestamp = default
+            parsed[date_string] = timestamp
+        result.append(timestamp)
+    return result
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _bulk_timestamp(
+    date_string: str, reference_ordinal: int, offsets: dict[int, int | None]
+) -> int:
+    """
+    ``_parse_date_string()`` without ``datetime`` objects.
+
+    :param offsets: UTC+3 offsets of already seen days (``None`` for days with an offset
+        change, timestamps of which are computed via ``datetime``).
+    """
+    hour, minute, second = 0, 0, 0
+    if match := TIME_ONLY_RE.match(date_string):
+        ordinal = reference_ordinal
+        hour, minute, second = int(match['h']), int(match['m']), int(match['s'] or 0)
+    elif match := SHORT_DATE_RE.match(date_string):
+        year = int(match['year']) + 2000
+        ordinal = date(year, int(match['month']), int(match['day'])).toordinal()
+    elif match := TODAY_OR_YESTERDAY_RE.match(date_string):
+        ordinal = reference_ordinal - (match['day'] not in TODAY_WORDS)
+        hour, minute = int(match['h']), int(match['m'])
+    elif match := DATE_RE.match(date_string):
+        year = int(match['year'] or date.fromordinal(reference_ordinal).year)
+        ordinal = date(year, MONTHS[match['month']], int(match['day'])).toordinal()
+        hour, minute, second = int(match['h']), int(match['m']), int(match['s'] or 0)
+    else:
+        raise ValueError(f"Unable to parse date string '{date_string}'.")
+
+    if ordinal in offsets:
+        offset = offsets[ordinal]
+    else:
+        day = datetime.combine(date.fromordinal(ordinal), time(), MOSCOW_TZ)
+        start_offset = day.utcoffset()
+        end_offset = (day + timedelta(hours=23, minutes=59, seconds=59)).utcoffset()
+        offset = offsets[ordinal] = (
+            int(start_offset.total_seconds())
+            if start_offset is not None and start_offset == end_offset
+            else None
+        )
+
+    if offset is None:
+        day_time = time(hour, minute, second, tzinfo=MOSCOW_TZ)
+        return int(datetime.combine(date.fromordinal(ordinal), day_time).timestamp())
+    return (ordinal - _EPOCH_ORDINAL) * 86400 + hour * 3600 + minute * 60 + second - offset
+
+
 @overload
 def extract_css_url(source: str, /, *, raise_if_not_found: Literal[True] = ...) -> str: ...
 
@@ -207,7 +383,15 @@ def resolve_messages_senders(messages: Iterable[Message], /) -> None:
     Requires at least one heading message in the sequence.
     Typically, the earliest message in a fetched history is a heading message.
     """
+    for _ in iter_resolve_messages_senders(messages):
+        pass
+
 
+def iter_resolve_messages_senders(messages: Iterable[Message], /) -> Iterator[Message]:
+    """
+    Lazy version of ``resolve_messages_senders``: yields messages, resolving the sender
+    information of each non-heading message right before it is yielded.
+    """
     username, userid, badge, send_time = None, None, None, None
     for m in messages:
         if m.is_heading:
@@ -217,6 +401,7 @@ def resolve_messages_senders(messages: Iterable[Message], /) -> None:
                 if m.badge and m.badge.type is not BadgeType.AUTO_DELIVERY
                 else None
             )
+            yield m
             continue
 
         m.sender_username, m.sender_id, m.badge, m.send_date_text = (
@@ -225,17 +410,28 @@ def resolve_messages_senders(messages: Iterable[Message], /) -> None:
             badge,
             send_time,
         )
+        yield m
 
 
 @overload
 def parse_money_value_string(
-    money_value_str: str, /, *, raw_source: str | None = ..., raise_on_error: Literal[True] = ...
+    money_value_str: str,
+    /,
+    *,
+    raw_source: str | None = ...,
+    raise_on_error: Literal[True] = ...,
+    exact: bool = ...,
 ) -> MoneyValue: ...
 
 
 @overload
 def parse_money_value_string(
-    money_value_str: str, /, *, raw_source: str | None = ..., raise_on_error: Literal[False] = ...
+    money_value_str: str,
+    /,
+    *,
+    raw_source: str | None = ...,
+    raise_on_error: Literal[False] = ...,
+    exact: bool = ...,
 ) -> MoneyValue | None: ...
 
 
@@ -245,6 +441,7 @@ def parse_money_value_string(
     *,
     raw_source: str | None = None,
     raise_on_error: bool = False,
+    exact: bool = False,
 ) -> MoneyValue | None:
     """
     Parse money value string.
@@ -257,11 +454,10 @@ def parse_money_value_string(
 
     Whitespaces between sign, value and currency char are allowed.
     String will be stripped before parsing.
-    """
 
-    # It is important to replace ' ' with '' to support space seperated values,
-    # e.g., 12 345.67
-    to_process = money_value_str.strip().replace(' ', '').replace('\u2212', '-')
+    :param exact: whether to return the value as ``decimal.Decimal`` instead of ``float``.
+    """
+    to_process = money_value_str.strip().translate(_MONEY_VALUE_TRANSLATION)
     if not (match := MONEY_VALUE_RE.fullmatch(to_process)):
         if raise_on_error:
             raise Exception(f"Unable to parse money value string '{money_value_str}'")
@@ -271,11 +467,23 @@ def parse_money_value_string(
 
     return MoneyValue(
         raw_source=raw_source if raw_source is not None else money_value_str,
-        value=float(value),
-        character=currency,
+        value=Decimal(value) if exact else float(value),
+        character=intern_string(currency),
     )
 
 
+def inner_html(node: LexborNode, /) -> str:
+    """
+    Serializes the content of a node (its children and text), without the node's own tag.
+
+    Example:
+        >>> tree = LexborHTMLParser('<div>text <b>bold</b></div>')
+        >>> inner_html(tree.css_first('div'))
+        'text <b>bold</b>'
+    """
+    return ''.join(i.html or '' for i in node.iter(include_text=True))
+
+
 def serialize_form(source: str | LexborNode | LexborHTMLParser) -> dict[str, str]:
     result: dict[str, str] = {}
     if isinstance(source, str):
@@ -283,12 +491,12 @@ def serialize_form(source: str | LexborNode | LexborHTMLParser) -> dict[str, str
             return {}
         source = LexborHTMLParser(source)
 
-    forms = source.css('form')
+    forms = source.css(sel.FORM)
     if not forms:
         return {}
     form = forms[0]
 
-    fields = form.css('*[name]:not([disabled])')
+    fields = form.css(sel.FORM_FIELDS)
     for field in fields:
         name = field.attributes.get('name') or ''
         value = field.attributes.get('value', '')
@@ -297,7 +505,7 @@ def serialize_form(source: str | LexborNode | LexborHTMLParser) -> dict[str, str
             value = field.text() or ''
 
         elif field.tag == 'select':
-            selected = field.css('option[selected]')
+            selected = field.css(sel.FORM_SELECTED_OPTION)
             value = selected[0].attributes.get('value', '') if selected else ''
 
         elif field.tag == 'input':
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+
+__all__ = ('RawSourceHandle', 'LazyRawSource', 'RawSourceDocument', 'RawSourceSpan')
+
+from typing import Any, Callable
+from abc import ABC, abstractmethod
+
+
+class RawSourceHandle(ABC):
+    """
+    Base class for raw source handles.
+
+    Handles are used as ``FunPayObject.raw_source`` values instead of regular strings
+    when parsing with ``RawSourceMode.LAZY`` or ``RawSourceMode.SPAN``.
+    ``FunPayObject.raw_source`` materializes them into a regular ``str`` transparently,
+    so in most cases there is no need to work with handles directly.
+
+    Handles support ``len()``, indexing / slicing (returns ``str``) and comparison
+    with strings. Pickling and copying a handle produces a regular ``str``.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __str__(self) -> str: ...
+
+    def __len__(self) -> int:
+        return len(str(self))
+
+    def __getitem__(self, item: int | slice) -> str:
+        return str(self)[item]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, RawSourceHandle)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __copy__(self) -> RawSourceHandle:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> RawSourceHandle:
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return str, (str(self),)
+
+
+class LazyRawSource(RawSourceHandle):
+    """
+    Raw source handle, that serializes its source on first access.
+
+    Used with ``RawSourceMode.LAZY``.
+
+    Until materialized, a handle keeps a reference to its source (e.g., a ``LexborNode``,
+    which in turn keeps the whole parsed document alive).
+    After materialization the source is released.
+
+    Examples:
+        >>> handle = LazyRawSource({'a': 1}, repr)
+        >>> handle.materialized
+        False
+        >>> str(handle)
+        "{'a': 1}"
+        >>> handle.materialized
+        True
+        >>> handle == "{'a': 1}", len(handle), handle[:4]
+        (True, 8, "{'a'")
+    """
+
+    __slots__ = ('_source', '_serializer', '_value')
+
+    def __init__(self, source: Any, serializer: Callable[[Any], str | None]) -> None:
+        """
+        :param source: object to serialize.
+        :param serializer: callable, that converts ``source`` into a raw source string.
+            ``None`` result is treated as an empty string.
+        """
+        self._source: Any = source
+        self._serializer: Callable[[Any], str | None] | None = serializer
+        self._value: str | None = None
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the source has already been serialized."""
+        return self._value is not None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = self._serializer(self._source) or ''  # type: ignore[misc]
+            self._source, self._serializer = None, None
+        return self._value
+
+    def __repr__(self) -> str:
+        if self._value is None:
+            return f'<{self.__class__.__name__} (not materialized)>'
+        return f'<{self.__class__.__name__} {self._value!r}>'
+
+
+class RawSourceDocument:
+    """
+    Serialized source document, shared by ``RawSourceSpan``'s.
+
+    Used with ``RawSourceMode.SPAN``: every object parsed from the same document
+    references a single document string instead of holding its own copy of a substring.
+
+    Examples:
+        >>> doc = RawSourceDocument('<div><p>text</p><p>text</p></div>')
+        >>> span = doc.span('<p>text</p>')
+        >>> span
+        <RawSourceSpan [5:16]>
+        >>> str(span), len(span), span[1:2]
+        ('<p>text</p>', 11, 'p')
+    """
+
+    __slots__ = ('text', '_cursor')
+
+    def __init__(self, text: str) -> None:
+        """
+        :param text: serialized document.
+        """
+        self.text = text
+        self._cursor = 0
+
+    def span(self, fragment: str) -> RawSourceSpan:
+        """
+        Returns a span of the ``fragment`` within the document.
+
+        Any occurrence of the fragment is a valid result, since all of them have the same text.
+        Spans are usually requested in document order, or for an ancestor of the previously
+        requested fragment, so the search starts near the previous match and falls back
+        to the whole document.
+
+        :raises ValueError: if the fragment is not a part of the document.
+        """
+        text, cursor, size = self.text, self._cursor, len(fragment)
+
+        # The previous fragment or its ancestor.
+        start = text.rfind(fragment, max(0, cursor - size), cursor + size)
+        if start == -1:
+            start = text.find(fragment, cursor)
+        if start == -1:
+            start = text.find(fragment)
+        if start == -1:
+            raise ValueError('Fragment is not a part of the document.')
+
+        self._cursor = start
+        return RawSourceSpan(self, start, start + size)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} ({len(self.text)} chars)>'
+
+
+class RawSourceSpan(RawSourceHandle):
+    """
+    Raw source handle, that references a ``[start:end]`` part of a ``RawSourceDocument``.
+
+    Used with ``RawSourceMode.SPAN``. The string is materialized on every ``str()`` call
+    and is not cached, while ``len()`` and indexing / slicing touch only the requested part.
+    """
+
+    __slots__ = ('document', 'start', 'end')
+
+    def __init__(self, document: RawSourceDocument, start: int, end: int) -> None:
+        """
+        :param document: source document.
+        :param start: start offset of the span in the document (inclusive).
+        :param end: end offset of the span in the document (exclusive).
+        """
+        self.document = document
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        return self.document.text[self.start : self.end]
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, item: int | slice) -> str:
+        index = range(self.start, self.end)[item]
+        if isinstance(index, int):
+            return self.document.text[index]
+        # ``range`` stop of a reversed slice may be -1, which would mean "the last char" here.
+        stop = index.stop if index.stop >= 0 else None
+        return self.document.text[index.start : stop : index.step]
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.start}:{self.end}]>'
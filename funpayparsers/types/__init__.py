@@ -6,6 +6,7 @@ from .enums import *
 from .common import *
 from .offers import *
 from .orders import *
+from .columns import *
 from .reviews import *
 from .updates import *
 from .finances import *
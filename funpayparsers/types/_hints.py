@@ -0,0 +1,159 @@
+"""
+Type hints walking and code generation helpers, shared by ``funpayparsers.types.serialization``
+and ``funpayparsers.types.wire``.
+"""
+
+from __future__ import annotations
+
+
+__all__ = (
+    'Converter',
+    'ConverterBuilder',
+    'compile_function',
+    'get_fields',
+    'identity',
+    'strip_optional',
+    'types_namespace',
+    'typevars_of',
+)
+
+import typing
+import types
+from typing import TYPE_CHECKING, Any, Union, TypeVar, Callable
+from dataclasses import fields
+from abc import ABC, abstractmethod
+from enum import Enum
+from decimal import Decimal
+from functools import lru_cache
+
+from funpayparsers.types.base import FunPayObject
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+Converter = Callable[[Any], Any]
+"""
+Converter of a field value.
+``None`` is used instead of a converter for values, that are passed as is.
+"""
+
+
+class ConverterBuilder(ABC):
+    """
+    Builds converters of values from their annotations.
+
+    ``build()`` walks an annotation and calls the ``for_*()`` method, related to its kind.
+    Subclasses define conversions of every kind of values.
+    """
+
+    atomic_types: frozenset[Any] = frozenset()
+    """Types of values, that are passed as is."""
+
+    def build(self, hint: Any, typevars: Mapping[Any, Any] | None = None) -> Converter | None:
+        """
+        Returns a converter of a value, annotated with ``hint`` (``None`` - as is).
+
+        :param typevars: values of type variables, ``hint`` may contain.
+        """
+        if isinstance(hint, str):
+            # nested forward references (e.g., ``tuple['Subcategory', ...]``)
+            # are not resolved by ``typing.get_type_hints()`` before Python 3.11
+            hint = eval(hint, {}, types_namespace())
+        if isinstance(hint, TypeVar):
+            if typevars is None or hint not in typevars:
+                return self.for_other()
+            hint = typevars[hint]
+
+        hint = strip_optional(hint)
+        origin = typing.get_origin(hint) or hint
+        args = typing.get_args(hint)
+
+        if self.is_atomic(hint):
+            return None
+        if isinstance(origin, type) and issubclass(origin, Enum):
+            return self.for_enum(origin)
+        if isinstance(origin, type) and issubclass(origin, FunPayObject):
+            return self.for_object(origin, args)
+        if origin is list and args:
+            return self.for_list(self.build(args[0], typevars))
+        if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+            return self.for_tuple(self.build(args[0], typevars))
+        if origin is dict and args:
+            return self.for_dict(self.build(args[0], typevars), self.build(args[1], typevars))
+        return self.for_other()
+
+    def is_atomic(self, hint: Any) -> bool:
+        """Whether values, annotated with ``hint``, are passed as is."""
+        if typing.get_origin(hint) in (Union, types.UnionType):
+            return all(self.is_atomic(i) for i in typing.get_args(hint))
+        return hint in self.atomic_types
+
+    @abstractmethod
+    def for_enum(self, enum: type[Enum]) -> Converter | None:
+        """Returns a converter of enum members."""
+
+    @abstractmethod
+    def for_object(self, cls: type, args: tuple[Any, ...]) -> Converter | None:
+        """Returns a converter of ``FunPayObject``'s (``args`` - generic class arguments)."""
+
+    @abstractmethod
+    def for_list(self, item: Converter | None) -> Converter | None:
+        """Returns a converter of lists."""
+
+    @abstractmethod
+    def for_tuple(self, item: Converter | None) -> Converter | None:
+        """Returns a converter of variable-length tuples."""
+
+    @abstractmethod
+    def for_dict(self, key: Converter | None, item: Converter | None) -> Converter | None:
+        """Returns a converter of dicts."""
+
+    @abstractmethod
+    def for_other(self) -> Converter | None:
+        """Returns a converter of values of any other (or unknown) type."""
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def compile_function(name: str, source: str, namespace: dict[str, Any]) -> Callable[[Any], Any]:
+    """Executes ``source`` in ``namespace`` and returns the function ``name``, defined by it."""
+    exec(source, namespace)
+    return namespace[name]  # type: ignore[no-any-return]
+
+
+def strip_optional(hint: Any) -> Any:
+    """Returns ``X`` for ``X | None`` / ``Optional[X]``, ``hint`` as is otherwise."""
+    if typing.get_origin(hint) in (Union, types.UnionType):
+        args = [i for i in typing.get_args(hint) if i is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def typevars_of(cls: type, args: tuple[Any, ...]) -> dict[Any, Any]:
+    """Returns type variables of a generic class -> their values (``args``)."""
+    params = getattr(cls, '__parameters__', ())
+    return dict(zip(params, args, strict=False))
+
+
+def get_fields(cls: type) -> list[tuple[str, Any]]:
+    """Returns ``__init__`` fields of a dataclass with their resolved annotations."""
+    hints = typing.get_type_hints(cls, localns=types_namespace())
+    return [(f.name, hints[f.name]) for f in fields(cls) if f.init]
+
+
+@lru_cache(maxsize=None)
+def types_namespace() -> dict[str, Any]:
+    """Names, used in field annotations of ``funpayparsers.types``."""
+    import funpayparsers.types
+    import funpayparsers.types.pages
+
+    return {
+        **vars(funpayparsers.types),
+        **vars(funpayparsers.types.pages),
+        'Decimal': Decimal,
+    }
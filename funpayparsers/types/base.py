@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 
-__all__ = ('FunPayObject',)
+__all__ = ('FunPayObject', 'NOT_PARSED')
 
-from typing import TYPE_CHECKING, Any, Type, TypeVar
-from dataclasses import field, asdict, dataclass
+from typing import TYPE_CHECKING, Any, Type, TypeVar, Callable, ClassVar, overload
+from dataclasses import field, dataclass
+from types import MemberDescriptorType
 
 
 if TYPE_CHECKING:
@@ -14,28 +15,70 @@ if TYPE_CHECKING:
 SelfT = TypeVar('SelfT', bound='FunPayObject')
 
 
+class _FunPayObjectSlots:
+    """
+    Slots of ``FunPayObject``.
+
+    ``raw_source`` slot keeps the raw source value, but its descriptor is shadowed
+    by the ``FunPayObject.raw_source`` property and is available as ``_raw_source``
+    (see below). Since the slot is inherited, slotted subclasses don't create their own
+    ``raw_source`` slot, that would shadow the property.
+
+    Declared in a separate class, since a slot can't be declared along with
+    a dataclass field of the same name.
+    Subclasses, that redeclare the slot anyway (Python < 3.11), are fixed up
+    in ``FunPayObject.__init_subclass__()``.
+    """
+
+    __slots__ = ('raw_source',)
+
+
 @dataclass
-class FunPayObject:
-    """Base class for all FunPay-parsed objects."""
+class FunPayObject(_FunPayObjectSlots):
+    """
+    Base class for all FunPay-parsed objects.
+
+    Subclasses are slotted dataclasses (``@dataclass(slots=True)``), so parsed objects
+    don't carry a per-instance ``__dict__``.
+    """
+
+    __slots__ = ()
 
     raw_source: str = field(compare=False)
     """
     Raw source of an object.
     Typically a HTML string, but in rare cases can be a JSON string.
+
+    May be assigned a lazy raw source handle (see ``funpayparsers.raw_source``),
+    which is materialized into a ``str`` on first access.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Before Python 3.11, ``@dataclass(slots=True)`` redeclares slots of inherited fields,
+        # so the own ``raw_source`` slot of a subclass shadows the property (see below).
+        # The slot is left unused, the value is kept in the inherited one.
+        if isinstance(cls.__dict__.get('raw_source'), MemberDescriptorType):
+            cls.raw_source = FunPayObject.raw_source  # type: ignore[misc]
+
     def as_dict(self) -> dict[str, Any]:
         """
         Returns a dict representations of an instance.
+
+        Same as ``dataclasses.asdict()``, but much faster
+        (see ``funpayparsers.types.serialization.as_dict()``).
         """
-        return asdict(self)
+        return _serialization.as_dict(self)
 
     @classmethod
     def from_dict(cls: Type[SelfT], data: dict[str, Any]) -> SelfT:
         """
         Creates instance from a dict.
+
+        Nested objects and enum members are restored as well
+        (see ``funpayparsers.types.serialization.from_dict()``).
         """
-        return cls(**data)
+        return _serialization.from_dict(cls, data)
 
     @classmethod
     def from_raw_source(cls: type[SelfT], raw_source: str, options: Any = None) -> SelfT:
@@ -43,3 +86,125 @@ class FunPayObject:
         Create instance from a raw source using related parser.
         """
         raise NotImplementedError(f'{cls.__name__}.from_raw_source is not implemented.')
+
+
+def _get_raw_source(self: FunPayObject) -> str:
+    value = self._raw_source  # type: ignore[attr-defined] # see below
+    return value if value.__class__ is str else str(value)
+
+
+def _set_raw_source(self: FunPayObject, value: Any) -> None:
+    self._raw_source = value  # type: ignore[attr-defined] # see below
+
+
+# ``raw_source`` is declared as a regular dataclass field (so it stays a part of
+# ``__init__``, ``fields()``, ``asdict()``, etc.), but stored behind a property
+# to transparently materialize lazy raw source handles.
+# The value itself (possibly, a raw source handle) is kept in the ``raw_source`` slot,
+# accessible via its descriptor under the ``_raw_source`` name.
+FunPayObject._raw_source = _FunPayObjectSlots.raw_source  # type: ignore[attr-defined]
+FunPayObject.raw_source = property(_get_raw_source, _set_raw_source)  # type: ignore[assignment, misc]
+
+
+class _TimestampedObject(FunPayObject):
+    """Base class for objects with a timestamp property (see ``_cached_timestamp``)."""
+
+    __slots__ = ('_timestamp',)
+
+
+class _cached_timestamp:  # noqa: N801 # used as a decorator, like ``property``
+    """
+    ``functools.cached_property`` analogue for slotted ``_TimestampedObject`` subclasses:
+    computes the timestamp from the ``date_field`` date text on first access and keeps it
+    in the ``_timestamp`` slot.
+
+    The cached value is recomputed, if the date text is reassigned (e.g., by
+    ``funpayparsers.parsers.utils.resolve_messages_senders()``) or the timestamp is accessed
+    under another reference day (see ``funpayparsers.parsers.utils.get_reference_day()``):
+    in a context with another reference time or, if none is set, after midnight.
+    """
+
+    _get_reference_day: ClassVar[Callable[[], Any] | None] = None
+
+    def __init__(self, date_field: str):
+        """
+        :param date_field: name of the date text field, the timestamp is computed from.
+        """
+        self.date_field = date_field
+
+    def __call__(self, func: Callable[[Any], int]) -> _cached_timestamp:
+        self.func = func
+        self.__doc__ = func.__doc__
+        return self
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any] | None = None) -> _cached_timestamp: ...
+
+    @overload
+    def __get__(self, instance: _TimestampedObject, owner: type[Any] | None = None) -> int: ...
+
+    def __get__(
+        self, instance: _TimestampedObject | None, owner: type[Any] | None = None
+    ) -> int | _cached_timestamp:
+        if instance is None:
+            return self
+
+        get_reference_day = _cached_timestamp._get_reference_day
+        if get_reference_day is None:
+            # Imported on first access, since parsers import types.
+            from funpayparsers.parsers import utils
+
+            get_reference_day = _cached_timestamp._get_reference_day = utils.get_reference_day
+
+        key = (getattr(instance, self.date_field), get_reference_day())
+        try:
+            cached_key, value = instance._timestamp  # type: ignore[attr-defined]
+        except AttributeError:
+            pass
+        else:
+            if cached_key == key:
+                return value  # type: ignore[no-any-return]
+
+        value = self.func(instance)
+        instance._timestamp = (key, value)  # type: ignore[attr-defined]
+        return value
+
+
+class _NotParsedType:
+    """Type of ``NOT_PARSED`` sentinel."""
+
+    __slots__ = ()
+    _instance: _NotParsedType | None = None
+
+    def __new__(cls) -> _NotParsedType:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self) -> str:
+        return 'NOT_PARSED'
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __copy__(self) -> _NotParsedType:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> _NotParsedType:
+        return self
+
+    def __reduce__(self) -> str:
+        return 'NOT_PARSED'
+
+
+NOT_PARSED: Any = _NotParsedType()
+"""
+Value of ``FunPayObject`` fields, that were not requested and therefore were not parsed
+(e.g., page fields, skipped with ``PageParsingOptions.fields``).
+
+Falsy, compared by identity (``obj.field is NOT_PARSED``), survives copying and pickling.
+"""
+
+
+# Imported at the end, since ``serialization`` depends on ``FunPayObject`` and ``NOT_PARSED``.
+import funpayparsers.types.serialization as _serialization  # noqa: E402
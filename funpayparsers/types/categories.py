@@ -9,7 +9,7 @@ from funpayparsers.types.base import FunPayObject
 from funpayparsers.types.enums import SubcategoryType
 
 
-@dataclass
+@dataclass(slots=True)
 class Category(FunPayObject):
     """Represents a category from FunPay main page."""
 
@@ -31,7 +31,7 @@ class Category(FunPayObject):
         return f'{self.name} ({self.location})'
 
 
-@dataclass
+@dataclass(slots=True)
 class Subcategory(FunPayObject):
     """Represents a subcategory from FunPay main page."""
 
@@ -6,7 +6,7 @@ __all__ = ('PrivateChatPreview', 'Chat', 'PrivateChatInfo')
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
-from funpayparsers.types.base import FunPayObject
+from funpayparsers.types.base import FunPayObject, _cached_timestamp, _TimestampedObject
 
 
 if TYPE_CHECKING:
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from funpayparsers.types.messages import Message
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivateChatPreview(FunPayObject):
     """Represents a private chat preview."""
 
@@ -59,7 +59,7 @@ class PrivateChatPreview(FunPayObject):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class Chat(FunPayObject):
     """Represents a chat."""
 
@@ -95,8 +95,8 @@ class Chat(FunPayObject):
     """
 
 
-@dataclass
-class PrivateChatInfo(FunPayObject):
+@dataclass(slots=True)
+class PrivateChatInfo(_TimestampedObject):
     """
     Represents a private chat info.
 
@@ -119,12 +119,13 @@ class PrivateChatInfo(FunPayObject):
     Info about the offer currently being viewed by the interlocutor.
     """
 
-    @property
+    @_cached_timestamp('registration_date_text')
     def registration_timestamp(self) -> int:
         """
         Interlocutors registration timestamp.
 
         ``0``, if an error occurred while parsing.
+        Computed on first access (see ``funpayparsers.parsers.utils.use_reference_time``).
         """
         from funpayparsers.parsers.utils import parse_date_string
         try:
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+
+__all__ = ('DictionaryColumn', 'OfferPreviewColumns')
+
+from typing import TYPE_CHECKING, Any
+from dataclasses import field, dataclass
+from array import array
+
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+
+@dataclass(slots=True)
+class DictionaryColumn:
+    """
+    Dictionary-encoded column: every row holds an index of its value in ``values``.
+
+    Examples:
+        >>> column = DictionaryColumn()
+        >>> for value in (3, 'EU', 3, None):
+        ...     column.append(value)
+        >>> column.codes.tolist(), column.values, column.to_list()
+        ([0, 1, 0, -1], [3, 'EU'], [3, 'EU', 3, None])
+    """
+
+    codes: array[int] = field(default_factory=lambda: array('i'))
+    """Indexes of values in ``values`` (``-1`` for missing values)."""
+
+    values: list[str | int] = field(default_factory=list)
+    """Distinct values, in order of their first appearance."""
+
+    _indexes: dict[str | int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def append(self, value: str | int | None) -> None:
+        """Appends a row."""
+        if value is None:
+            self.codes.append(-1)
+            return
+
+        index = self._indexes.get(value)
+        if index is None:
+            index = self._indexes[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(index)
+
+    def to_list(self) -> list[str | int | None]:
+        """Returns decoded values of all rows (``None`` for missing values)."""
+        values: list[str | int | None] = [*self.values, None]  # code -1 -> None
+        return [values[i] for i in self.codes]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+@dataclass(slots=True)
+class OfferPreviewColumns:
+    """
+    Offer previews in columnar form
+    (see ``OfferPreviewsParser.parse_columns()``).
+
+    Every column has a value for every offer preview, in order of offer previews.
+    Missing values are stored as sentinels, documented for every column.
+    """
+
+    ids: array[int] | list[str] = field(default_factory=lambda: array('q'))
+    """
+    Offer IDs.
+
+    ``array('q')`` of integer IDs for common offers,
+    ``list`` of string IDs, if there are currency offers.
+    """
+
+    prices: array[float] = field(default_factory=lambda: array('d'))
+    """Offer prices (see ``OfferPreview.price``), ``nan`` if there is no price."""
+
+    amounts: array[int] = field(default_factory=lambda: array('q'))
+    """Goods amounts, ``-1`` if not specified."""
+
+    seller_ids: array[int] = field(default_factory=lambda: array('q'))
+    """Seller IDs, ``-1`` if there is no seller (e.g., offer previews from a profile page)."""
+
+    online: array[int] = field(default_factory=lambda: array('b'))
+    """Whether sellers are online (``0`` / ``1``)."""
+
+    auto_delivery: array[int] = field(default_factory=lambda: array('b'))
+    """Whether auto delivery is enabled (``0`` / ``1``)."""
+
+    other_data: dict[str, DictionaryColumn] = field(default_factory=dict)
+    """
+    Dictionary-encoded columns of ``OfferPreview.other_data`` entries
+    (``data-*`` attributes, e.g., ``server``, ``side``, ``user``), by entry name.
+    """
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def to_numpy(self) -> dict[str, numpy.ndarray[Any, Any]]:
+        """
+        Converts columns into NumPy arrays (requires ``numpy``).
+
+        Sentinels of missing values are kept as is, ``other_data`` columns are decoded
+        into ``object`` arrays (with ``None`` for missing values)
+        and named ``other_data.<name>``.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError('OfferPreviewColumns.to_numpy() requires numpy.') from e
+
+        result = {
+            'id': np.array(self.ids, dtype=np.int64 if isinstance(self.ids, array) else object),
+            'price': np.frombuffer(self.prices, dtype=np.float64).copy(),
+            'amount': np.frombuffer(self.amounts, dtype=np.int64).copy(),
+            'seller_id': np.frombuffer(self.seller_ids, dtype=np.int64).copy(),
+            'online': np.frombuffer(self.online, dtype=np.int8).astype(bool),
+            'auto_delivery': np.frombuffer(self.auto_delivery, dtype=np.int8).astype(bool),
+        }
+        for name, column in self.other_data.items():
+            values = np.array([*column.values, None], dtype=object)
+            result[f'other_data.{name}'] = values[np.frombuffer(column.codes, dtype=np.int32)]
+        return result
+
+    def to_arrow(self) -> pyarrow.Table:
+        """
+        Converts columns into a ``pyarrow.Table`` (requires ``pyarrow``).
+
+        Missing values are converted into nulls, ``other_data`` columns are converted
+        into dictionary arrays and named ``other_data.<name>``.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError('OfferPreviewColumns.to_arrow() requires pyarrow.') from e
+
+        id_type = pa.int64() if isinstance(self.ids, array) else pa.string()
+        columns = {
+            'id': pa.array(list(self.ids), type=id_type),
+            # from_pandas=True converts nan into null
+            'price': pa.array(list(self.prices), type=pa.float64(), from_pandas=True),
+            'amount': pa.array([None if i < 0 else i for i in self.amounts], type=pa.int64()),
+            'seller_id': pa.array(
+                [None if i < 0 else i for i in self.seller_ids], type=pa.int64()
+            ),
+            'online': pa.array([bool(i) for i in self.online], type=pa.bool_()),
+            'auto_delivery': pa.array([bool(i) for i in self.auto_delivery], type=pa.bool_()),
+        }
+        for name, column in self.other_data.items():
+            values = column.values
+            if not all(isinstance(i, int) for i in values):
+                values = [str(i) for i in values]
+            columns[f'other_data.{name}'] = pa.DictionaryArray.from_arrays(
+                pa.array([None if i < 0 else i for i in column.codes], type=pa.int32()),
+                pa.array(values),
+            )
+        return pa.table(columns)
@@ -11,12 +11,13 @@ __all__ = (
 )
 
 from dataclasses import dataclass
+from decimal import Decimal
 
 from funpayparsers.types.base import FunPayObject
 from funpayparsers.types.enums import Currency, BadgeType
 
 
-@dataclass
+@dataclass(slots=True)
 class MoneyValue(FunPayObject):
     """
     Represents a monetary value with an associated currency.
@@ -28,8 +29,12 @@ class MoneyValue(FunPayObject):
         - etc.
     """
 
-    value: int | float
-    """The numeric amount of the monetary value."""
+    value: int | float | Decimal
+    """
+    The numeric amount of the monetary value.
+
+    ``decimal.Decimal``, if parsed with ``MoneyValueParsingOptions.exact``.
+    """
 
     character: str
     """The currency character, e.g., ``'$'``, ``'€'``, ``'₽'``, ``'¤'``, etc."""
@@ -39,7 +44,7 @@ class MoneyValue(FunPayObject):
         return Currency.get_by_character(self.character)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserBadge(FunPayObject):
     """
     Represents a user badge.
@@ -75,7 +80,7 @@ class UserBadge(FunPayObject):
         return BadgeType.get_by_css_class(self.css_class)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserPreview(FunPayObject):
     """
     Represents user preview.
@@ -100,7 +105,7 @@ class UserPreview(FunPayObject):
     """User avatar URL."""
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRating(FunPayObject):
     """
     Represents full user rating.
@@ -128,7 +133,7 @@ class UserRating(FunPayObject):
     """One star reviews percentage."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Achievement(FunPayObject):
     """Represents a user achievement."""
 
@@ -139,7 +144,7 @@ class Achievement(FunPayObject):
     """Achievement text."""
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrentlyViewingOfferInfo(FunPayObject):
     """represents a currently viewing offer info."""
 
@@ -10,7 +10,7 @@ from funpayparsers.types.enums import Currency, Language
 from funpayparsers.types.common import MoneyValue
 
 
-@dataclass
+@dataclass(slots=True)
 class WebPush(FunPayObject):
     """Represents a WebPush data extracted from an AppData dict."""
 
@@ -24,7 +24,7 @@ class WebPush(FunPayObject):
     """Whether HWID is required or not."""
 
 
-@dataclass
+@dataclass(slots=True)
 class AppData(FunPayObject):
     """
     Represents an AppData dict.
@@ -43,7 +43,7 @@ class AppData(FunPayObject):
     """WebPush info."""
 
 
-@dataclass
+@dataclass(slots=True)
 class PageHeader(FunPayObject):
     """
     Represents the header section of a FunPay page.
@@ -15,11 +15,11 @@ __all__ = (
 
 
 import re
-from typing import Any
+from typing import Any, TypeVar, cast
 from dataclasses import dataclass
 from enum import Enum
 from types import MappingProxyType
-from functools import cache
+from functools import lru_cache
 
 from funpayparsers import message_type_re as msg_re
 
@@ -45,10 +45,33 @@ class RunnerDataType(Enum):
     @staticmethod
     def get_by_type_str(type_str: str, /) -> RunnerDataType | None:
         """Determine an update type by its type string."""
-        for i in RunnerDataType:
-            if i.value == type_str:
-                return i
-        return None
+        return _RUNNER_DATA_TYPE_BY_TYPE_STR.get(type_str)
+
+
+_RUNNER_DATA_TYPE_BY_TYPE_STR: MappingProxyType[str, RunnerDataType] = MappingProxyType(
+    {i.value: i for i in RunnerDataType}
+)
+
+
+_E = TypeVar('_E', bound=Enum)
+
+
+def _by_css_class(css_class: str, table: MappingProxyType[str, _E]) -> _E | None:
+    """
+    Looks up each class of ``css_class`` in ``table`` (CSS class -> enum member).
+
+    If no class matches exactly, falls back to substring search,
+    so modified classes (e.g., ``'text-success-lg'``) still match.
+    """
+    for token in css_class.split():
+        member = table.get(token)
+        if member is not None:
+            return member
+
+    for cls, member in table.items():
+        if cls in css_class:
+            return member
+    return None
 
 
 @dataclass(frozen=True)
@@ -74,24 +97,32 @@ class SubcategoryType(Enum):
         """
         Determine a subcategory type by URL.
         """
-        for i in SubcategoryType:
-            if i is SubcategoryType.UNKNOWN:
-                continue
-            if i.value.url_alias in url:
-                return i
-        return SubcategoryType.UNKNOWN
+        return _subcategory_type_by_url(url)
 
     @staticmethod
     def get_by_showcase_data_section(showcase_data_section: str, /) -> SubcategoryType:
         """
         Determine a subcategory type by showcase data section value.
         """
-        for i in SubcategoryType:
-            if i is SubcategoryType.UNKNOWN:
-                continue
-            if i.value.showcase_alias in showcase_data_section:
-                return i
-        return SubcategoryType.UNKNOWN
+        return _subcategory_type_by_showcase_data_section(showcase_data_section)
+
+
+# The same subcategory URLs / data sections are resolved over and over
+# (every offer of a profile page, every subcategory of a categories list).
+@lru_cache(maxsize=4096)
+def _subcategory_type_by_url(url: str, /) -> SubcategoryType:
+    for i in (SubcategoryType.COMMON, SubcategoryType.CURRENCY):
+        if i.value.url_alias in url:
+            return i
+    return SubcategoryType.UNKNOWN
+
+
+@lru_cache(maxsize=4096)
+def _subcategory_type_by_showcase_data_section(showcase_data_section: str, /) -> SubcategoryType:
+    for i in (SubcategoryType.COMMON, SubcategoryType.CURRENCY):
+        if i.value.showcase_alias in showcase_data_section:
+            return i
+    return SubcategoryType.UNKNOWN
 
 
 class OrderStatus(Enum):
@@ -118,13 +149,12 @@ class OrderStatus(Enum):
         """
         Determine the order status based on a given CSS class string.
         """
-        for i in OrderStatus:
-            if i is OrderStatus.UNKNOWN:
-                continue
+        return _by_css_class(css_class, _ORDER_STATUS_BY_CSS_CLASS) or OrderStatus.UNKNOWN
+
 
-            if i.value in css_class:
-                return i
-        return OrderStatus.UNKNOWN
+_ORDER_STATUS_BY_CSS_CLASS: MappingProxyType[str, OrderStatus] = MappingProxyType(
+    {i.value: i for i in OrderStatus if i is not OrderStatus.UNKNOWN}
+)
 
 
 class Currency(Enum):
@@ -140,10 +170,12 @@ class Currency(Enum):
     @staticmethod
     def get_by_character(character: str, /) -> Currency:
         """Determine the currency based on a given currency string."""
-        for i in Currency:
-            if i.value == character:
-                return i
-        return Currency.UNKNOWN
+        return _CURRENCY_BY_CHARACTER.get(character) or Currency.UNKNOWN
+
+
+_CURRENCY_BY_CHARACTER: MappingProxyType[str, Currency] = MappingProxyType(
+    {i.value: i for i in Currency}
+)
 
 
 class TransactionStatus(Enum):
@@ -166,14 +198,14 @@ class TransactionStatus(Enum):
         """
         Determine the transaction type based on a given CSS class string.
         """
+        return (
+            _by_css_class(css_class, _TRANSACTION_STATUS_BY_CSS_CLASS) or TransactionStatus.UNKNOWN
+        )
 
-        for i in TransactionStatus:
-            if i is TransactionStatus.UNKNOWN:
-                continue
 
-            if i.value in css_class:
-                return i
-        return TransactionStatus.UNKNOWN
+_TRANSACTION_STATUS_BY_CSS_CLASS: MappingProxyType[str, TransactionStatus] = MappingProxyType(
+    {i.value: i for i in TransactionStatus if i is not TransactionStatus.UNKNOWN}
+)
 
 
 class MessageType(Enum):
@@ -194,13 +226,19 @@ class MessageType(Enum):
 
     @staticmethod
     def get_by_message_text(message_text: str, /) -> MessageType:
-        for i in MessageType:
-            if i.value is None:
-                continue
+        """
+        Determine the message type by message text.
 
-            if i.value.fullmatch(message_text):
-                return i
+        The message prefix (see ``message_type_re.TYPE_PREFIX``) selects the only candidate type,
+        so a single full RE is matched, regardless of the amount of message types.
+        """
+        prefix = msg_re.TYPE_PREFIX.match(message_text)
+        if prefix is None:
+            return MessageType.NON_SYSTEM
 
+        candidate = MessageType[cast(str, prefix.lastgroup)]
+        if cast(re.Pattern[str], candidate.value).fullmatch(message_text):
+            return candidate
         return MessageType.NON_SYSTEM
 
 
@@ -219,13 +257,12 @@ class BadgeType(Enum):
         """
         Determine the badge type based on a given CSS class string.
         """
-        for i in BadgeType:
-            if i is BadgeType.UNKNOWN:
-                continue
+        return _by_css_class(css_class, _BADGE_TYPE_BY_CSS_CLASS) or BadgeType.UNKNOWN
+
 
-            if i.value in css_class:
-                return i
-        return BadgeType.UNKNOWN
+_BADGE_TYPE_BY_CSS_CLASS: MappingProxyType[str, BadgeType] = MappingProxyType(
+    {i.value: i for i in BadgeType if i is not BadgeType.UNKNOWN}
+)
 
 
 _PAYMENT_METHOD_CLS_RE = re.compile(r'payment-method-[a-zA-Z0-9_]+')
@@ -440,11 +477,9 @@ class PaymentMethod(Enum):
     # MIR = 26, ('UNKNOWN', ), (345, Y)  =(
 
     @staticmethod
-    @cache
     def css_class_to_method_map() -> MappingProxyType[str, PaymentMethod]:
-        return MappingProxyType(
-            {css_class: method for method in PaymentMethod for css_class in method.value}
-        )
+        """CSS class -> payment method read-only mapping."""
+        return _PAYMENT_METHOD_BY_CSS_CLASS
 
     @staticmethod
     def get_by_css_class(css_class: str, /) -> PaymentMethod:
@@ -454,7 +489,13 @@ class PaymentMethod(Enum):
             return PaymentMethod.UNKNOWN
 
         css_class = match.string[match.start() : match.end()]
-        return PaymentMethod.css_class_to_method_map().get(css_class) or PaymentMethod.UNKNOWN
+        return _PAYMENT_METHOD_BY_CSS_CLASS.get(css_class) or PaymentMethod.UNKNOWN
+
+
+# Built once at import time (instead of on first use), so lookups never mutate shared state.
+_PAYMENT_METHOD_BY_CSS_CLASS: MappingProxyType[str, PaymentMethod] = MappingProxyType(
+    {css_class: method for method in PaymentMethod for css_class in method.value}
+)
 
 
 @dataclass(frozen=True)
@@ -474,20 +515,19 @@ class Language(Enum):
 
     @staticmethod
     def get_by_lang_code(lang_code: Any, /) -> Language:
-        for i in Language:
-            if i is Language.UNKNOWN:
-                continue
-
-            if i.value.appdata_alias == lang_code:
-                return i
-        return Language.UNKNOWN
+        if not isinstance(lang_code, str):
+            return Language.UNKNOWN
+        return _LANGUAGE_BY_LANG_CODE.get(lang_code) or Language.UNKNOWN
 
     @staticmethod
     def get_by_header_menu_css_class(css_class: str, /) -> Language:
-        for i in Language:
-            if i is Language.UNKNOWN:
-                continue
+        return _by_css_class(css_class, _LANGUAGE_BY_HEADER_MENU_CSS_CLASS) or Language.UNKNOWN
 
-            if i.value.header_menu_css_class in css_class:
-                return i
-        return Language.UNKNOWN
+
+_LANGUAGE_BY_LANG_CODE: MappingProxyType[str, Language] = MappingProxyType(
+    {i.value.appdata_alias: i for i in Language if i is not Language.UNKNOWN}
+)
+
+_LANGUAGE_BY_HEADER_MENU_CSS_CLASS: MappingProxyType[str, Language] = MappingProxyType(
+    {i.value.header_menu_css_class: i for i in Language if i is not Language.UNKNOWN}
+)
@@ -6,13 +6,13 @@ __all__ = ('TransactionPreview', 'TransactionInfo', 'TransactionPreviewsBatch')
 
 from dataclasses import dataclass
 
-from funpayparsers.types.base import FunPayObject
+from funpayparsers.types.base import FunPayObject, _cached_timestamp, _TimestampedObject
 from funpayparsers.types.enums import PaymentMethod, TransactionStatus
 from funpayparsers.types.common import MoneyValue
 
 
-@dataclass
-class TransactionPreview(FunPayObject):
+@dataclass(slots=True)
+class TransactionPreview(_TimestampedObject):
     """Represents a transaction preview."""
 
     id: int
@@ -36,12 +36,13 @@ class TransactionPreview(FunPayObject):
     withdrawal_number: str | None
     """Withdrawal card / phone / wallet number, if applicable."""
 
-    @property
+    @_cached_timestamp('date_text')
     def timestamp(self) -> int:
         """
         Transaction timestamp.
 
         ``0``, if an error occurred while parsing.
+        Computed on first access (see ``funpayparsers.parsers.utils.use_reference_time``).
         """
         from funpayparsers.parsers.utils import parse_date_string
         try:
@@ -50,7 +51,7 @@ class TransactionPreview(FunPayObject):
             return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionInfo(FunPayObject):
     """Represents a transaction info."""
 
@@ -61,7 +62,7 @@ class TransactionInfo(FunPayObject):
     """Transaction data."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionPreviewsBatch(FunPayObject):
     """
     Represents a single batch of transaction previews returned by FunPay.
@@ -5,12 +5,12 @@ __all__ = ('Message', 'MessageMeta')
 
 from dataclasses import dataclass
 
-from funpayparsers.types.base import FunPayObject
+from funpayparsers.types.base import FunPayObject, _cached_timestamp, _TimestampedObject
 from funpayparsers.types.enums import MessageType
 from funpayparsers.types.common import UserBadge
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageMeta(FunPayObject):
     """
     Represents a message meta info.
@@ -44,8 +44,8 @@ class MessageMeta(FunPayObject):
     """Mentioned admin username."""
 
 
-@dataclass
-class Message(FunPayObject):
+@dataclass(slots=True)
+class Message(_TimestampedObject):
     """Represents a message from any FunPay chat (private or public)."""
 
     id: int
@@ -116,8 +116,14 @@ class Message(FunPayObject):
     Message meta info (message type, mentioned users / order).
     """
 
-    @property
+    @_cached_timestamp('send_date_text')
     def timestamp(self) -> int:
+        """
+        Message timestamp.
+
+        ``0``, if the message has no date.
+        Computed on first access (see ``funpayparsers.parsers.utils.use_reference_time``).
+        """
         from funpayparsers.parsers.utils import parse_date_string
 
         if not self.send_date_text:
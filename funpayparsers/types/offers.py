@@ -6,14 +6,14 @@ __all__ = ('OfferPreview', 'OfferSeller', 'OfferFields')
 from dataclasses import field, dataclass
 from typing import Any, TypeVar, ParamSpec
 
-from funpayparsers.types.base import FunPayObject
+from funpayparsers.types.base import FunPayObject, _cached_timestamp, _TimestampedObject
 from funpayparsers.types.common import MoneyValue
 from typing_extensions import Self
 from collections.abc import Callable
 
 
-@dataclass
-class OfferSeller(FunPayObject):
+@dataclass(slots=True)
+class OfferSeller(_TimestampedObject):
     """Represents the seller of an offer."""
 
     id: int
@@ -37,12 +37,13 @@ class OfferSeller(FunPayObject):
     reviews_amount: int
     """The total number of reviews received by the seller."""
 
-    @property
+    @_cached_timestamp('registration_date_text')
     def registration_timestamp(self) -> int:
         """
         The seller's registration timestamp.
 
         ``0``, if an error occurred while parsing.
+        Computed on first access (see ``funpayparsers.parsers.utils.use_reference_time``).
         """
         from funpayparsers.parsers.utils import parse_date_string
         try:
@@ -51,7 +52,7 @@ class OfferSeller(FunPayObject):
             return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class OfferPreview(FunPayObject):
     """Represents an offer preview."""
 
@@ -118,7 +119,7 @@ def common_only(func: Callable[P, T]) -> Callable[P, T]:
     return wrapper
 
 
-@dataclass
+@dataclass(slots=True)
 class OfferFields(FunPayObject):
     """
     Represents the full set of form fields used to construct or update
@@ -7,7 +7,7 @@ __all__ = ('OrderPreview', 'OrderPreviewsBatch')
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
-from funpayparsers.types.base import FunPayObject
+from funpayparsers.types.base import FunPayObject, _cached_timestamp, _TimestampedObject
 from funpayparsers.types.enums import OrderStatus
 from funpayparsers.types.common import MoneyValue
 
@@ -16,8 +16,8 @@ if TYPE_CHECKING:
     from funpayparsers.types.common import UserPreview
 
 
-@dataclass
-class OrderPreview(FunPayObject):
+@dataclass(slots=True)
+class OrderPreview(_TimestampedObject):
     """Represents an order preview."""
 
     id: str
@@ -41,12 +41,13 @@ class OrderPreview(FunPayObject):
     counterparty: UserPreview
     """Associated counterparty info."""
 
-    @property
+    @_cached_timestamp('date_text')
     def timestamp(self) -> int:
         """
         Order timestamp.
 
         ``0``, if an error occurred while parsing.
+        Computed on first access (see ``funpayparsers.parsers.utils.use_reference_time``).
         """
         from funpayparsers.parsers.utils import parse_date_string
         try:
@@ -55,7 +56,7 @@ class OrderPreview(FunPayObject):
             return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderPreviewsBatch(FunPayObject):
     """
     Represents a single batch of order previews.
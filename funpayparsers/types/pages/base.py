@@ -10,7 +10,7 @@ from funpayparsers.types.base import FunPayObject
 from funpayparsers.types.common_page_elements import AppData, PageHeader
 
 
-@dataclass
+@dataclass(slots=True)
 class FunPayPage(FunPayObject):
     """Base class for FunPay pages."""
 
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from funpayparsers.parsers.page_parsers.chat_page_parser import ChatPageParsingOptions
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatPage(FunPayPage):
     """Represents a chat page (`https://funpay.com/chat/?node=<chat_id>`)."""
 
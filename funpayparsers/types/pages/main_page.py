@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from funpayparsers.parsers.page_parsers.main_page_parser import MainPageParsingOptions
 
 
-@dataclass
+@dataclass(slots=True)
 class MainPage(FunPayPage):
     """Represents the main page (https://funpay.com)."""
 
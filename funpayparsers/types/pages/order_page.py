@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from funpayparsers.parsers.page_parsers.order_page_parser import OrderPageParsingOptions
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderPage(FunPayPage):
     """Represents an order page (`https://funpay.com/orders/<order_id>/`)."""
 
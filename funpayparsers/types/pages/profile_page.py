@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from funpayparsers.parsers.page_parsers.profile_page_parser import ProfilePageParsingOptions
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfilePage(FunPayPage):
     """Represents a user profile page (`https://funpay.com/users/<user_id>`)."""
 
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class SubcategoryPage(FunPayPage):
     """
     Represents a subcategory offers list page
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionsPage(FunPayPage):
     """Represents the transactions page (https://funpay.com/account/balance)."""
 
@@ -6,12 +6,12 @@ __all__ = ('Review', 'ReviewsBatch')
 
 from dataclasses import dataclass
 
-from funpayparsers.types.base import FunPayObject
+from funpayparsers.types.base import FunPayObject, _cached_timestamp, _TimestampedObject
 from funpayparsers.types.common import MoneyValue
 
 
-@dataclass
-class Review(FunPayObject):
+@dataclass(slots=True)
+class Review(_TimestampedObject):
     """
     Represents a review.
 
@@ -74,7 +74,7 @@ class Review(FunPayObject):
     reply: str | None
     """Sellers reply to this review."""
 
-    @property
+    @_cached_timestamp('date_text')
     def timestamp(self) -> int:
         """
         Review timestamp.
@@ -82,6 +82,7 @@ class Review(FunPayObject):
         Available only for owned reviews (from your profile page or that has been written by you).
 
         ``0``, if an error occurred while parsing.
+        Computed on first access (see ``funpayparsers.parsers.utils.use_reference_time``).
         """
         from funpayparsers.parsers.utils import parse_date_string
         if self.date_text is None:
@@ -92,7 +93,7 @@ class Review(FunPayObject):
             return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewsBatch(FunPayObject):
     """
     Represents a single batch of reviews.
@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+
+__all__ = ('as_dict', 'from_dict')
+
+import copy
+from typing import TYPE_CHECKING, Any, TypeVar, Callable
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from decimal import Decimal
+from functools import lru_cache
+
+from funpayparsers.types.base import NOT_PARSED, FunPayObject
+from funpayparsers.types._hints import (
+    Converter,
+    ConverterBuilder,
+    identity,
+    get_fields,
+    typevars_of,
+    compile_function,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+_T = TypeVar('_T', bound=FunPayObject)
+
+_ATOMIC_TYPES = frozenset({int, float, str, bool, bytes, Decimal, type(None)})
+
+
+def as_dict(obj: FunPayObject, /) -> dict[str, Any]:
+    """
+    Returns a dict representation of an object.
+
+    The result is the same as ``dataclasses.asdict(obj)`` returns (nested objects are
+    converted into dicts, enum members are kept as is), but it is built by a function,
+    generated once per class from field annotations,
+    so it is an order of magnitude faster.
+
+    Examples:
+        >>> from funpayparsers.types import MoneyValue
+        >>> as_dict(MoneyValue(raw_source='', value=10, character='₽'))
+        {'raw_source': '', 'value': 10, 'character': '₽'}
+    """
+    cls = obj.__class__
+    return (_DUMPERS.get(cls) or _compile_dumper(cls))(obj)
+
+
+def from_dict(cls: type[_T], data: Mapping[str, Any], /) -> _T:
+    """
+    Creates an object of ``cls`` from its dict representation (see ``as_dict()``).
+
+    Nested objects, lists / tuples / dicts of objects and enum members are restored
+    according to field annotations. Enum members may be given as members, names or values.
+    Values, that are already restored (e.g., objects instead of dicts), are kept as is.
+
+    Examples:
+        >>> from funpayparsers.types import OrderPreview
+        >>> from funpayparsers.types.enums import OrderStatus
+        >>> data = {
+        ...     'raw_source': '', 'id': 'ABCDEFGH', 'date_text': '', 'title': '',
+        ...     'category_text': '', 'status': 'PAID',
+        ...     'total': {'raw_source': '', 'value': 10, 'character': '₽'},
+        ...     'counterparty': {
+        ...         'raw_source': '', 'id': 1, 'username': 'user', 'online': False,
+        ...         'banned': False, 'status_text': '', 'avatar_url': '',
+        ...     },
+        ... }
+        >>> order = from_dict(OrderPreview, data)
+        >>> order.status is OrderStatus.PAID, order.total.value
+        (True, 10)
+    """
+    return _loader(cls, ())(data)  # type: ignore[no-any-return]
+
+
+# ------ Dumping ------
+_DUMPERS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+
+def _dump_value(value: Any) -> Any:
+    """Converts a value of an unknown type the same way ``dataclasses.asdict()`` does."""
+    cls = value.__class__
+    if cls in _ATOMIC_TYPES:
+        return value
+    if isinstance(value, FunPayObject):
+        return (_DUMPERS.get(cls) or _compile_dumper(cls))(value)
+    if isinstance(value, (list, tuple)) and not hasattr(value, '_fields'):
+        return cls(_dump_value(i) for i in value)
+    if isinstance(value, dict):
+        return cls((_dump_value(k), _dump_value(v)) for k, v in value.items())
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return copy.deepcopy(value)
+
+
+def _dump_object(cls: type) -> Converter:
+    def dump(value: Any) -> Any:
+        if value.__class__ is cls:
+            return (_DUMPERS.get(cls) or _compile_dumper(cls))(value)
+        return _dump_value(value)
+
+    return dump
+
+
+def _dump_list(item: Converter | None) -> Converter:
+    if item is None:
+
+        def dump(value: Any) -> Any:
+            return value[:] if value.__class__ is list else _dump_value(value)
+    else:
+
+        def dump(value: Any) -> Any:
+            if value.__class__ is list:
+                return [item(i) for i in value]
+            return _dump_value(value)
+
+    return dump
+
+
+def _dump_tuple(item: Converter | None) -> Converter:
+    def dump(value: Any) -> Any:
+        if value.__class__ is tuple:
+            return value if item is None else tuple(item(i) for i in value)
+        return _dump_value(value)
+
+    return dump
+
+
+def _dump_dict(key: Converter | None, item: Converter | None) -> Converter:
+    if key is None and item is None:
+
+        def dump(value: Any) -> Any:
+            return value.copy() if value.__class__ is dict else _dump_value(value)
+    else:
+        key, item = key or identity, item or identity
+
+        def dump(value: Any) -> Any:
+            if value.__class__ is dict:
+                return {key(k): item(v) for k, v in value.items()}
+            return _dump_value(value)
+
+    return dump
+
+
+class _DumperBuilder(ConverterBuilder):
+    """Builds converters for ``as_dict()``."""
+
+    atomic_types = _ATOMIC_TYPES
+
+    def is_atomic(self, hint: Any) -> bool:
+        return super().is_atomic(hint) or (isinstance(hint, type) and issubclass(hint, Enum))
+
+    def for_enum(self, enum: type[Enum]) -> Converter | None:
+        return None
+
+    def for_object(self, cls: type, args: tuple[Any, ...]) -> Converter | None:
+        return _dump_object(cls)
+
+    def for_list(self, item: Converter | None) -> Converter | None:
+        return _dump_list(item)
+
+    def for_tuple(self, item: Converter | None) -> Converter | None:
+        return _dump_tuple(item)
+
+    def for_dict(self, key: Converter | None, item: Converter | None) -> Converter | None:
+        return _dump_dict(key, item)
+
+    def for_other(self) -> Converter | None:
+        return _dump_value
+
+
+_DUMPER_BUILDER = _DumperBuilder()
+
+
+def _compile_dumper(cls: type) -> Callable[[Any], dict[str, Any]]:
+    namespace: dict[str, Any] = {}
+    items = []
+    for f, hint in get_fields(cls):
+        converter = _DUMPER_BUILDER.build(hint)
+        if converter is None:
+            items.append(f'{f!r}: obj.{f}')
+        else:
+            namespace[f'_dump_{f}'] = converter
+            items.append(f'{f!r}: _dump_{f}(obj.{f})')
+
+    func = compile_function(
+        'as_dict', f'def as_dict(obj):\n    return {{{", ".join(items)}}}', namespace
+    )
+    _DUMPERS[cls] = func
+    return func
+
+
+# ------ Loading ------
+_LOADERS: dict[tuple[type, tuple[Any, ...]], Callable[[Any], Any]] = {}
+
+
+def _load_object(cls: type, args: tuple[Any, ...]) -> Converter:
+    def load(value: Any) -> Any:
+        if value.__class__ is dict:
+            return _loader(cls, args)(value)
+        return value
+
+    return load
+
+
+def _load_list(item: Converter) -> Converter:
+    def load(value: Any) -> Any:
+        if value.__class__ is list:
+            return [item(i) for i in value]
+        return value
+
+    return load
+
+
+def _load_tuple(item: Converter | None) -> Converter:
+    item = item or identity
+
+    def load(value: Any) -> Any:
+        if value.__class__ is list or value.__class__ is tuple:
+            return tuple(item(i) for i in value)
+        return value
+
+    return load
+
+
+def _load_dict(key: Converter | None, item: Converter | None) -> Converter:
+    key = key or identity
+    item = item or identity
+
+    def load(value: Any) -> Any:
+        if value.__class__ is dict:
+            return {key(k): item(v) for k, v in value.items()}
+        return value
+
+    return load
+
+
+def _load_enum(enum: Any) -> Converter:
+    members = enum.__members__
+
+    def load(value: Any) -> Any:
+        if value.__class__ is enum or value is None or value is NOT_PARSED:
+            return value
+        member = members.get(value) if value.__class__ is str else None
+        return member if member is not None else enum(value)
+
+    return load
+
+
+class _LoaderBuilder(ConverterBuilder):
+    """Builds converters for ``from_dict()``."""
+
+    atomic_types = _ATOMIC_TYPES
+
+    def for_enum(self, enum: type[Enum]) -> Converter | None:
+        return _load_enum(enum)
+
+    def for_object(self, cls: type, args: tuple[Any, ...]) -> Converter | None:
+        return _load_object(cls, args)
+
+    def for_list(self, item: Converter | None) -> Converter | None:
+        return None if item is None else _load_list(item)
+
+    def for_tuple(self, item: Converter | None) -> Converter | None:
+        return _load_tuple(item)
+
+    def for_dict(self, key: Converter | None, item: Converter | None) -> Converter | None:
+        return None if key is None and item is None else _load_dict(key, item)
+
+    def for_other(self) -> Converter | None:
+        return None
+
+
+_LOADER_BUILDER = _LoaderBuilder()
+
+
+def _load_by_discriminator(
+    discriminator: str, classes: Mapping[Any, type]
+) -> Callable[[Any, dict[str, Any]], Any]:
+    """
+    Returns a converter for a generic field, which type depends on
+    the value of ``discriminator`` field (e.g., ``RunnerResponseObject.data``).
+
+    The converter takes the value and the keyword arguments of the object.
+    """
+
+    def load(value: Any, kwargs: dict[str, Any]) -> Any:
+        cls = classes.get(kwargs.get(discriminator))
+        if cls is None or value.__class__ is not dict:
+            return value
+        return _loader(cls, ())(value)
+
+    return load
+
+
+def _loader(cls: type, args: tuple[Any, ...]) -> Callable[[Any], Any]:
+    func = _LOADERS.get((cls, args))
+    if func is None:
+        func = _LOADERS[cls, args] = _compile_loader(cls, args)
+    return func
+
+
+def _compile_loader(cls: type, args: tuple[Any, ...]) -> Callable[[Any], Any]:
+    namespace: dict[str, Any] = {'cls': cls}
+    lines = ['def from_dict(data):', '    kwargs = dict(data)']
+    typevars = typevars_of(cls, args)
+    discriminators = _discriminators().get(cls, {})
+    for f, hint in get_fields(cls):
+        if isinstance(hint, TypeVar) and hint not in typevars and f in discriminators:
+            namespace[f'_load_{f}'] = _load_by_discriminator(*discriminators[f])
+            lines.append(
+                f'    if {f!r} in kwargs: kwargs[{f!r}] = _load_{f}(kwargs[{f!r}], kwargs)'
+            )
+            continue
+
+        converter = _LOADER_BUILDER.build(hint, typevars)
+        if converter is not None:
+            namespace[f'_load_{f}'] = converter
+            lines.append(f'    if {f!r} in kwargs: kwargs[{f!r}] = _load_{f}(kwargs[{f!r}])')
+    lines.append('    return cls(**kwargs)')
+    return compile_function('from_dict', '\n'.join(lines), namespace)
+
+
+# ------ Discriminators ------
+@lru_cache(maxsize=None)
+def _discriminators() -> dict[type, dict[str, tuple[str, dict[Any, type]]]]:
+    """
+    Generic classes -> generic fields -> (discriminator field, discriminator value -> type).
+
+    Used to restore generic fields of unparametrized classes.
+    """
+    from funpayparsers.types.enums import RunnerDataType
+    from funpayparsers.types.common import CurrentlyViewingOfferInfo
+    from funpayparsers.types.updates import (
+        ChatNode,
+        ChatCounter,
+        ChatBookmarks,
+        OrdersCounters,
+        RunnerResponseObject,
+    )
+
+    return {
+        RunnerResponseObject: {
+            'data': (
+                'type',
+                {
+                    RunnerDataType.ORDERS_COUNTERS: OrdersCounters,
+                    RunnerDataType.CHAT_COUNTER: ChatCounter,
+                    RunnerDataType.CHAT_BOOKMARKS: ChatBookmarks,
+                    RunnerDataType.CHAT_NODE: ChatNode,
+                    RunnerDataType.CPU: CurrentlyViewingOfferInfo,
+                },
+            )
+        }
+    }
@@ -26,7 +26,7 @@ UpdateData = TypeVar('UpdateData')
 
 
 # ------ Simple objects ------
-@dataclass
+@dataclass(slots=True)
 class OrdersCounters(FunPayObject):
     """Represents an order counters data from runner response."""
 
@@ -36,7 +36,7 @@ class OrdersCounters(FunPayObject):
     """Active sales amount."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatBookmarks(FunPayObject):
     """Represents a chat bookmarks data from runner response."""
 
@@ -58,7 +58,7 @@ class ChatBookmarks(FunPayObject):
     """List of chat previews."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCounter(FunPayObject):
     """Represents a chat counter data from runner response."""
 
@@ -75,7 +75,7 @@ class ChatCounter(FunPayObject):
 
 
 # ------ Nodes ------
-@dataclass
+@dataclass(slots=True)
 class NodeInfo(FunPayObject):
     """Represents a chat info in chat data from runner response."""
 
@@ -89,7 +89,7 @@ class NodeInfo(FunPayObject):
     """Purpose is unknown."""  # todo
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatNode(FunPayObject):
     """Represents a chat data from runner response."""
 
@@ -104,7 +104,7 @@ class ChatNode(FunPayObject):
 
 
 # ------ Response to action ------
-@dataclass
+@dataclass(slots=True)
 class ActionResponse(FunPayObject):
     """Represents an action response data from runner response."""
 
@@ -113,7 +113,7 @@ class ActionResponse(FunPayObject):
 
 
 # ------ Update obj ------
-@dataclass
+@dataclass(slots=True)
 class RunnerResponseObject(FunPayObject, Generic[UpdateData]):
     """Represents a single runner response object from runner response."""
 
@@ -130,7 +130,7 @@ class RunnerResponseObject(FunPayObject, Generic[UpdateData]):
     """Runner object data."""
 
 
-@dataclass
+@dataclass(slots=True)
 class RunnerResponse(FunPayObject):
     """Represents a runner response."""
 
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+
+__all__ = ('WIRE_VERSION', 'dumps', 'loads')
+
+import zlib
+import struct
+import marshal
+from typing import Any, Callable
+from enum import Enum
+from decimal import Decimal
+from functools import lru_cache
+
+from funpayparsers.types.base import NOT_PARSED, FunPayObject
+from funpayparsers.types._hints import (
+    Converter,
+    ConverterBuilder,
+    get_fields,
+    types_namespace,
+    compile_function,
+)
+from funpayparsers.types.pages.base import FunPayPage
+
+
+WIRE_VERSION = 1
+"""
+Version of the wire format. Changed on incompatible changes of the encoding itself.
+
+Changes of the types schema (classes, their fields, enum members) are detected
+by the schema fingerprint, which is written along with the version.
+"""
+
+_MAGIC = b'FPW'
+_HEADER = struct.Struct('>3sBBI')  # magic, version, flags, schema fingerprint
+_FLAG_RAW_SOURCE = 1
+_MARSHAL_VERSION = 4
+
+_WIRE_ATOMIC_TYPES = frozenset({int, float, str, bool, bytes, type(None)})
+
+
+def dumps(obj: Any, /, *, raw_source: bool = False) -> bytes:
+    """
+    Encodes a ``FunPayObject`` (or a list / dict of them, e.g., a parser result)
+    into a compact binary representation.
+
+    Objects are encoded as tuples of their field values (without field names),
+    enum members as their indexes, and the result is serialized with ``marshal``,
+    so it can only be decoded by the same version of Python and ``funpayparsers``
+    (a version tag and a fingerprint of the types schema are written in the header
+    and checked by ``loads()``).
+
+    :param obj: object to encode.
+    :param raw_source: whether to include raw sources of objects.
+        If not, decoded objects have an empty ``raw_source``.
+
+    Examples:
+        >>> from funpayparsers.types import MoneyValue
+        >>> data = dumps(MoneyValue(raw_source='<div>10 ₽</div>', value=10, character='₽'))
+        >>> loads(data)
+        MoneyValue(raw_source='', value=10, character='₽')
+    """
+    header = _HEADER.pack(
+        _MAGIC, WIRE_VERSION, _FLAG_RAW_SOURCE if raw_source else 0, _schema().fingerprint
+    )
+    encoders = _RAW_SOURCE_ENCODERS if raw_source else _ENCODERS
+    return header + marshal.dumps(_encode_value(obj, encoders), _MARSHAL_VERSION)
+
+
+def loads(data: bytes, /) -> Any:
+    """
+    Decodes an object, encoded with ``dumps()``.
+
+    :raises ValueError: if ``data`` is not encoded with ``dumps()``, or it was encoded with
+        another version of the wire format / types schema.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError('Data is too short.')
+    magic, version, _, fingerprint = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError('Data is not encoded with funpayparsers.types.wire.dumps().')
+    if version != WIRE_VERSION or fingerprint != _schema().fingerprint:
+        raise ValueError(
+            f'Data is encoded with another version of the wire format / types schema '
+            f'(version {version}, schema {fingerprint:#010x}, '
+            f'expected version {WIRE_VERSION}, schema {_schema().fingerprint:#010x}).'
+        )
+    return _decode_value(marshal.loads(memoryview(data)[_HEADER.size :]))
+
+
+# ------ Schema ------
+class _Schema:
+    """Codes of classes and enums, used in the wire format."""
+
+    def __init__(self) -> None:
+        namespace = types_namespace()
+        self.classes: list[type] = sorted(
+            {i for i in namespace.values() if isinstance(i, type) and issubclass(i, FunPayObject)},
+            key=lambda i: i.__qualname__,
+        )
+        self.enums: list[type[Enum]] = sorted(
+            {i for i in namespace.values() if isinstance(i, type) and issubclass(i, Enum)},
+            key=lambda i: i.__qualname__,
+        )
+        self.class_codes = {cls: code for code, cls in enumerate(self.classes)}
+        self.enum_codes = {enum: code for code, enum in enumerate(self.enums)}
+
+        description = repr(
+            (
+                [(i.__qualname__, [f for f, _ in get_fields(i)]) for i in self.classes],
+                [(i.__qualname__, list(i.__members__)) for i in self.enums],
+            )
+        )
+        self.fingerprint = zlib.crc32(description.encode())
+
+
+@lru_cache(maxsize=None)
+def _schema() -> _Schema:
+    return _Schema()
+
+
+# ------ Encoding ------
+_ENCODERS: dict[type, Callable[[Any], tuple[Any, ...]]] = {}
+_RAW_SOURCE_ENCODERS: dict[type, Callable[[Any], tuple[Any, ...]]] = {}
+
+
+def _encoder(cls: type, encoders: dict[type, Callable[[Any], tuple[Any, ...]]]) -> Converter:
+    func = encoders.get(cls)
+    if func is None:
+        func = encoders[cls] = _compile_encoder(cls, encoders)
+    return func
+
+
+def _encode_value(value: Any, encoders: dict[type, Callable[[Any], tuple[Any, ...]]]) -> Any:
+    """
+    Encodes a value of an unknown type.
+
+    Objects are encoded as tuples, starting with a class code, other values, that can't
+    be serialized with ``marshal`` as is, are encoded as tuples, starting with a tag.
+    """
+    cls = value.__class__
+    if cls in _WIRE_ATOMIC_TYPES:
+        return value
+    if value is NOT_PARSED:
+        return ...
+    if isinstance(value, FunPayObject):
+        return _encoder(cls, encoders)(value)
+    if cls is list:
+        return [_encode_value(i, encoders) for i in value]
+    if cls is dict:
+        return {_encode_value(k, encoders): _encode_value(v, encoders) for k, v in value.items()}
+    if cls is tuple:
+        return 't', [_encode_value(i, encoders) for i in value]
+    if cls is Decimal:
+        return 'd', str(value)
+    if isinstance(value, Enum) and cls in _schema().enum_codes:
+        return 'e', _schema().enum_codes[cls], list(cls).index(value)
+    raise TypeError(f'Object of type {cls.__qualname__} can not be encoded.')
+
+
+def _encode_object(cls: type, encoders: dict[type, Any]) -> Converter:
+    def encode(value: Any) -> Any:
+        if value.__class__ is cls:
+            return _encoder(cls, encoders)(value)
+        return _encode_value(value, encoders)
+
+    return encode
+
+
+def _encode_enum(enum: type[Enum], encoders: dict[type, Any]) -> Converter:
+    indexes = {member: index for index, member in enumerate(enum)}
+
+    def encode(value: Any) -> Any:
+        if value.__class__ is enum:
+            return indexes[value]
+        return _encode_value(value, encoders)
+
+    return encode
+
+
+def _encode_list(item: Converter | None, encoders: dict[type, Any]) -> Converter:
+    def encode(value: Any) -> Any:
+        if value.__class__ is list:
+            return value if item is None else [item(i) for i in value]
+        return _encode_value(value, encoders)
+
+    return encode
+
+
+def _encode_tuple(item: Converter | None, encoders: dict[type, Any]) -> Converter:
+    def encode(value: Any) -> Any:
+        if value.__class__ is tuple:
+            return list(value) if item is None else [item(i) for i in value]
+        return _encode_value(value, encoders)
+
+    return encode
+
+
+def _encode_dict(
+    key: Converter | None, item: Converter | None, encoders: dict[type, Any]
+) -> Converter:
+    def encode(value: Any) -> Any:
+        if value.__class__ is not dict:
+            return _encode_value(value, encoders)
+        if key is None and item is None:
+            return value
+        return {
+            (k if key is None else key(k)): (v if item is None else item(v))
+            for k, v in value.items()
+        }
+
+    return encode
+
+
+class _EncoderBuilder(ConverterBuilder):
+    """Builds encoders of fields."""
+
+    atomic_types = _WIRE_ATOMIC_TYPES
+
+    def __init__(self, encoders: dict[type, Any]) -> None:
+        self.encoders = encoders
+
+    def for_enum(self, enum: type[Enum]) -> Converter | None:
+        return _encode_enum(enum, self.encoders)
+
+    def for_object(self, cls: type, args: tuple[Any, ...]) -> Converter | None:
+        return _encode_object(cls, self.encoders)
+
+    def for_list(self, item: Converter | None) -> Converter | None:
+        return _encode_list(item, self.encoders)
+
+    def for_tuple(self, item: Converter | None) -> Converter | None:
+        return _encode_tuple(item, self.encoders)
+
+    def for_dict(self, key: Converter | None, item: Converter | None) -> Converter | None:
+        return _encode_dict(key, item, self.encoders)
+
+    def for_other(self) -> Converter | None:
+        encoders = self.encoders
+        return lambda value: _encode_value(value, encoders)
+
+
+def _compile_encoder(cls: type, encoders: dict[type, Any]) -> Callable[[Any], tuple[Any, ...]]:
+    code = _schema().class_codes.get(cls)
+    if code is None:
+        raise TypeError(f'Object of type {cls.__qualname__} can not be encoded.')
+
+    builder = _EncoderBuilder(encoders)
+    namespace: dict[str, Any] = {'_encode_value': _encode_value, '_encoders': encoders}
+    items = [str(code)]
+    for f, hint in get_fields(cls):
+        if f == 'raw_source':
+            items.append('obj.raw_source' if encoders is _RAW_SOURCE_ENCODERS else 'None')
+            continue
+
+        converter = builder.build(hint)
+        if converter is not None:
+            namespace[f'_encode_{f}'] = converter
+            items.append(f'_encode_{f}(obj.{f})')
+        elif issubclass(cls, FunPayPage):  # page fields may be NOT_PARSED
+            items.append(f'_encode_value(obj.{f}, _encoders)')
+        else:
+            items.append(f'obj.{f}')
+
+    return compile_function(
+        'encode', f'def encode(obj):\n    return ({", ".join(items)},)', namespace
+    )
+
+
+# ------ Decoding ------
+_DECODERS: dict[int, Callable[[tuple[Any, ...]], Any]] = {}
+
+
+def _decode_value(value: Any) -> Any:
+    """Decodes a value, encoded with ``_encode_value()``."""
+    cls = value.__class__
+    if cls is tuple:
+        tag = value[0]
+        if tag.__class__ is int:
+            return (_DECODERS.get(tag) or _compile_decoder(tag))(value)
+        if tag == 't':
+            return tuple(_decode_value(i) for i in value[1])
+        if tag == 'd':
+            return Decimal(value[1])
+        if tag == 'e':
+            return list(_schema().enums[value[1]])[value[2]]
+        raise ValueError(f'Unknown tag: {tag!r}.')
+    if cls is list:
+        return [_decode_value(i) for i in value]
+    if cls is dict:
+        return {_decode_value(k): _decode_value(v) for k, v in value.items()}
+    if value is ...:
+        return NOT_PARSED
+    return value
+
+
+def _decode_enum(enum: type[Enum]) -> Converter:
+    members = list(enum)
+
+    def decode(value: Any) -> Any:
+        if value.__class__ is int:
+            return members[value]
+        return _decode_value(value)
+
+    return decode
+
+
+def _decode_list(item: Converter | None) -> Converter:
+    def decode(value: Any) -> Any:
+        if value.__class__ is list:
+            return value if item is None else [item(i) for i in value]
+        return _decode_value(value)
+
+    return decode
+
+
+def _decode_tuple(item: Converter | None) -> Converter:
+    def decode(value: Any) -> Any:
+        if value.__class__ is list:
+            return tuple(value) if item is None else tuple(item(i) for i in value)
+        return _decode_value(value)
+
+    return decode
+
+
+def _decode_dict(key: Converter | None, item: Converter | None) -> Converter:
+    def decode(value: Any) -> Any:
+        if value.__class__ is not dict:
+            return _decode_value(value)
+        if key is None and item is None:
+            return value
+        return {
+            (k if key is None else key(k)): (v if item is None else item(v))
+            for k, v in value.items()
+        }
+
+    return decode
+
+
+class _DecoderBuilder(ConverterBuilder):
+    """Builds decoders of fields."""
+
+    atomic_types = _WIRE_ATOMIC_TYPES
+
+    def for_enum(self, enum: type[Enum]) -> Converter | None:
+        return _decode_enum(enum)
+
+    def for_object(self, cls: type, args: tuple[Any, ...]) -> Converter | None:
+        return _decode_value
+
+    def for_list(self, item: Converter | None) -> Converter | None:
+        return _decode_list(item)
+
+    def for_tuple(self, item: Converter | None) -> Converter | None:
+        return _decode_tuple(item)
+
+    def for_dict(self, key: Converter | None, item: Converter | None) -> Converter | None:
+        return _decode_dict(key, item)
+
+    def for_other(self) -> Converter | None:
+        return _decode_value
+
+
+_DECODER_BUILDER = _DecoderBuilder()
+
+
+def _compile_decoder(code: int) -> Callable[[tuple[Any, ...]], Any]:
+    classes = _schema().classes
+    if not 0 <= code < len(classes):
+        raise ValueError(f'Unknown class code: {code}.')
+    cls = classes[code]
+
+    namespace: dict[str, Any] = {'cls': cls, '_decode_value': _decode_value}
+    items = []
+    for index, (f, hint) in enumerate(get_fields(cls), start=1):
+        if f == 'raw_source':
+            items.append(f"data[{index}] or ''")
+            continue
+
+        converter = _DECODER_BUILDER.build(hint)
+        if converter is not None:
+            namespace[f'_decode_{f}'] = converter
+            items.append(f'_decode_{f}(data[{index}])')
+        elif issubclass(cls, FunPayPage):
+            items.append(f'_decode_value(data[{index}])')
+        else:
+            items.append(f'data[{index}]')
+
+    func = compile_function(
+        'decode', f'def decode(data):\n    return cls({", ".join(items)})', namespace
+    )
+    _DECODERS[code] = func
+    return func
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from funpayparsers.aio import Offloader
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.parsers.messages_parser import MessagesParser, MessagesParsingOptions
+from funpayparsers.parsers.money_value_parser import MoneyValueParser
+
+
+messages_html = """
+<div class="chat-msg-item chat-msg-with-head" id="message-1">
+    <div class="chat-message">
+        <div class="media-user-name">
+            <a href="https://funpay.com/users/54321/" class="chat-msg-author-link">Username</a>
+            <div class="chat-msg-date" title="26 мая, 11:21:41">11:21:41</div>
+        </div>
+        <div class="chat-msg-body"><div class="chat-msg-text">First</div></div>
+    </div>
+</div>
+<div class="chat-msg-item" id="message-2">
+    <div class="chat-message">
+        <div class="chat-msg-body"><div class="chat-msg-text">Second</div></div>
+    </div>
+</div>
+<div class="chat-msg-item" id="message-3">
+    <div class="chat-message">
+        <div class="chat-msg-body"><div class="chat-msg-text">Third</div></div>
+    </div>
+</div>
+"""
+
+
+async def collect(aiterator):
+    return [i async for i in aiterator]
+
+
+def test_aparse():
+    assert asyncio.run(MoneyValueParser('1.5 $').aparse()) == MoneyValueParser('1.5 $').parse()
+
+
+def test_aparse_error():
+    with pytest.raises(ParsingError):
+        asyncio.run(MoneyValueParser('not a value').aparse())
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 10])
+def test_aiter_parse(batch_size):
+    options = MessagesParsingOptions(empty_raw_source=True)
+    expected = MessagesParser(messages_html, options=options).parse()
+    result = asyncio.run(
+        collect(MessagesParser(messages_html, options=options).aiter_parse(batch_size=batch_size))
+    )
+
+    assert result == expected
+    assert [i.sender_id for i in result] == [54321] * 3
+    assert all(i.raw_source == '' for i in result)
+
+
+def test_offloader_concurrency_limit():
+    running, max_running = 0, 0
+    lock = threading.Lock()
+
+    def job() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    async def main() -> None:
+        offloader = Offloader(ThreadPoolExecutor(8), max_concurrency=2)
+        await asyncio.gather(*(offloader.run(job) for _ in range(10)))
+
+    asyncio.run(main())
+    assert max_running == 2
+
+
+def test_offloader_slot_is_held_until_job_is_done():
+    done = threading.Event()
+
+    async def main() -> bool:
+        offloader = Offloader(ThreadPoolExecutor(2), max_concurrency=1)
+        task = asyncio.create_task(offloader.run(done.wait, 1))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        second = asyncio.create_task(offloader.run(done.is_set))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        done.set()
+        return await second
+
+    assert asyncio.run(main()) is True
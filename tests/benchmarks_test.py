@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks import wire, memory, enum_lookups, serialization
+from benchmarks.suite import CASES, run_case
+from benchmarks.compare import compare
+from benchmarks.synthetic import SyntheticPages
+from funpayparsers.parsers import ChatParser, ReviewsParser, UpdatesParser, MessagesParser
+from funpayparsers.parsers.page_parsers import SubcategoryPageParser
+
+
+@pytest.mark.parametrize('name', list(CASES))
+def test_case_fixture_parses(name):
+    result = run_case(name, min_time=0, min_rounds=1)
+    assert result['rounds'] == 1
+    assert result['throughput'] > 0
+
+
+def test_compare_flags_regression():
+    baseline = {'offer_previews': {'throughput': 100.0}, 'messages': {'throughput': 100.0}}
+    current = {'offer_previews': {'throughput': 89.0}, 'messages': {'throughput': 95.0}}
+
+    assert compare(baseline, current) == {'offer_previews': -0.11}
+    assert compare(baseline, current, threshold=0.2) == {}
+
+
+def test_compare_ignores_missing_cases():
+    assert compare({'a': {'throughput': 100.0}}, {'b': {'throughput': 1.0}}) == {}
+
+
+def test_synthetic_pages_are_deterministic():
+    assert SyntheticPages(1).chat(20) == SyntheticPages(1).chat(20)
+    assert SyntheticPages(1).chat(20) != SyntheticPages(2).chat(20)
+
+    pages = SyntheticPages(1)
+    pages.reviews(5)
+    assert pages.runner_response(3) == SyntheticPages(1).runner_response(3)
+
+
+def test_synthetic_pages_parse():
+    pages = SyntheticPages(0)
+
+    assert len(SubcategoryPageParser(pages.showcase_page(30)).parse().offers) == 30
+    assert len(ChatParser(pages.chat(40)).parse().history) == 40
+    assert len(ReviewsParser(pages.reviews(25)).parse().reviews) == 25
+
+    response = UpdatesParser(pages.runner_response(4, messages_per_node=3)).parse()
+    assert [len(node.data.messages) for node in response.nodes] == [3, 3, 3, 3]
+
+
+def test_enum_lookups_match_linear_scans():
+    results = enum_lookups.run(number=1)
+    assert set(results) == set(enum_lookups.CASES)
+
+
+def test_memory_measures_parsed_objects():
+    count, per_object, shallow = memory.measure(MessagesParser, SyntheticPages(0).chat(20))
+    assert count == 20
+    assert per_object > shallow > 0
+
+
+def test_serialization_benchmark_runs():
+    result = serialization.run('runner_1_nodes', number=1)
+    assert set(result) == {'asdict', 'as_dict', 'from_dict'}
+
+
+def test_wire_benchmark_runs():
+    result = wire.run('runner_1_nodes', number=1)
+    assert set(result) == set(wire.FORMATS)
+    assert result['wire'][0] < result['json'][0]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+from pathlib import Path
+
+import pytest
+
+from funpayparsers.parsers import (
+    ReviewsParser,
+    UpdatesParser,
+    MessagesParser,
+    OfferPreviewsParser,
+    OrderPreviewsParser,
+    PrivateChatPreviewsParser,
+    TransactionPreviewsParser,
+)
+from funpayparsers.parsers.base import FunPayObjectParser
+from funpayparsers.parsers.page_parsers import (
+    ChatPageParser,
+    MainPageParser,
+    OrderPageParser,
+    ProfilePageParser,
+    SubcategoryPageParser,
+    TransactionsPageParser,
+)
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / 'benchmarks' / 'fixtures'
+"""Anonymized real-world pages and runner responses."""
+
+# fixture name (file name without extension) -> parser
+FIXTURE_PARSERS: dict[str, type[FunPayObjectParser[Any, Any]]] = {
+    'main_page': MainPageParser,
+    'profile_page': ProfilePageParser,
+    'chat_page': ChatPageParser,
+    'order_page': OrderPageParser,
+    'subcategory_page': SubcategoryPageParser,
+    'transactions_page': TransactionsPageParser,
+    'offer_previews': OfferPreviewsParser,
+    'order_previews': OrderPreviewsParser,
+    'transaction_previews': TransactionPreviewsParser,
+    'reviews': ReviewsParser,
+    'chat_previews': PrivateChatPreviewsParser,
+    'messages': MessagesParser,
+    'runner_1_nodes': UpdatesParser,
+    'runner_10_nodes': UpdatesParser,
+    'runner_50_nodes': UpdatesParser,
+}
+
+
+@pytest.fixture(scope='session')
+def read_fixture() -> Callable[[str], str]:
+    """Returns a function, that reads a fixture by its name."""
+
+    def read(name: str) -> str:
+        (path,) = FIXTURES_DIR.glob(f'{name}.*')
+        return path.read_text(encoding='utf-8')
+
+    return read
+
+
+@pytest.fixture(scope='session')
+def parse_fixture(read_fixture: Callable[[str], str]) -> Callable[[str], Any]:
+    """Returns a function, that parses a fixture by its name with its parser."""
+
+    def parse(name: str) -> Any:
+        return FIXTURE_PARSERS[name](read_fixture(name)).parse()
+
+    return parse
+
+
+@pytest.fixture(params=list(FIXTURE_PARSERS))
+def fixture_name(request: pytest.FixtureRequest) -> str:
+    """Name of every fixture (parametrizes a test)."""
+    return request.param  # type: ignore[no-any-return]
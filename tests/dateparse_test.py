@@ -4,12 +4,18 @@ from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import pytest
 
+from funpayparsers.parsers import utils
 from funpayparsers.parsers.utils import (
     MONTHS,
     TODAY_WORDS,
     YESTERDAY_WORDS,
     parse_date_string,
+    parse_date_strings,
+    use_reference_time,
+    resolve_messages_senders,
 )
+from funpayparsers.types.reviews import Review
+from funpayparsers.parsers.messages_parser import MessagesParser, MessagesParsingOptions
 
 CURR_DATE = datetime.now().replace(
     hour=0,
@@ -60,3 +66,137 @@ SEPARATORS = (',', 'at', 'в', 'о')
 )
 def test_date_string_parsing(date_str: str, expected: datetime) -> None:
     assert parse_date_string(date_str) == expected
+
+
+REFERENCE = datetime(2025, 3, 1, 23, 30, tzinfo=ZoneInfo('Europe/Moscow'))
+
+
+def test_reference_time() -> None:
+    assert parse_date_string('вчера, 12:20', reference=REFERENCE) == datetime(
+        2025, 2, 28, 12, 20, tzinfo=ZoneInfo('Europe/Moscow')
+    ).timestamp()
+    assert parse_date_string('5 мая, 12:20', reference=REFERENCE) == datetime(
+        2025, 5, 5, 12, 20, tzinfo=ZoneInfo('Europe/Moscow')
+    ).timestamp()
+
+
+def test_aware_reference_time_is_converted() -> None:
+    reference = REFERENCE.astimezone(ZoneInfo('UTC')) + timedelta(hours=1)  # 2 March in Moscow
+    assert parse_date_string('12:20', reference=reference) == datetime(
+        2025, 3, 2, 12, 20, tzinfo=ZoneInfo('Europe/Moscow')
+    ).timestamp()
+
+
+def test_context_reference_time() -> None:
+    with use_reference_time(REFERENCE):
+        today = parse_date_string('today, 12:20')
+        assert today == parse_date_string('today, 12:20', reference=REFERENCE)
+        with use_reference_time(REFERENCE + timedelta(days=1)):
+            assert parse_date_string('today, 12:20') == today + 24 * 60 * 60
+    assert parse_date_string('today, 12:20') == CURR_DATE.replace(hour=12, minute=20).timestamp()
+
+
+def make_review(date_text: str | None) -> Review:
+    return Review(
+        raw_source='',
+        rating=5,
+        text=None,
+        order_total=None,
+        category_str=None,
+        sender_username=None,
+        sender_id=None,
+        sender_avatar_url=None,
+        order_id=None,
+        date_text=date_text,
+        reply=None,
+    )
+
+
+def test_timestamp_property_is_memoized() -> None:
+    review = make_review('Сегодня, 12:20')
+    with use_reference_time(REFERENCE):
+        timestamp = review.timestamp
+        assert review._timestamp == (('Сегодня, 12:20', REFERENCE.date()), timestamp)
+        assert review.timestamp == timestamp == parse_date_string('12:20', reference=REFERENCE)
+
+    # reference time, entered after the first access, is respected
+    with use_reference_time(REFERENCE + timedelta(days=1)):
+        assert review.timestamp == timestamp + 24 * 60 * 60
+    assert review.timestamp == parse_date_string('12:20')
+
+
+class FakeClock(datetime):
+    """``datetime`` with a settable current time."""
+
+    current = datetime(2025, 3, 1, 23, 59)
+
+    @classmethod
+    def now(cls, tz=None):  # type: ignore[no-untyped-def, override]
+        return cls.current
+
+
+def test_relative_dates_after_midnight(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, 'datetime', FakeClock)
+    review = make_review('Сегодня, 12:20')
+
+    before_midnight = parse_date_string('сегодня, 12:20')
+    assert review.timestamp == before_midnight
+    assert parse_date_string('вчера, 12:20') == before_midnight - 24 * 60 * 60
+
+    monkeypatch.setattr(FakeClock, 'current', datetime(2025, 3, 2, 0, 1))
+    assert parse_date_string('сегодня, 12:20') == before_midnight + 24 * 60 * 60
+    assert parse_date_string('вчера, 12:20') == before_midnight
+    assert review.timestamp == before_midnight + 24 * 60 * 60
+
+
+def test_timestamp_property_follows_date_text() -> None:
+    review = make_review(None)
+    assert review.timestamp == 0
+
+    review.date_text = '12 мая 2024, 12:20'
+    assert review.timestamp == parse_date_string('12 мая 2024, 12:20')
+
+
+def test_message_timestamp_after_resolving_senders() -> None:
+    html = """
+    <div class="chat-msg-item chat-msg-with-head" id="message-1">
+        <div class="chat-message">
+            <div class="media-user-name">
+                <a href="https://funpay.com/users/54321/" class="chat-msg-author-link">Username</a>
+                <div class="chat-msg-date" title="26 мая, 11:20:00">11:20</div>
+            </div>
+            <div class="chat-msg-body"><div class="chat-msg-text">First</div></div>
+        </div>
+    </div>
+    <div class="chat-msg-item" id="message-2">
+        <div class="chat-message">
+            <div class="chat-msg-body"><div class="chat-msg-text">Second</div></div>
+        </div>
+    </div>
+    """
+    messages = MessagesParser(html, options=MessagesParsingOptions(resolve_senders=False)).parse()
+    assert messages[1].send_date_text is None
+    assert messages[1].timestamp == 0
+
+    resolve_messages_senders(messages)
+    assert messages[1].send_date_text == '26 мая, 11:20:00'
+    assert messages[1].timestamp == messages[0].timestamp == parse_date_string('26 мая, 11:20:00')
+
+
+@pytest.mark.parametrize(
+    'date_strings', [
+        ['12:20:24', '12.05.24', 'Сегодня, 12:20', 'вчера в 00:00', '12 мая, 12:20', '12 мая 2024 12:20'],
+        # UTC offset changes in Moscow
+        ['27 марта 2011, 02:30', '26 октября 2014, 01:30', '31 октября 2010, 02:30'],
+    ]
+)
+def test_batch_date_strings_parsing(date_strings: list[str]) -> None:
+    result = parse_date_strings(date_strings * 2, reference=REFERENCE)
+    assert result.typecode == 'q'
+    assert list(result) == [parse_date_string(i, reference=REFERENCE) for i in date_strings * 2]
+
+
+def test_batch_invalid_date_strings() -> None:
+    assert list(parse_date_strings(['12:20', 'date'], default=-1))[1] == -1
+    with pytest.raises(ValueError):
+        parse_date_strings(['12:20', 'date'])
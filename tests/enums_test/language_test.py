@@ -12,6 +12,8 @@ from funpayparsers.types.enums import Language
         ('en', Language.EN),
         ('uk', Language.UK),
         ('any_lang', Language.UNKNOWN),
+        ('', Language.UNKNOWN),
+        (None, Language.UNKNOWN),
     ]
 )
 def test_language_by_appdata_determination(appdata_alias, expected_value):
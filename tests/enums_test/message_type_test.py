@@ -1,5 +1,6 @@
 import pytest
 from funpayparsers.types.enums import MessageType
+from funpayparsers import message_type_re as msg_re
 
 
 @pytest.fixture
@@ -166,4 +167,25 @@ def feedback_reply_deleted_en() -> str:
 )
 def test_message_type_determination(message, expected, request):
     message_text = request.getfixturevalue(message)
-    assert MessageType.get_by_message_text(message_text) is expected
\ No newline at end of file
+    assert MessageType.get_by_message_text(message_text) is expected
+
+
+def test_every_message_type_has_prefix():
+    assert set(msg_re.TYPE_PREFIX.groupindex) == {
+        i.name for i in MessageType if i.value is not None
+    }
+
+
+@pytest.mark.parametrize(
+    'message_text',
+    [
+        'Привет',
+        '',
+        'Покупатель Buyer оплатил заказ #ABCDEFGH.',
+        'The seller Seller has refunded the buyer Buyer on order #ABCDEFGH. Thanks!',
+        'Order #ABCDEFGH has been reopened',
+        'Заказ #ABCDEFGH открыт повторно.\nЕщё строка',
+    ]
+)
+def test_non_system_message_type_determination(message_text):
+    assert MessageType.get_by_message_text(message_text) is MessageType.NON_SYSTEM
@@ -11,6 +11,7 @@ from funpayparsers.types.enums import OrderStatus
         ('some_cls text-primary some_cls2', OrderStatus.PAID),
         ('some_cls text-success some_cls2', OrderStatus.COMPLETED),
         ('some_cls text-warning some_cls2', OrderStatus.REFUNDED),
+        ('text-success-lg', OrderStatus.COMPLETED),
         ('some_cls some_cls2', OrderStatus.UNKNOWN),
     ]
 )
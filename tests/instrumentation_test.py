@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.parsers.base import RawSourceMode
+from funpayparsers.instrumentation import ParsingHook, TimingCollector, get_hook, use_hook
+from funpayparsers.parsers.messages_parser import MessagesParser, MessagesParsingOptions
+
+
+messages_html = """
+<div class="chat-msg-item chat-msg-with-head" id="message-1">
+    <div class="chat-message">
+        <div class="media-user-name">
+            <a href="https://funpay.com/users/54321/" class="chat-msg-author-link">Username</a>
+            <span class="chat-msg-author-label label label-success">поддержка</span>
+            <div class="chat-msg-date" title="26 мая, 11:21:41">11:21:41</div>
+        </div>
+        <div class="chat-msg-body"><div class="chat-msg-text">First</div></div>
+    </div>
+</div>
+<div class="chat-msg-item" id="message-2">
+    <div class="chat-message">
+        <div class="chat-msg-body"><div class="chat-msg-text">Second</div></div>
+    </div>
+</div>
+"""
+
+
+class RecordingHook(ParsingHook):
+    def __init__(self):
+        self.events = []
+
+    def parse_started(self, parser):
+        self.events.append(('start', type(parser).__name__))
+
+    def parse_finished(self, parser, elapsed_ns, error):
+        self.events.append(('finish', type(parser).__name__, error is not None))
+
+
+def test_no_hook():
+    assert get_hook() is None
+    result = MessagesParser(messages_html).parse()
+    assert [i.id for i in result] == [1, 2]
+
+
+def test_hook_events_order():
+    with use_hook(RecordingHook()) as hook:
+        MessagesParser(messages_html).parse()
+
+    assert get_hook() is None
+    assert hook.events == [
+        ('start', 'MessagesParser'),
+        ('start', 'UserBadgeParser'),
+        ('finish', 'UserBadgeParser', False),
+        ('finish', 'MessagesParser', False),
+    ]
+
+
+def test_timing_tree():
+    collector = TimingCollector()
+    with use_hook(collector):
+        MessagesParser(messages_html).parse()
+        MessagesParser(messages_html).parse()
+
+    assert len(collector.trees) == 2
+    tree = collector.trees[0]
+    assert tree.parser == 'MessagesParser'
+    assert [i.parser for i in tree.children] == ['UserBadgeParser']
+    assert tree.elapsed_ns >= tree.children[0].elapsed_ns > 0
+    assert tree.self_ns == tree.elapsed_ns - tree.children[0].elapsed_ns
+    assert tree.selectors == {}
+    assert tree.raw_source_chars > 0
+    assert tree.format().startswith('MessagesParser: ')
+
+
+def test_selector_tracing():
+    collector = TimingCollector(trace_selectors=True)
+    with use_hook(collector):
+        result = MessagesParser(messages_html).parse()
+
+    assert result == MessagesParser(messages_html).parse()
+    selectors = collector.trees[0].selectors
+    assert selectors['div.chat-msg-item'].calls == 1
+    assert selectors['div.chat-msg-item'].matched == 2
+    assert selectors['div.chat-msg-text'].calls == 2
+    assert 'span.label' in collector.trees[0].children[0].selectors
+
+
+def test_raw_source_off_is_not_reported():
+    collector = TimingCollector()
+    options = MessagesParsingOptions(raw_source_mode=RawSourceMode.OFF)
+    with use_hook(collector):
+        MessagesParser(messages_html, options=options).parse()
+
+    assert collector.trees[0].raw_source_chars == 0
+
+
+def test_merged_tree():
+    collector = TimingCollector()
+    with use_hook(collector):
+        MessagesParser(messages_html * 3).parse()
+
+    tree = collector.trees[0]
+    assert len(tree.children) == 3
+    merged = tree.merged()
+    assert len(merged.children) == 1
+    assert merged.children[0].calls == 3
+    assert merged.children[0].elapsed_ns == sum(i.elapsed_ns for i in tree.children)
+    assert ' x3: ' in tree.format()
+
+
+def test_failed_parse():
+    collector = TimingCollector()
+    with use_hook(collector), pytest.raises(ParsingError):
+        MessagesParser('<div class="chat-msg-item"></div>').parse()
+
+    assert collector.trees[0].failed == 1
+
+
+def test_aparse_inherits_hook():
+    async def main():
+        with use_hook(TimingCollector()) as collector:
+            await MessagesParser(messages_html).aparse()
+        return collector
+
+    collector = asyncio.run(main())
+    assert [i.parser for i in collector.trees] == ['MessagesParser']
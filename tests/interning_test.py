@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+
+from funpayparsers.interning import InternPool, intern_string, get_intern_pool, use_intern_pool
+from funpayparsers.parsers.utils import parse_money_value_string
+from funpayparsers.parsers.messages_parser import MessagesParser, MessagesParsingOptions
+
+
+messages_html = """
+<div class="chat-msg-item chat-msg-with-head" id="message-1">
+    <div class="chat-message">
+        <div class="media-user-name">
+            <a href="https://funpay.com/users/54321/" class="chat-msg-author-link">Username</a>
+            <span class="chat-msg-author-label label label-success">поддержка</span>
+            <div class="chat-msg-date" title="26 мая, 11:21:41">11:21:41</div>
+        </div>
+        <div class="chat-msg-body"><div class="chat-msg-text">First</div></div>
+    </div>
+</div>
+<div class="chat-msg-item" id="message-2">
+    <div class="chat-message">
+        <div class="chat-msg-body"><div class="chat-msg-text">Second</div></div>
+    </div>
+</div>
+"""
+
+
+def test_pool():
+    pool = InternPool()
+    a, b = ''.join(['a', 'b']), ''.join(['a', 'b'])
+    assert a is not b
+    assert pool.intern(a) is a
+    assert pool.intern(b) is a
+    assert 'ab' in pool and len(pool) == 1
+
+    pool.clear()
+    assert pool.intern(b) is b
+    assert len(pool) == 1
+
+
+def test_no_pool_outside_of_parsing():
+    assert get_intern_pool() is None
+    value = ''.join(['a', 'b'])
+    assert intern_string(value) is value
+    assert intern_string(None) is None
+
+
+def test_per_parse_pool():
+    result = MessagesParser(messages_html * 2).parse()
+    assert get_intern_pool() is None
+
+    first, third = result[0], result[2]
+    assert first.sender_username == 'Username'
+    assert first.sender_username is third.sender_username
+    assert first.badge.css_class is third.badge.css_class
+    assert first.badge.text is third.badge.text
+
+    other = MessagesParser(messages_html).parse()[0]
+    assert other.sender_username == first.sender_username
+    assert other.sender_username is not first.sender_username
+
+
+def test_session_pool():
+    with use_intern_pool(InternPool()) as pool:
+        first = MessagesParser(messages_html).parse()[0]
+        second = MessagesParser(messages_html).parse()[0]
+        money_value = parse_money_value_string('10 ₽')
+
+    assert get_intern_pool() is None
+    assert first.sender_username is second.sender_username
+    assert 'Username' in pool
+    assert money_value.character is pool.intern('₽')
+
+
+def test_options_pool():
+    pool, context_pool = InternPool(), InternPool()
+    options = MessagesParsingOptions(intern_pool=pool)
+    with use_intern_pool(context_pool):
+        first = MessagesParser(messages_html, options=options).parse()[0]
+    second = MessagesParser(messages_html, options=options).parse()[0]
+
+    assert first.sender_username is second.sender_username
+    assert 'Username' in pool
+    assert 'Username' not in context_pool
+
+
+def test_stream_shares_pool():
+    result = list(MessagesParser(messages_html * 2).iter_parse())
+    assert result[0].sender_username is result[2].sender_username
+
+
+def test_offloaded_parsing_inherits_pool():
+    async def main():
+        with use_intern_pool(InternPool()) as pool:
+            first = await MessagesParser(messages_html).aparse()
+            second = await MessagesParser(messages_html).aparse()
+        return pool, first[0], second[0]
+
+    pool, first, second = asyncio.run(main())
+    assert first.sender_username is second.sender_username
+    assert 'Username' in pool
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from funpayparsers.parallel import ParsingPool, pack, unpack, parse_parallel, parse_concurrently
+from funpayparsers.interning import InternPool, use_intern_pool
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.types.enums import SubcategoryType
+from funpayparsers.types.categories import Category, Subcategory
+from funpayparsers.parsers.base import RawSourceMode
+from funpayparsers.parsers.messages_parser import MessagesParser, MessagesParsingOptions
+from funpayparsers.parsers.money_value_parser import MoneyValueParser
+from funpayparsers.parsers.offer_previews_parser import (
+    OfferPreviewsParser,
+    OfferPreviewsParsingOptions,
+)
+
+
+sources = ['1.23 $', '+ 4 567.89 ₽', '-10 €', '0 $', '12 ₽']
+
+
+@pytest.fixture(scope='module')
+def pool():
+    with ParsingPool(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 10])
+def test_order_is_preserved(pool, chunksize):
+    expected = [MoneyValueParser(i).parse() for i in sources]
+    result = list(pool.map(MoneyValueParser, sources, chunksize=chunksize))
+
+    assert result == expected
+    assert all(i.raw_source == '' for i in result)
+
+
+def test_return_exceptions(pool):
+    result = list(
+        pool.map(MoneyValueParser, ['1 $', 'not a value', '2 $'], return_exceptions=True)
+    )
+
+    assert [i.value for i in (result[0], result[2])] == [1.0, 2.0]
+    assert isinstance(result[1], ParsingError)
+    assert result[1].raw_source == 'not a value'
+    assert 'Unable to parse money value string' in str(result[1].__cause__)
+
+
+def test_raise_on_error(pool):
+    result = pool.map(MoneyValueParser, ['1 $', 'not a value', '2 $'])
+    assert next(result).value == 1.0
+    with pytest.raises(ParsingError):
+        next(result)
+
+
+def test_in_flight_limit():
+    consumed = []
+
+    def source_gen():
+        for i in sources:
+            consumed.append(i)
+            yield i
+
+    with ThreadPoolExecutor(2) as executor:
+        pool = ParsingPool(max_in_flight=2, executor=executor)
+        result = pool.map(MoneyValueParser, source_gen())
+        next(result)
+        assert len(consumed) == 2
+        assert len(list(result)) == 4
+
+
+def test_parse_parallel():
+    result = list(parse_parallel(MoneyValueParser, sources, max_workers=2, chunksize=2))
+    assert result == [MoneyValueParser(i).parse() for i in sources]
+
+
+def test_pack_unpack():
+    subcategory = Subcategory(
+        raw_source='<a></a>',
+        id=1,
+        name='Subcategory',
+        type=SubcategoryType.COMMON,
+        offers_amount=None,
+    )
+    category = Category(
+        raw_source='<div></div>',
+        id=1,
+        name='Category',
+        subcategories=(subcategory,),
+        location='RU',
+    )
+
+    packed = pack(category)
+    restored = unpack(pickle.loads(pickle.dumps(packed)))
+    assert restored == category
+    assert isinstance(restored.subcategories, tuple)
+    assert restored.raw_source == ''
+
+
+def test_options_intern_pool(pool, read_fixture):
+    intern_pool = InternPool()
+    options = MessagesParsingOptions(intern_pool=intern_pool)
+    first, second = pool.map(MessagesParser, [read_fixture('messages')] * 2, options)
+
+    assert len(intern_pool) > 0
+    assert first[0].sender_username in intern_pool
+    assert first[0].sender_username is second[0].sender_username
+
+
+def test_context_intern_pool(pool):
+    with use_intern_pool(InternPool()) as intern_pool:
+        first, second = pool.map(MoneyValueParser, ['1 ₽', '2 ₽'])
+
+    assert '₽' in intern_pool
+    assert first.character is second.character
+
+
+def test_pack_intern_pool():
+    with use_intern_pool(InternPool()) as intern_pool:
+        packed = pack(MoneyValueParser('1 ₽').parse(), intern_pool)
+    assert packed[-1] == (str, '₽')
+
+    target = InternPool()
+    character = target.intern(''.join(['₽']))
+    assert unpack(pickle.loads(pickle.dumps(packed)), target).character is character
+    assert unpack(packed).character == '₽'
+
+
+def test_parsing_error_is_picklable():
+    error = pickle.loads(pickle.dumps(ParsingError(raw_source='source')))
+    assert isinstance(error, ParsingError)
+    assert error.raw_source == 'source'
+
+
+def test_parse_concurrently():
+    result = list(parse_concurrently(MoneyValueParser, sources, max_workers=4))
+
+    assert result == [MoneyValueParser(i).parse() for i in sources]
+    assert [i.raw_source for i in result] == sources
+
+
+def test_parse_concurrently_errors():
+    result = list(
+        parse_concurrently(
+            MoneyValueParser,
+            ['1 $', 'not a value', '2 $'],
+            max_workers=2,
+            chunksize=3,
+            return_exceptions=True,
+        )
+    )
+
+    assert [result[0].value, result[2].value] == [1.0, 2.0]
+    assert isinstance(result[1], ParsingError)
+    assert 'Unable to parse money value string' in str(result[1].__cause__)
+
+
+def test_parse_concurrently_shared_options():
+    options = OfferPreviewsParsingOptions(raw_source_mode=RawSourceMode.OFF)
+    html = ''.join(
+        f'<a href="https://funpay.com/lots/offer?id={i}" class="tc-item" data-s="{i}">'
+        f'<div class="tc-desc-text">Offer {i}</div>'
+        f'<div class="tc-price" data-s="{i}.5"><div>{i}.5 <span class="unit">₽</span></div></div>'
+        f'</a>'
+        for i in range(1, 51)
+    )
+    expected = OfferPreviewsParser(html, options=options).parse()
+
+    result = list(parse_concurrently(OfferPreviewsParser, [html] * 32, options, max_workers=8))
+    assert all(i == expected for i in result)
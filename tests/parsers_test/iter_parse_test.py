@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.parsers.reviews_parser import ReviewsParser, ReviewsParsingOptions
+from funpayparsers.parsers.messages_parser import MessagesParser, MessagesParsingOptions
+from funpayparsers.parsers.chat_previews_parser import PrivateChatPreviewsParser
+from funpayparsers.parsers.offer_previews_parser import (
+    OfferPreviewsParser,
+    OfferPreviewsParsingOptions,
+)
+
+
+offer_html = """
+<a href="https://funpay.com/lots/offer?id={id}" class="tc-item" data-s="{id}">
+    <div class="tc-desc-text">Offer {id}</div>
+    <div class="tc-price" data-s="{id}.5"><div>{id}.5 <span class="unit">₽</span></div></div>
+</a>
+"""
+
+broken_offer_html = '<a class="tc-item"></a>'
+
+chat_preview_html = """
+<a href="https://funpay.com/chat/?node={id}" class="contact-item" data-id="{id}" data-node-msg="10" data-user-msg="10">
+    <div class="avatar-photo" style="background-image: url(/img/avatar.jpg);"></div>
+    <div class="media-user-name">User{id}</div>
+    <div class="contact-item-message">Message</div>
+    <div class="contact-item-time">12:00</div>
+</a>
+"""
+
+messages_html = """
+<div class="chat-msg-item" id="message-3">
+    <div class="chat-message">
+        <div class="chat-msg-body"><div class="chat-msg-text">Third</div></div>
+    </div>
+</div>
+<div class="chat-msg-item chat-msg-with-head" id="message-1">
+    <div class="chat-message">
+        <div class="media-user-name">
+            <a href="https://funpay.com/users/54321/" class="chat-msg-author-link">Username</a>
+            <div class="chat-msg-date" title="26 мая, 11:21:41">11:21:41</div>
+        </div>
+        <div class="chat-msg-body"><div class="chat-msg-text">First</div></div>
+    </div>
+</div>
+<div class="chat-msg-item" id="message-2">
+    <div class="chat-message">
+        <div class="chat-msg-body"><div class="chat-msg-text">Second</div></div>
+    </div>
+</div>
+"""
+
+review_html = """
+<div class="review-container">
+    <div class="review-item-user">
+        <img src="/img/avatar.jpg" alt="">
+        <div class="media-user-name">Username</div>
+        <a href="https://funpay.com/users/54321/"></a>
+    </div>
+    <div class="review-item-date">2 дня назад</div>
+    <div class="review-item-detail">Game, 10 ₽</div>
+    <div class="review-item-text">Review {id}</div>
+    <div class="rating5"></div>
+</div>
+"""
+
+
+def test_offers_iter_parse():
+    html = ''.join(offer_html.format(id=i) for i in range(1, 6))
+    options = OfferPreviewsParsingOptions(empty_raw_source=True)
+
+    result = list(OfferPreviewsParser(html, options=options).iter_parse())
+    assert result == OfferPreviewsParser(html, options=options).parse()
+    assert all(i.raw_source == '' for i in result)
+
+
+def test_iter_parse_early_stop():
+    html = offer_html.format(id=1) + broken_offer_html
+
+    with pytest.raises(ParsingError):
+        OfferPreviewsParser(html).parse()
+
+    stream = OfferPreviewsParser(html).iter_parse()
+    assert next(stream).id == 1
+    with pytest.raises(ParsingError):
+        next(stream)
+
+
+def test_chat_previews_iter_parse():
+    html = ''.join(chat_preview_html.format(id=i) for i in range(1, 4))
+    result = list(PrivateChatPreviewsParser(html).iter_parse())
+
+    assert result == PrivateChatPreviewsParser(html).parse()
+    assert [i.username for i in result] == ['User1', 'User2', 'User3']
+
+
+def test_reviews_iter_parse():
+    html = ''.join(review_html.format(id=i) for i in range(1, 4))
+    options = ReviewsParsingOptions(empty_raw_source=True)
+    result = list(ReviewsParser(html, options=options).iter_parse())
+
+    assert result == ReviewsParser(html, options=options).parse().reviews
+    assert [i.text for i in result] == ['Review 1', 'Review 2', 'Review 3']
+
+
+@pytest.mark.parametrize('resolve_senders', [True, False])
+def test_messages_iter_parse_document_order(resolve_senders):
+    options = MessagesParsingOptions(empty_raw_source=True, resolve_senders=resolve_senders)
+    result = list(MessagesParser(messages_html, options=options).iter_parse())
+
+    assert [i.id for i in result] == [3, 1, 2]
+    # senders are resolved from the preceding heading messages only
+    assert [i.sender_id for i in result] == [None, 54321, 54321 if resolve_senders else None]
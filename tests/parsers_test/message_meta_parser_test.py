@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from selectolax.lexbor import LexborHTMLParser
+
+from funpayparsers.types.enums import MessageType
+from funpayparsers.types.messages import MessageMeta
+from funpayparsers.parsers.message_meta_parser import MessageMetaParser
+
+
+new_order_html = (
+    'Покупатель <a href="https://funpay.com/users/54321/">Buyer</a> оплатил '
+    '<a href="https://funpay.com/orders/ABCDEFGH/">заказ #ABCDEFGH</a>. Название лота\n'
+    'Buyer, не забудьте потом нажать кнопку «Подтвердить выполнение заказа».'
+)
+
+new_order_obj = MessageMeta(
+    raw_source=new_order_html,
+    type=MessageType.NEW_ORDER,
+    order_id='ABCDEFGH',
+    order_desc=(
+        'Название лота\nBuyer, не забудьте потом нажать кнопку «Подтвердить выполнение заказа».'
+    ),
+    buyer_id=54321,
+    buyer_username='Buyer',
+)
+
+
+def test_message_meta_parsing():
+    meta = MessageMetaParser(new_order_html).parse()
+    assert meta == new_order_obj
+    assert meta.order_desc == new_order_obj.order_desc
+
+
+def test_message_meta_parsing_from_node():
+    text_div = LexborHTMLParser(f'<div class="chat-msg-text">{new_order_html}</div>').css_first(
+        'div.chat-msg-text'
+    )
+    meta = MessageMetaParser(text_div, message_text=text_div.text()).parse()
+    assert meta == new_order_obj
+    assert meta.raw_source == new_order_html
+
+
+def test_message_text_is_not_reextracted():
+    meta = MessageMetaParser(new_order_html, message_text='Привет').parse()
+    assert meta.type is MessageType.NON_SYSTEM
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+from decimal import Decimal
+
+import pytest
+from selectolax.lexbor import LexborHTMLParser
+
 from funpayparsers.parsers.base import ParsingOptions
 from funpayparsers.types.common import MoneyValue
+from funpayparsers.parsers.utils import parse_money_value_string
 from funpayparsers.parsers.money_value_parser import (
     MoneyValueParser,
     MoneyValueParsingMode,
@@ -80,3 +86,32 @@ def test_string_money_value_parsing():
     options = MoneyValueParsingOptions(parsing_mode=MoneyValueParsingMode.FROM_STRING)
     parser = MoneyValueParser(string_money_value_str, options=options & OPTIONS)
     assert parser.parse() == string_money_value_obj
+
+
+@pytest.mark.parametrize(
+    'source,mode,expected',
+    [
+        (order_preview_money_value_html, MoneyValueParsingMode.FROM_ORDER_PREVIEW, Decimal('10.00')),
+        (transaction_preview_money_value_html, MoneyValueParsingMode.FROM_TRANSACTION_PREVIEW, Decimal('1.42')),
+        (lot_preview_money_value_html, MoneyValueParsingMode.FROM_OFFER_PREVIEW, Decimal('90.427699')),
+        (string_money_value_str, MoneyValueParsingMode.FROM_STRING, Decimal('1.23')),
+    ]
+)
+def test_exact_money_value_parsing(source, mode, expected):
+    options = MoneyValueParsingOptions(parsing_mode=mode, exact=True)
+    value = MoneyValueParser(source, options=options & OPTIONS).parse().value
+    assert isinstance(value, Decimal)
+    assert value == expected
+
+
+def test_money_value_parsing_from_price_node():
+    price_div = LexborHTMLParser(order_preview_money_value_html).css_first('div.tc-price')
+    options = MoneyValueParsingOptions(parsing_mode=MoneyValueParsingMode.FROM_ORDER_PREVIEW)
+    value = MoneyValueParser(price_div, options=options).parse()
+    assert value == order_preview_money_value_obj
+    assert value.raw_source == order_preview_money_value_html
+
+
+def test_money_value_string_normalization():
+    value = parse_money_value_string('− 12 345.67 ₽', exact=True)
+    assert value.value == Decimal('-12345.67')
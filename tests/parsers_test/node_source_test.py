@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from selectolax.lexbor import LexborHTMLParser
+
+import funpayparsers.parsers.base as base_module
+from funpayparsers.parsers.order_previews_parser import (
+    OrderPreviewsParser,
+    OrderPreviewsParsingOptions,
+)
+
+
+html = """
+<div class="orders">
+<a href="https://funpay.com/orders/ABCDEFGH/" class="tc-item warning">
+    <div class="tc-date">
+        <div class="tc-date-time">вчера, 13:33</div>
+        <div class="tc-date-left">22 часа назад</div>
+    </div>
+    <div class="tc-order">#ABCDEFGH</div>
+    <div class="order-desc">
+        <div>Order Description</div>
+        <div class="text-muted">Category, Subcategory</div>
+    </div>
+    <div class="tc-user">
+        <div class="media media-user offline">
+            <div class="media-left">
+                <div class="avatar-photo pseudo-a" tabindex="0" data-href="https://funpay.com/users/123456/" style="background-image: url(path/to/avatar);"></div>
+            </div>
+            <div class="media-body">
+                <div class="media-user-name">
+                    <span class="pseudo-a" tabindex="0" data-href="https://funpay.com/users/123456/">Counterparty username</span>
+                </div>
+                <div class="media-user-status">Counterparty Status</div>
+            </div>
+        </div>
+    </div>
+    <div class="tc-status text-warning">Возврат</div>
+    <div class="tc-price text-nowrap tc-buyer-sum">25.12 <span class="unit">₽</span></div>
+</a>
+</div>
+"""
+
+
+def test_node_source_matches_string_source():
+    node = LexborHTMLParser(html).css_first('div.orders')
+    from_node = OrderPreviewsParser(node).parse()
+    from_str = OrderPreviewsParser(html).parse()
+
+    assert from_node == from_str
+    assert from_node.orders[0].total.raw_source == from_str.orders[0].total.raw_source
+    assert from_node.orders[0].counterparty.raw_source.startswith('<div class="media')
+
+
+def test_nested_parsers_do_not_reparse_html(monkeypatch):
+    created = []
+
+    class CountingParser(LexborHTMLParser):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(base_module, 'LexborHTMLParser', CountingParser)
+    OrderPreviewsParser(html, options=OrderPreviewsParsingOptions(empty_raw_source=True)).parse()
+    assert len(created) == 1
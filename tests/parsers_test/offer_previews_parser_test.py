@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import math
+from array import array
+
+import pytest
+
 from funpayparsers.types.common import MoneyValue
 from funpayparsers.types.offers import OfferSeller, OfferPreview
 from funpayparsers.parsers.offer_previews_parser import (
@@ -151,4 +156,170 @@ def test_common_lot_parsing():
 
 def test_currency_lot_parsing():
     parser = OfferPreviewsParser(currency_lot_html, options=OPTIONS)
-    assert parser.parse() == [currency_lot_obj]
\ No newline at end of file
+    assert parser.parse() == [currency_lot_obj]
+
+
+def test_filter():
+    html = f'{common_lot_html}{currency_lot_html}'
+
+    parser = OfferPreviewsParser(html, options=OPTIONS, filter=lambda o: o.auto_delivery)
+    assert parser.parse() == [common_lot_obj]
+
+    parser = OfferPreviewsParser(html, options=OPTIONS, filter=lambda o: o.get('server') == '97')
+    assert parser.parse() == [currency_lot_obj]
+
+    parser = OfferPreviewsParser(html, options=OPTIONS, filter=lambda o: o.price < 1)
+    assert parser.parse() == [currency_lot_obj]
+
+
+def test_filter_skips_parsing():
+    # broken offer would fail parsing, if it was not filtered out
+    html = f'<a href="https://funpay.com/lots/offer?id=1" class="tc-item"></a>{common_lot_html}'
+
+    parser = OfferPreviewsParser(html, options=OPTIONS, filter=lambda o: o.online)
+    assert parser.parse() == [common_lot_obj]
+
+
+def test_limit():
+    # offers after the limit are not parsed at all
+    html = f'{common_lot_html}<a href="https://funpay.com/lots/offer?id=1" class="tc-item"></a>'
+
+    assert OfferPreviewsParser(html, options=OPTIONS, limit=1).parse() == [common_lot_obj]
+    assert OfferPreviewsParser(html, options=OPTIONS, limit=0).parse() == []
+
+
+def test_offer_preview_attributes():
+    html = f'{common_lot_html}{currency_lot_html}'
+    attributes = []
+    OfferPreviewsParser(html, options=OPTIONS, filter=attributes.append).parse()
+
+    common, currency = attributes
+    assert (common.id, common.online, common.auto_delivery, common.is_currency) == (
+        12345,
+        True,
+        True,
+        False,
+    )
+    assert common.price == 3499.796334
+    assert (currency.id, currency.is_currency, currency.price) == ('15090731-20-20-97-0', True, 0.132)
+    assert currency.data == {'server': 97}
+
+
+def test_parse_columns():
+    html = f'{common_lot_html}{currency_lot_html}'
+    columns = OfferPreviewsParser(html).parse_columns()
+
+    assert len(columns) == 2
+    assert columns.ids == ['12345', '15090731-20-20-97-0']
+    assert columns.prices.tolist() == [3499.796334, 0.132]
+    assert columns.amounts.tolist() == [1, 2000000]
+    assert columns.seller_ids.tolist() == [54321, 54321]
+    assert columns.online.tolist() == [1, 0]
+    assert columns.auto_delivery.tolist() == [1, 0]
+    assert {name: column.to_list() for name, column in columns.other_data.items()} == {
+        'user': [54321, None],
+        'without_name': ['some_data_without_name', None],
+        'with_name': ['some_data_with_name', None],
+        'server': [None, 97],
+    }
+
+
+def test_parse_columns_options():
+    html = f'{common_lot_html}{currency_lot_html}{common_lot_html}'
+
+    columns = OfferPreviewsParser(html, filter=lambda o: not o.is_currency).parse_columns()
+    assert columns.ids == array('q', [12345, 12345])
+    assert columns.other_data['user'].codes.tolist() == [0, 0]
+
+    assert OfferPreviewsParser(html, limit=1).parse_columns().ids == array('q', [12345])
+    assert len(OfferPreviewsParser(html, limit=0).parse_columns()) == 0
+
+
+def test_parse_columns_missing_values():
+    html = '<a href="https://funpay.com/lots/offer?id=1" class="tc-item"></a>'
+    columns = OfferPreviewsParser(html).parse_columns()
+
+    assert math.isnan(columns.prices[0])
+    assert columns.amounts.tolist() == [-1]
+    assert columns.seller_ids.tolist() == [-1]
+    assert columns.other_data == {}
+
+
+empty_lot_html = '<a href="https://funpay.com/lots/offer?id=1" class="tc-item"></a>'
+
+
+def test_columns_to_numpy():
+    np = pytest.importorskip('numpy')
+    html = f'{common_lot_html}{currency_lot_html}{empty_lot_html}'
+    arrays = OfferPreviewsParser(html).parse_columns().to_numpy()
+
+    assert {name: array.dtype for name, array in arrays.items()} == {
+        'id': np.dtype(object),
+        'price': np.float64,
+        'amount': np.int64,
+        'seller_id': np.int64,
+        'online': np.bool_,
+        'auto_delivery': np.bool_,
+        'other_data.user': np.dtype(object),
+        'other_data.without_name': np.dtype(object),
+        'other_data.with_name': np.dtype(object),
+        'other_data.server': np.dtype(object),
+    }
+    assert arrays['id'].tolist() == ['12345', '15090731-20-20-97-0', '1']
+    assert arrays['price'][:2].tolist() == [3499.796334, 0.132]
+    assert np.isnan(arrays['price'][2])
+    assert arrays['amount'].tolist() == [1, 2000000, -1]
+    assert arrays['seller_id'].tolist() == [54321, 54321, -1]
+    assert arrays['online'].tolist() == [True, False, False]
+    assert arrays['other_data.user'].tolist() == [54321, None, None]
+    assert arrays['other_data.server'].tolist() == [None, 97, None]
+
+    arrays = OfferPreviewsParser(f'{common_lot_html}{empty_lot_html}').parse_columns().to_numpy()
+    assert arrays['id'].dtype == np.int64
+    assert arrays['id'].tolist() == [12345, 1]
+
+
+def test_columns_to_arrow():
+    pa = pytest.importorskip('pyarrow')
+    html = f'{common_lot_html}{currency_lot_html}{empty_lot_html}'
+    table = OfferPreviewsParser(html).parse_columns().to_arrow()
+
+    assert dict(zip(table.schema.names, table.schema.types, strict=True)) == {
+        'id': pa.string(),
+        'price': pa.float64(),
+        'amount': pa.int64(),
+        'seller_id': pa.int64(),
+        'online': pa.bool_(),
+        'auto_delivery': pa.bool_(),
+        'other_data.user': pa.dictionary(pa.int32(), pa.int64()),
+        'other_data.without_name': pa.dictionary(pa.int32(), pa.string()),
+        'other_data.with_name': pa.dictionary(pa.int32(), pa.string()),
+        'other_data.server': pa.dictionary(pa.int32(), pa.int64()),
+    }
+    assert table.column('id').to_pylist() == ['12345', '15090731-20-20-97-0', '1']
+    assert table.column('price').to_pylist() == [3499.796334, 0.132, None]
+    assert table.column('amount').to_pylist() == [1, 2000000, None]
+    assert table.column('seller_id').to_pylist() == [54321, 54321, None]
+    assert table.column('online').to_pylist() == [True, False, False]
+    assert table.column('other_data.user').to_pylist() == [54321, None, None]
+    assert table.column('other_data.server').to_pylist() == [None, 97, None]
+
+    table = OfferPreviewsParser(f'{common_lot_html}{empty_lot_html}').parse_columns().to_arrow()
+    assert table.schema.field('id').type == pa.int64()
+    assert table.column('id').to_pylist() == [12345, 1]
+
+
+def test_pinned_offers():
+    not_pinned_html = common_lot_html.replace(' offer-promo offer-promoted', '')
+    parser = OfferPreviewsParser(common_lot_html + not_pinned_html, options=OPTIONS)
+
+    assert [i.is_pinned for i in parser.parse()] == [True, False]
+    assert parser.parse_columns().seller_ids.tolist() == [54321, 54321]
+
+
+def test_fixture_pinned_offers(parse_fixture):
+    offers = parse_fixture('offer_previews')
+
+    assert offers[0].is_pinned
+    assert not any(i.is_pinned for i in offers[1:])
+    assert all(i.seller.id == i.other_data['user'] for i in offers if 'user' in i.other_data)
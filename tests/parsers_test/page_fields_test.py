@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+import pytest
+
+from funpayparsers.types import NOT_PARSED
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.types.enums import Currency, SubcategoryType
+from funpayparsers.parsers.page_parsers import (
+    PageParsingOptions,
+    SubcategoryPageParser,
+    TransactionsPageParser,
+)
+
+
+transactions_page_html = """
+<html><body>
+<span class="balances-value">1 234.56 ₽</span>
+<div class="tc-finance">
+  <div class="tc-item transaction-status-complete" data-transaction="12345">
+    <span class="tc-date-time">20 января 2024, 23:11</span>
+    <span class="tc-title">Заказ #ABCDEFGH</span>
+    <div class="tc-price">+ 1.23 <span class="unit">₽</span></div>
+  </div>
+</div>
+</body></html>
+"""
+
+subcategory_page_html = """
+<html><body>
+<a href="https://funpay.com/lots/1/" class="counter-item">
+  <div class="counter-param">Subcategory</div>
+  <div class="counter-value">10</div>
+</a>
+<div class="showcase" data-section="lot-2" data-game="3">
+  <a href="https://funpay.com/lots/offer?id=1" class="tc-item">
+    <div class="tc-desc-text">Offer</div>
+    <div class="tc-price" data-s="10"><div>10 <span class="unit">₽</span></div></div>
+  </a>
+</div>
+</body></html>
+"""
+
+
+def test_fields_projection():
+    page = TransactionsPageParser(transactions_page_html, fields={'rub_balance'}).parse()
+
+    assert page.rub_balance.value == 1234.56
+    assert page.rub_balance.currency is Currency.RUB
+    assert page.header is NOT_PARSED
+    assert page.app_data is NOT_PARSED
+    assert page.usd_balance is NOT_PARSED
+    assert page.transactions is NOT_PARSED
+
+
+def test_fields_projection_nested_parser():
+    page = TransactionsPageParser(transactions_page_html, fields=['transactions']).parse()
+
+    assert [i.id for i in page.transactions.transactions] == [12345]
+    assert page.rub_balance is NOT_PARSED
+
+
+def test_fields_projection_cheap_fields():
+    page = SubcategoryPageParser(
+        subcategory_page_html,
+        fields={'offers', 'related_subcategories'},
+        empty_raw_source=True,
+    ).parse()
+
+    assert (page.category_id, page.subcategory_id) == (3, 2)
+    assert page.subcategory_type is SubcategoryType.COMMON
+    assert [i.id for i in page.offers] == [1]
+    assert [i.name for i in page.related_subcategories] == ['Subcategory']
+    assert page.header is NOT_PARSED
+
+
+def test_subcategory_page_offer_columns():
+    columns = SubcategoryPageParser(subcategory_page_html).parse_offer_columns()
+
+    assert columns.ids.tolist() == [1]
+    assert columns.prices.tolist() == [10.0]
+    assert columns.seller_ids.tolist() == [-1]
+
+
+def test_subcategory_page_offer_columns_without_showcase():
+    with pytest.raises(ParsingError):
+        SubcategoryPageParser('<html><body></body></html>').parse_offer_columns()
+
+
+def test_unknown_fields():
+    with pytest.raises(ValueError, match='Unknown TransactionsPage fields: unknown'):
+        TransactionsPageParser(transactions_page_html, fields={'header', 'unknown'})
+
+
+def test_fields_option():
+    assert PageParsingOptions(fields=['header', 'header']).fields == frozenset({'header'})
+    assert PageParsingOptions().fields is None
+
+
+def test_not_parsed():
+    assert not NOT_PARSED
+    assert repr(NOT_PARSED) == 'NOT_PARSED'
+    assert copy.deepcopy(NOT_PARSED) is NOT_PARSED
+    assert pickle.loads(pickle.dumps(NOT_PARSED)) is NOT_PARSED
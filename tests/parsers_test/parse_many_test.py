@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+import funpayparsers.parsers.base as base_module
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.parsers.money_value_parser import (
+    MoneyValueParser,
+    MoneyValueParsingMode,
+    MoneyValueParsingOptions,
+)
+from funpayparsers.parsers.badge_parser import UserBadgeParser, UserBadgeParsingOptions
+
+
+sources = ['1.23 $', '+ 4 567.89 ₽', '-10 €']
+
+
+def test_parse_many_matches_parse():
+    expected = [MoneyValueParser(i).parse() for i in sources]
+    assert list(MoneyValueParser.parse_many(sources)) == expected
+
+
+def test_parse_many_builds_options_once(monkeypatch):
+    calls = []
+    original = base_module.replace
+
+    def counting_replace(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(base_module, 'replace', counting_replace)
+    result = list(
+        MoneyValueParser.parse_many(
+            sources * 10,
+            options=MoneyValueParsingOptions(),
+            parsing_mode=MoneyValueParsingMode.FROM_STRING,
+        )
+    )
+
+    assert len(result) == 30
+    assert len(calls) == 1
+
+
+def test_parse_many_is_lazy():
+    def source_gen():
+        yield '1 $'
+        raise RuntimeError('must not be reached')
+
+    results = MoneyValueParser.parse_many(source_gen())
+    assert next(results).value == 1.0
+
+
+def test_parse_many_error():
+    results = MoneyValueParser.parse_many(['1 $', 'not a value', '2 $'])
+    assert next(results).value == 1.0
+    with pytest.raises(ParsingError) as exc_info:
+        next(results)
+    assert exc_info.value.raw_source == 'not a value'
+
+
+def test_parse_many_resets_parser_state():
+    badges = [
+        '<span class="label label-primary">Badge1</span>',
+        '<span class="label label-success">Badge2</span>',
+    ]
+    result = list(
+        UserBadgeParser.parse_many(badges, options=UserBadgeParsingOptions(empty_raw_source=True))
+    )
+    assert [i.text for i in result] == ['Badge1', 'Badge2']
+
+
+def test_derived_options_are_cached():
+    options = MoneyValueParsingOptions()
+    parser1 = MoneyValueParser('1 $', options=options, parse_value_from_attribute=False)
+    parser2 = MoneyValueParser('2 $', options=options, parse_value_from_attribute=False)
+
+    assert parser1.options is parser2.options
+    assert parser1.options.parse_value_from_attribute is False
+    assert options.parse_value_from_attribute is True
+    assert '__derived_options__' not in vars(options)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from selectolax.lexbor import LexborHTMLParser
+
+from funpayparsers.exceptions import ParsingError
+from funpayparsers.raw_source import LazyRawSource, RawSourceSpan
+from funpayparsers.parsers.base import RawSourceMode, FunPayHTMLObjectParser
+from funpayparsers.parsers.money_value_parser import MoneyValueParser, MoneyValueParsingMode
+from funpayparsers.parsers.order_previews_parser import (
+    OrderPreviewsParser,
+    OrderPreviewsParsingOptions,
+)
+
+
+html = """
+<a href="https://funpay.com/orders/ABCDEFGH/" class="tc-item warning">
+    <div class="tc-date">
+        <div class="tc-date-time">вчера, 13:33</div>
+        <div class="tc-date-left">22 часа назад</div>
+    </div>
+    <div class="tc-order">#ABCDEFGH</div>
+    <div class="order-desc">
+        <div>Order Description</div>
+        <div class="text-muted">Category, Subcategory</div>
+    </div>
+    <div class="tc-user">
+        <div class="media media-user offline">
+            <div class="media-left">
+                <div class="avatar-photo pseudo-a" tabindex="0" data-href="https://funpay.com/users/123456/" style="background-image: url(path/to/avatar);"></div>
+            </div>
+            <div class="media-body">
+                <div class="media-user-name">
+                    <span class="pseudo-a" tabindex="0" data-href="https://funpay.com/users/123456/">Counterparty username</span>
+                </div>
+                <div class="media-user-status">Counterparty Status</div>
+            </div>
+        </div>
+    </div>
+    <div class="tc-status text-warning">Возврат</div>
+    <div class="tc-price text-nowrap tc-buyer-sum">25.12 <span class="unit">₽</span></div>
+</a>
+"""
+
+
+@pytest.fixture
+def serializations(monkeypatch):
+    calls = []
+    original = FunPayHTMLObjectParser._serialize_raw_source
+
+    def counting(source):
+        calls.append(source)
+        return original(source)
+
+    monkeypatch.setattr(FunPayHTMLObjectParser, '_serialize_raw_source', staticmethod(counting))
+    return calls
+
+
+def parse(mode: RawSourceMode, **kwargs):
+    options = OrderPreviewsParsingOptions(raw_source_mode=mode, **kwargs)
+    return OrderPreviewsParser(html, options=options).parse()
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [{'mode': RawSourceMode.OFF}, {'mode': RawSourceMode.EAGER, 'empty_raw_source': True}],
+)
+def test_off_mode_does_not_serialize(serializations, kwargs):
+    result = parse(**kwargs)
+    order = result.orders[0]
+
+    assert serializations == []
+    assert order.raw_source == ''
+    assert order.total.raw_source == ''
+    assert order.counterparty.raw_source == ''
+
+
+def test_lazy_mode_serializes_on_access(serializations):
+    result = parse(RawSourceMode.LAZY)
+    order = result.orders[0]
+    assert serializations == []
+
+    assert isinstance(order._raw_source, LazyRawSource)
+    assert order.raw_source.startswith('<a href="https://funpay.com/orders/ABCDEFGH/"')
+    assert len(serializations) == 1
+
+    eager = parse(RawSourceMode.EAGER).orders[0]
+    assert order.raw_source == eager.raw_source
+    assert order.total.raw_source == eager.total.raw_source
+    assert order.counterparty.raw_source == eager.counterparty.raw_source
+
+
+def test_nested_parsers_inherit_mode(serializations):
+    # Options of nested parsers keep the default (eager) mode,
+    # but the mode of the outermost parser wins.
+    options = OrderPreviewsParsingOptions(raw_source_mode=RawSourceMode.OFF)
+    assert options.user_preview_parsing_options.raw_source_mode is RawSourceMode.EAGER
+
+    result = OrderPreviewsParser(html, options=options).parse()
+
+    assert serializations == []
+    assert result.orders[0].counterparty.raw_source == ''
+
+
+def test_lazy_objects_are_picklable():
+    order = parse(RawSourceMode.LAZY).orders[0]
+    restored = pickle.loads(pickle.dumps(order))
+
+    assert restored == order
+    assert restored.raw_source == order.raw_source
+    assert restored._raw_source.__class__ is str
+
+
+def test_span_mode_shares_document():
+    result = parse(RawSourceMode.SPAN)
+    order = result.orders[0]
+    eager = parse(RawSourceMode.EAGER).orders[0]
+
+    spans = [order._raw_source, order.total._raw_source, order.counterparty._raw_source]
+    assert all(isinstance(i, RawSourceSpan) for i in spans)
+    assert len({id(i.document) for i in spans}) == 1
+
+    assert order.raw_source == eager.raw_source
+    assert order.total.raw_source == eager.total.raw_source
+    assert order.counterparty.raw_source == eager.counterparty.raw_source
+
+
+def test_span_mode_references_passed_string():
+    order = parse(RawSourceMode.SPAN).orders[0]
+    assert order._raw_source.document.text is html
+
+
+def test_span_mode_falls_back_to_serialized_tree():
+    unquoted = html.replace('class="tc-item warning"', "class='tc-item warning'")
+    options = OrderPreviewsParsingOptions(raw_source_mode=RawSourceMode.SPAN)
+    order = OrderPreviewsParser(unquoted, options=options).parse().orders[0]
+    eager = parse(RawSourceMode.EAGER).orders[0]
+
+    assert isinstance(order._raw_source, RawSourceSpan)
+    assert order._raw_source.document.text is not unquoted
+    assert order.raw_source == eager.raw_source
+    assert order.counterparty.raw_source == eager.counterparty.raw_source
+
+
+def test_span_mode_parsing_error():
+    bad_html = '<div><div class="tc-price">not a price</div></div>' * 50
+    node = LexborHTMLParser(bad_html).css_first('div.tc-price')
+    parser = MoneyValueParser(
+        node,
+        parsing_mode=MoneyValueParsingMode.FROM_ORDER_PREVIEW,
+        raw_source_mode=RawSourceMode.SPAN,
+    )
+
+    with pytest.raises(ParsingError) as exc_info:
+        parser.parse()
+
+    assert isinstance(exc_info.value.raw_source, RawSourceSpan)
+    assert exc_info.value.formatted_source() == '<div class="tc-price">not a price</div>'
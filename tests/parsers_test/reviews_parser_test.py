@@ -232,3 +232,9 @@ def test_my_public_reviews_parsing():
 def test_order_page_review_parsing():
     parser = ReviewsParser(order_page_review_html, options=OPTIONS)
     assert parser.parse() == order_page_review_obj
+
+
+def test_order_page_review_ignores_other_reviews():
+    html = public_review_html + order_page_review_html
+    assert ReviewsParser(html, options=OPTIONS).parse() == order_page_review_obj
+    assert list(ReviewsParser(html, options=OPTIONS).iter_parse()) == order_page_review_obj.reviews
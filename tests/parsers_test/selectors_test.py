@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+from selectolax.lexbor import LexborHTMLParser
+
+from funpayparsers.parsers import selectors as sel
+from funpayparsers.parsers.rating_parser import UserRatingParser
+from funpayparsers.parsers.categories_parser import CategoriesParser
+from funpayparsers.parsers.offer_previews_parser import OfferPreviewsParser
+
+
+rating_html = """
+<div class="param-item mb10">
+    <div class="rating-value"><span class="big">4.5</span></div>
+    <div class="mb5">1 234 отзыва</div>
+    <div class="rating-full-item5"><div class="rating-progress"><div style="width: 90%;"></div></div></div>
+    <div class="rating-full-item4"><div class="rating-progress"><div style="width: 6%;"></div></div></div>
+    <div class="rating-full-item3"><div class="rating-progress"><div style="width: 2%;"></div></div></div>
+    <div class="rating-full-item2"><div class="rating-progress"><div style="width: 1%;"></div></div></div>
+    <div class="rating-full-item1"><div class="rating-progress"><div style="width: 0%;"></div></div></div>
+</div>
+"""
+
+offer_html = """
+<a href="https://funpay.com/lots/offer?id=1" class="tc-item" data-server="3" data-side="1" data-user="10">
+    <div class="tc-server hidden-xxs">Server 3</div>
+    <div class="tc-side hidden-xxs">Alliance</div>
+    <div class="tc-desc-text">Offer</div>
+    <div class="tc-price" data-s="10"><div>10 <span class="unit">₽</span></div></div>
+</a>
+"""
+
+categories_html = """
+<div class="promo-game-item">
+    <div class="game-title" data-id="2"><a href="https://funpay.com/lots/20/">Game</a></div>
+    <div class="game-title hidden" data-id="1"><a href="https://funpay.com/lots/10/">Game</a></div>
+    <button class="btn" data-id="1">EU</button>
+    <button class="btn" data-id="2">RU</button>
+    <ul class="list-inline" data-id="1"><li><a href="https://funpay.com/lots/10/">Accounts</a></li></ul>
+    <ul class="list-inline" data-id="2"><li><a href="https://funpay.com/chips/21/">Gold</a></li></ul>
+</div>
+"""
+
+
+@pytest.mark.parametrize('name', sel.__all__)
+def test_selector_is_valid(name):
+    LexborHTMLParser('<div></div>').css(getattr(sel, name))
+
+
+def test_rating_percentage_order():
+    rating = UserRatingParser(rating_html).parse()
+    assert rating.five_star_reviews_percentage == 90
+    assert rating.four_star_reviews_percentage == 6
+    assert rating.one_star_reviews_percentage == 0
+
+
+def test_offer_data_names():
+    offer = OfferPreviewsParser(offer_html).parse()[0]
+    assert offer.other_data == {'server': 3, 'side': 1, 'user': 10}
+    assert offer.other_data_names == {'server': 'Server 3', 'side': 'Alliance'}
+
+
+def test_categories_clones():
+    categories = CategoriesParser(categories_html).parse()
+    assert [(i.id, i.location) for i in categories] == [(2, 'RU'), (1, 'EU')]
+    assert [i.subcategories[0].name for i in categories] == ['Gold', 'Accounts']
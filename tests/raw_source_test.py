@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+import pytest
+
+from funpayparsers.raw_source import RawSourceSpan, RawSourceDocument
+
+
+document = RawSourceDocument('<ul><li>a</li><li>b</li><li>a</li></ul>')
+
+
+@pytest.mark.parametrize(
+    'item',
+    [0, 3, -1, -4, slice(None), slice(1, 3), slice(-3, None), slice(None, None, -1), slice(5, 0, -2)],
+)
+def test_span_indexing(item):
+    span = document.span('<li>b</li>')
+    assert span[item] == '<li>b</li>'[item]
+
+
+def test_span_index_error():
+    with pytest.raises(IndexError):
+        document.span('<li>b</li>')[100]
+
+
+def test_span_lookup():
+    doc = RawSourceDocument('<ul><li>a</li><li>b</li></ul>')
+    child = doc.span('<li>b</li>')
+    parent = doc.span('<ul><li>a</li><li>b</li></ul>')
+    before = doc.span('<li>a</li>')
+
+    assert (child.start, child.end) == (14, 24)
+    assert (parent.start, parent.end) == (0, 29)
+    assert str(before) == '<li>a</li>'
+
+    with pytest.raises(ValueError):
+        doc.span('<li>c</li>')
+
+
+def test_span_copy_and_pickle():
+    span = document.span('<li>b</li>')
+    assert copy.deepcopy(span) is span
+    assert pickle.loads(pickle.dumps(span)) == '<li>b</li>'
+    assert span == '<li>b</li>' and hash(span) == hash('<li>b</li>')
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from funpayparsers.types import (
+    Message,
+    ChatNode,
+    MoneyValue,
+    MessageMeta,
+    RunnerResponseObject,
+)
+from funpayparsers.types.base import NOT_PARSED
+from funpayparsers.types.enums import MessageType, RunnerDataType
+from funpayparsers.types.pages import SubcategoryPage
+from funpayparsers.types.serialization import as_dict, from_dict
+
+
+def objects(result):
+    return result if isinstance(result, list) else [result]
+
+
+def test_as_dict_matches_dataclasses_asdict(fixture_name, parse_fixture):
+    for obj in objects(parse_fixture(fixture_name)):
+        assert as_dict(obj) == dataclasses.asdict(obj)
+
+
+def test_round_trip(fixture_name, parse_fixture):
+    for obj in objects(parse_fixture(fixture_name)):
+        restored = from_dict(type(obj), obj.as_dict())
+        assert restored == obj
+        assert restored.raw_source == obj.raw_source
+
+
+def test_as_dict_copies_containers(parse_fixture):
+    message = parse_fixture('messages')[0]
+    data = message.as_dict()
+    assert data['meta'] is not message.meta
+    assert data['meta']['type'] is message.meta.type
+
+
+def meta_dict(type_):
+    return {
+        'raw_source': '',
+        'type': type_,
+        'order_id': None,
+        'order_desc': None,
+        'seller_id': None,
+        'seller_username': None,
+        'buyer_id': None,
+        'buyer_username': None,
+        'admin_id': None,
+        'admin_username': None,
+    }
+
+
+@pytest.mark.parametrize('value', [MessageType.NEW_ORDER, 'NEW_ORDER'])
+def test_enum_members_restored(value):
+    assert from_dict(MessageMeta, meta_dict(value)).type is MessageType.NEW_ORDER
+
+
+def test_generic_data_restored_by_type(parse_fixture):
+    node = parse_fixture('runner_1_nodes').nodes[0]
+    data = node.as_dict()
+    assert isinstance(data['data'], dict)
+
+    restored = from_dict(RunnerResponseObject, data)
+    assert isinstance(restored.data, ChatNode)
+    assert isinstance(restored.data.messages[0], Message)
+    assert restored == node
+
+    data['type'] = RunnerDataType.CHAT_NODE.value
+    assert from_dict(RunnerResponseObject, data) == node
+
+
+def test_restored_values_kept(parse_fixture):
+    meta = MessageMeta('', MessageType.NON_SYSTEM, *[None] * 8)
+    data = {**parse_fixture('messages')[0].as_dict(), 'meta': meta}
+    assert from_dict(Message, data).meta is meta
+
+
+def test_not_parsed_fields(parse_fixture):
+    page = dataclasses.replace(parse_fixture('subcategory_page'), offers=NOT_PARSED)
+    data = page.as_dict()
+    assert data['offers'] is NOT_PARSED
+    assert from_dict(SubcategoryPage, data).offers is NOT_PARSED
+
+
+def test_from_dict_unknown_field():
+    with pytest.raises(TypeError):
+        MoneyValue.from_dict({'raw_source': '', 'value': 1, 'character': '$', 'unknown': 1})
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import copy
+import pickle
+from dataclasses import replace
+
+import pytest
+
+import funpayparsers.types as types
+import funpayparsers.types.pages as pages
+from funpayparsers.raw_source import LazyRawSource
+from funpayparsers.types.base import FunPayObject
+from funpayparsers.parsers.utils import get_reference_day
+
+
+object_types = sorted(
+    (
+        i
+        for i in (*vars(types).values(), *vars(pages).values())
+        if isinstance(i, type) and issubclass(i, FunPayObject) and i is not FunPayObject
+    ),
+    key=lambda i: i.__name__,
+)
+
+
+@pytest.mark.parametrize('cls', object_types, ids=lambda i: i.__name__)
+def test_types_are_slotted(cls):
+    assert all('__slots__' in i.__dict__ for i in cls.__mro__[:-1])
+    assert cls.raw_source is FunPayObject.raw_source
+
+
+def test_redeclared_raw_source_slot():
+    # ``@dataclass(slots=True)`` redeclares inherited slots before Python 3.11
+    cls = type('Redeclared', (FunPayObject,), {'__slots__': ('raw_source',)})
+    assert cls.raw_source is FunPayObject.raw_source
+
+    obj = cls(raw_source=LazyRawSource('<div></div>', str))
+    assert isinstance(obj._raw_source, LazyRawSource)
+    assert obj.raw_source == '<div></div>'
+    assert obj.raw_source.__class__ is str
+
+
+@pytest.fixture
+def order(parse_fixture):
+    return parse_fixture('order_previews').orders[0]
+
+
+def test_parsed_objects_have_no_dict(order):
+    assert not hasattr(order, '__dict__')
+    assert not hasattr(order.counterparty, '__dict__')
+    with pytest.raises(AttributeError):
+        order.unknown_attribute = 1
+
+
+def test_timestamp_is_memoized(order):
+    timestamp = order.timestamp
+    assert order._timestamp == ((order.date_text, get_reference_day()), timestamp)
+    assert replace(order, date_text='01.01.2020, 00:00').timestamp != timestamp
+
+
+@pytest.mark.parametrize(
+    'copier', [copy.copy, copy.deepcopy, lambda i: pickle.loads(pickle.dumps(i))]
+)
+def test_slotted_objects_copy(order, copier):
+    order.timestamp  # noqa: B018
+    restored = copier(order)
+
+    assert restored == order
+    assert restored.raw_source == order.raw_source
+    assert restored.timestamp == order.timestamp
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import dataclasses
+from decimal import Decimal
+
+import pytest
+
+from funpayparsers.types import MoneyValue, FunPayObject
+from funpayparsers.types.base import NOT_PARSED
+from funpayparsers.types.wire import WIRE_VERSION, dumps, loads
+from funpayparsers.types.enums import Currency
+
+
+def objects(result):
+    return result if isinstance(result, list) else [result]
+
+
+def test_round_trip(fixture_name, parse_fixture):
+    result = parse_fixture(fixture_name)
+    restored = loads(dumps(result))
+
+    assert restored == result
+    assert all(i.raw_source == '' for i in objects(restored))
+
+
+@pytest.mark.parametrize('name', ['runner_10_nodes', 'chat_page', 'subcategory_page'])
+def test_round_trip_with_raw_source(name, parse_fixture):
+    result = parse_fixture(name)
+    restored = loads(dumps(result, raw_source=True))
+
+    assert restored == result
+    for obj, restored_obj in zip(objects(result), objects(restored), strict=True):
+        assert restored_obj.raw_source == obj.raw_source
+        assert restored_obj.as_dict() == obj.as_dict()
+
+
+def test_smaller_than_raw_source(parse_fixture):
+    result = parse_fixture('chat_page')
+    assert len(dumps(result)) * 5 < len(dumps(result, raw_source=True))
+
+
+def test_generic_values():
+    money = MoneyValue(raw_source='', value=Decimal('10.50'), character='₽')
+    value = {'money': [money], 'tuple': (1, 'a'), 'currency': Currency.RUB, 'none': None}
+    assert loads(dumps(value)) == value
+    assert loads(dumps(money)).value.__class__ is Decimal
+
+
+def test_not_parsed_fields(parse_fixture):
+    page = dataclasses.replace(
+        parse_fixture('subcategory_page'), offers=NOT_PARSED, category_id=NOT_PARSED
+    )
+    restored = loads(dumps(page))
+    assert restored.offers is NOT_PARSED
+    assert restored.category_id is NOT_PARSED
+
+
+def test_unknown_type():
+    @dataclasses.dataclass
+    class Unknown(FunPayObject):
+        pass
+
+    with pytest.raises(TypeError):
+        dumps(Unknown(raw_source=''))
+    with pytest.raises(TypeError):
+        dumps(object())
+
+
+@pytest.mark.parametrize(
+    'modify',
+    [
+        lambda data: b'XXX' + data[3:],
+        lambda data: data[:3] + bytes([WIRE_VERSION + 1]) + data[4:],
+        lambda data: data[:5] + bytes(4) + data[9:],
+        lambda data: data[:4],
+    ],
+)
+def test_invalid_header(modify, parse_fixture):
+    with pytest.raises(ValueError):
+        loads(modify(dumps(parse_fixture('runner_1_nodes'))))